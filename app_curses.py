@@ -2,29 +2,157 @@
 """Pre war Login Curses Interface."""
 import curses
 import argparse
-from sys import stderr
-from typing import Any, Tuple
-from english_words import english_words_lower_alpha_set as ewlaps  # type: ignore
-from grid.settings import (
-    DEFAULT_EASY,
-    DEFAULT_ADVANCED,
-    DEFAULT_EXPERT,
-    DEFAULT_MASTER,
-    SettingGrid,
-)
-from grid.backend import Backend
-from grid.interface import Interface
+import os
+import signal
+import sys
+from contextlib import contextmanager, suppress
+from sys import stderr, stdin, stdout
+from time import perf_counter
+from typing import Any, ContextManager, Iterator, List, NamedTuple, Optional
+from typing import Sequence, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:  # Deferred until arguments are parsed
+    from grid.backend import Backend
+    from grid.ansi import AnsiRenderer, ScreenLine
+    from grid.bucket_cache import BucketCache
+    from grid.dictionary import Dictionary
+    from grid.frequency import Frequencies
+    from grid.hints import HintService
+    from grid.interface import Interface, Mouse
+    from grid.latency import Latency
+    from grid.settings import SettingGrid
 
 # Black styling Preferred
-# pylint: disable=c0330, R0912
+# pylint: disable=c0330, R0912, C0415
 
+# Command line action to grid.settings.DifficultyType name
+DIFFICULTIES = {
+    "easy": "EASY",
+    "advanced": "ADVANCE",
+    "expert": "EXPERT",
+    "master": "MASTER",
+}
+# grid.settings.LIKENESS_MODES, default first
+LIKENESS: Tuple[str, ...] = ("positional", "overlap", "edit")
+# Fewest grid rows shown when a marathon grid scrolls
+MARATHON_MIN_ROWS: int = 3
+# Wait for input at most this long while a hint is worked out
+HINT_POLL_MS: int = 50
+# Screen line of the first grid row
+LINE_START: int = 4
 
-def commands() -> Backend:
-    """Parse command line arguments and returns grid."""
-    parser = argparse.ArgumentParser(
-        description="Python Game to Emulate Fallout 4 hacking Module",
-        epilog="Disclaimer: Not made or endorsed by Bethesda (fan-made Game)",
-    )
+
+class StartupProfile:
+    """StartupProfile - records time spent in each startup phase."""
+
+    def __init__(self) -> None:
+        """Start the startup clock."""
+        self._start: float = perf_counter()
+        self._last: float = self._start
+        self.phases: List[Tuple[str, float]] = []  # (phase, seconds)
+
+    def mark(self, phase: str) -> None:
+        """
+        End the running phase and start the next.
+
+        :param phase: name of the phase that just finished
+        """
+        now: float = perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        """
+        Time since profile was started until the last mark.
+
+        :return: seconds
+        """
+        return self._last - self._start
+
+    def report(self) -> str:
+        """
+        Format timing breakdown for '--startup-profile'.
+
+        :return: one line per phase in milliseconds
+        """
+        lines: List[str] = ["Startup profile (ms):"]
+        for phase, seconds in self.phases:
+            lines.append(f"  {phase:<18}{seconds * 1000:8.2f}")
+        lines.append(f"  {'total':<18}{self.total * 1000:8.2f}")
+        return "\n".join(lines)
+
+
+class FrameTimer:
+    """FrameTimer - records key press to frame latency and the first frame."""
+
+    def __init__(self, profile: Optional[StartupProfile] = None) -> None:
+        """
+        Start with no key pressed.
+
+        :param profile: startup profile, first frame is recorded
+        """
+        from grid.latency import active
+
+        self._profile: Optional[StartupProfile] = profile
+        self._recorder: Optional["Latency"] = active()  # None when disabled
+        self._pressed: int = 0  # perf_counter_ns of key press, 0 for none
+
+    def pressed(self, keys: bool) -> None:
+        """
+        Time the next frame from now.
+
+        :param keys: were keys pressed, frames without are not timed (T/F)
+        """
+        from grid.latency import perf_counter_ns
+
+        self._pressed = perf_counter_ns() if keys else 0
+
+    def drawn(self) -> None:
+        """Record latency of the frame drawn and mark the first frame."""
+        if self._pressed and self._recorder:
+            from grid.latency import FRAME, perf_counter_ns
+
+            self._recorder.record(FRAME, perf_counter_ns() - self._pressed)
+        if self._profile:
+            self._profile.mark("first frame")
+            self._profile = None
+
+
+class Drawn(NamedTuple):
+    """Data container for what is on screen, only the cursor moves while same."""
+
+    frame: Tuple[int, int, int, str]  # grid revision, top row, rows, hint
+    lit: Optional[Tuple[int, int, int]]  # highlighted span, see highlight
+    view: List["ScreenLine"]  # screen lines of frame
+
+
+class HelpFormatter(argparse.RawTextHelpFormatter):
+    """HelpFormatter - sized to the terminal without shutil (imports bz2 and lzma)."""
+
+    def __init__(self, prog: str) -> None:
+        """
+        Size help like argparse, COLUMNS first then the terminal.
+
+        :param prog: program name
+        """
+        columns: str = os.environ.get("COLUMNS", "")
+        if not columns.isdigit():
+            try:
+                columns = str(os.get_terminal_size(stdout.fileno()).columns)
+            except (OSError, ValueError):  # not a terminal
+                columns = "80"
+        super().__init__(prog, width=int(columns) - 2)
+
+
+def arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Only cheap imports are used so '-h' and bad arguments exit quickly.
+    :param argv: arguments to parse (default sys.argv)
+    :return: parsed arguments
+    """
     help_action = """
     Set Game Difficulty
       easy - word size between 3 and 5
@@ -32,10 +160,12 @@ def commands() -> Backend:
       expert - word size between 9 and 10
       master - word size between 11 and 12
     """
-    parser = argparse.ArgumentParser(formatter_class=argparse.RawTextHelpFormatter)
-    parser.add_argument(
-        "action", choices=("easy", "advanced", "expert", "master"), help=help_action
+    parser = argparse.ArgumentParser(
+        description="Python Game to Emulate Fallout 4 hacking Module",
+        epilog="Disclaimer: Not made or endorsed by Bethesda (fan-made Game)",
+        formatter_class=HelpFormatter,
     )
+    parser.add_argument("action", choices=tuple(DIFFICULTIES), help=help_action)
     parser.add_argument(
         "-t",
         "--tries",
@@ -50,32 +180,572 @@ def commands() -> Backend:
         help="increases difficulty by disabling secret chars.",
         action="store_false",
     )
-    args = parser.parse_args()
-    if args.action == "easy":
-        difficulty: SettingGrid = DEFAULT_EASY
-    elif args.action == "advanced":
-        difficulty = DEFAULT_ADVANCED
-    elif args.action == "expert":
-        difficulty = DEFAULT_EXPERT
-    elif args.action == "master":
-        difficulty = DEFAULT_MASTER
-    else:
-        parser.error(f"Unknown action ({args.action})")
-    return Backend(difficulty, ewlaps, args.tries, args.secret)
+    parser.add_argument(
+        "--filler-secrets",
+        help="secrets are matched brackets in filler, like the original game.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--likeness",
+        help="how likeness to the password is counted: same place (default), "
+        "letters in common or edit distance.",
+        choices=LIKENESS,
+        default=LIKENESS[0],
+    )
+    parser.add_argument(
+        "--target-guesses",
+        help="pick password and duds so solving takes about GUESSES guesses\n"
+        "on average (e.g. 2.5, not with --marathon).",
+        type=float,
+        metavar="GUESSES",
+    )
+    parser.add_argument(
+        "--hints",
+        help="press h to show the best next guess, worked out in the background.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--wordlist",
+        help="read words from PATH instead of the built in list: plain,\n"
+        "gzip, bzip2, xz or zstd text, or an index from grid.word_sources.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--frequencies",
+        help="favour common words: 'word count' lines in PATH weight the\n"
+        "password and duds (compressed like --wordlist).",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--neighbours",
+        help="look likeness up in PATH, from grid.neighbours.write_neighbours,\n"
+        "instead of comparing the password to every word.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--cache",
+        help="cache sorted duds on disk, later games with a password only\n"
+        "shuffle and pick (see README).",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        help="print import and initialization timing on exit.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--profile",
+        help="write cProfile pstats per phase into directory OUT.",
+        metavar="OUT",
+    )
+    parser.add_argument(
+        "--ansi",
+        help="draw with minimal ANSI escapes instead of curses (slow links).",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--columns",
+        help="hex and word column pairs side by side (wide terminals).",
+        type=int,
+        default=2,
+    )
+    parser.add_argument(
+        "--marathon",
+        help="stack SCREENS boards into one long scrolling grid.",
+        type=int,
+        metavar="SCREENS",
+    )
+    parser.add_argument(
+        "--latency",
+        help="write latency histograms to OUT on exit and on SIGUSR1\n"
+        "(Prometheus text when OUT ends in .prom, JSON otherwise).",
+        metavar="OUT",
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.columns < 1:
+        parser.error("argument --columns: must be 1 or more")
+    if args.marathon is not None and args.marathon < 1:
+        parser.error("argument --marathon: SCREENS must be 1 or more")
+    return args
+
+
+def commands(args: argparse.Namespace, profile: StartupProfile) -> "Backend":
+    """
+    Build grid from parsed command line arguments.
+
+    :param args: parsed command line arguments
+    :param profile: startup profile to record phases in
+    :return: grid
+    """
+    profile.mark("arguments")
+    from grid.profiling import IMPORT, phase
+
+    with phase(IMPORT):
+        from grid.backend import Backend
+        from grid.draws import Draws
+
+    profile.mark("import grid")
+    difficulty: "SettingGrid" = game_settings(args)
+    profile.mark("settings")
+    with phase(IMPORT):
+        word_list, frequencies = word_source(args, difficulty)
+    profile.mark("import word list")
+    try:
+        grid = Backend(
+            difficulty,
+            word_list,
+            args.tries,
+            args.secret,
+            Draws(cache=bucket_cache(args), frequencies=frequencies),
+        )
+    except RuntimeError as error:  # word list too small for the difficulty
+        raise SystemExit(f"Error: {error}") from error
+    grid.full_row_str(0)  # build rows before first frame
+    profile.mark("build board")
+    return grid
+
+
+def game_settings(args: argparse.Namespace) -> "SettingGrid":
+    """
+    Build settings of the difficulty with the command line options applied.
+
+    :param args: parsed command line arguments
+    :return: game settings
+    """
+    from grid.settings import DifficultyType, filler_secrets, get_setting
+    from grid.settings import likeness, marathon, target_guesses, wide
+
+    difficulty: "SettingGrid" = get_setting(DifficultyType[DIFFICULTIES[args.action]])
+    try:
+        if args.columns != difficulty.COLUMNS:
+            difficulty = wide(difficulty, args.columns)
+        if args.marathon:
+            difficulty = marathon(difficulty, args.marathon)
+        if args.filler_secrets:
+            difficulty = filler_secrets(difficulty)
+        if args.likeness != difficulty.LIKENESS:
+            difficulty = likeness(difficulty, args.likeness)
+        if args.target_guesses is not None:
+            difficulty = target_guesses(difficulty, args.target_guesses)
+    except ValueError as error:
+        raise SystemExit(f"Error: {error}") from error
+    return difficulty
 
 
-def main(stdscr: Any, grid: Backend) -> Tuple[str, int]:
+def word_source(
+    args: argparse.Namespace, difficulty: "SettingGrid"
+) -> Tuple["Dictionary", Optional["Frequencies"]]:
+    """
+    Word list and word frequencies asked for on the command line.
+
+    :param args: parsed command line arguments
+    :param difficulty: game settings, only their word lengths are loaded
+    :return: word list, frequencies (None when not asked for)
+    """
+    from grid.word_sources import BUILT_IN, load, read_frequencies
+
+    word_list: "Dictionary"
+    frequencies: Optional["Frequencies"] = None
+    try:  # only the lengths of the difficulty are read
+        word_list = load(args.wordlist or BUILT_IN, difficulty.MIN, difficulty.MAX)
+        if args.frequencies is not None:
+            from grid.frequency import Frequencies
+
+            frequencies = Frequencies(read_frequencies(args.frequencies))
+    except (OSError, UnicodeDecodeError, ValueError) as error:
+        raise SystemExit(f"Error: {error}") from error
+    return word_list, frequencies
+
+
+def bucket_cache(args: argparse.Namespace) -> Optional["BucketCache"]:
+    """
+    Similarity buckets cache asked for on the command line.
+
+    :param args: parsed command line arguments
+    :return: cache, None to always sort
+    """
+    cache: Optional["BucketCache"] = None
+    if args.cache:
+        from grid.bucket_cache import BucketCache
+
+        cache = BucketCache()
+    if args.neighbours is not None:
+        from grid.neighbours import NeighbourIndex
+
+        try:  # passwords without a row fall back to memory, or disk with --cache
+            cache = NeighbourIndex(args.neighbours, None if args.cache else "")
+        except (OSError, UnicodeDecodeError, ValueError) as error:
+            raise SystemExit(f"Error: {error}") from error
+    return cache
+
+
+def start_hints(grid: "Backend") -> "HintService":
+    """
+    Start hint service fed by the grid's events, then start the grid.
+
+    :param grid: game grid, not started on an event bus yet
+    :return: hint service
+    """
+    from grid.events import EventBus
+    from grid.hints import HintService
+    from grid.neighbours import NeighbourIndex
+
+    if grid.events is not None:
+        raise ValueError("grid already publishes its events")
+    neighbours: Optional[NeighbourIndex] = None
+    if isinstance(grid.cache, NeighbourIndex):
+        neighbours = grid.cache
+    hints = HintService(grid.entry_words(), grid.settings.LIKENESS, neighbours)
+    events: EventBus = EventBus()
+    events.subscribe(hints.update)
+    grid.start(events)  # hints see GameStarted
+    return hints
+
+
+def hint_text(hints: Optional["HintService"]) -> str:
+    """
+    Hint line shown above the grid.
+
+    :param hints: hint service, None when hints are off
+    :return: text, empty when hints are not shown
+    """
+    if hints is None or not hints.shown:
+        return ""
+    hint = hints.poll()
+    if hint is None or hints.busy:
+        return "Hint: working..."
+    if not hint.guess:
+        return "Hint: no words left"
+    return f"Hint: {hint.guess} ({hint.candidates} possible)"
+
+
+def handle_keys(
+    keys: Sequence[Union[str, "Mouse"]],
+    grid: "Backend",
+    player: "Interface",
+    hints: Optional["HintService"] = None,
+) -> Optional[Tuple[str, int]]:
+    """
+    Apply a batch of key presses and mouse events to the game.
+
+    Moves are applied in order but only the final position is hovered,
+    selects are run in order at the position they were pressed on.
+    :param keys: keys pressed (curses key names) or mouse events oldest first
+    :param grid: game grid
+    :param player: player location on grid
+    :param hints: hint service toggled by the hint key, None when hints are off
+    :return: Game message and exit code when game is over
+    """
+    from grid.profiling import INPUT, phase
+
+    with phase(INPUT):
+        hover: bool = False
+        for key in keys:
+            action: str
+            if isinstance(key, str):
+                action = player.keyboard_input(key)
+            else:
+                action = player.mouse_input(key)
+            if action == "Q":
+                return "Game Quit", 0
+            if action == "N":
+                continue
+            if action == "H":
+                if hints is not None:
+                    hints.shown = not hints.shown
+                continue
+            if action == "J":
+                target = grid.next_entry(*player.exact_grid_location(), *player.jump)
+                if target is not None and player.move_to(*target):
+                    hover = True
+                continue
+            if action == "M":
+                hover = True
+                continue
+            offset_local = player.exact_grid_location()
+            result: str = grid.select(*offset_local)
+            if result == "p":
+                return "Game Won: Password Found", 0
+            if result == "l":
+                return "Game Over: Attempts Exhausted", 0
+            hover = False  # select clears hover feedback
+        if hover:
+            offset_local = player.exact_grid_location()
+            grid.hover(*offset_local)
+        return None
+
+
+def pending_keys(stdscr: Any) -> List[Union[str, "Mouse"]]:
+    """
+    Wait for a key press then drain every key already queued.
+
+    KEY_MOUSE is replaced by its mouse event.
+    Nothing is returned when the wait times out.
+    :param stdscr: Curses screen
+    :return: keys pressed and mouse events oldest first
+    """
+    try:
+        keys: List[Union[str, "Mouse"]] = [stdscr.getkey()]
+    except curses.error:  # timed out, see stdscr.timeout
+        return []
+    stdscr.nodelay(True)
+    try:
+        while True:
+            keys.append(stdscr.getkey())
+    except curses.error:  # queue empty
+        pass
+    finally:
+        stdscr.nodelay(False)
+    if "KEY_MOUSE" in keys:
+        keys = [_mouse() if key == "KEY_MOUSE" else key for key in keys]
+    return keys
+
+
+def _mouse() -> Union[str, "Mouse"]:
+    """
+    Mouse event of a KEY_MOUSE key press.
+
+    :return: mouse event, KEY_MOUSE when event could not be read
+    """
+    from grid.interface import Mouse
+
+    try:
+        _, place, line, _, state = curses.getmouse()
+    except curses.error:
+        return "KEY_MOUSE"
+    click: bool = bool(state & (curses.BUTTON1_PRESSED | curses.BUTTON1_CLICKED))
+    return Mouse(line, place, click)
+
+
+def highlight(grid: "Backend", player: "Interface") -> Tuple[int, int, int]:
+    """
+    Screen span of the word, secret or char under the player.
+
+    :param grid: game grid
+    :param player: player location on grid
+    :return: screen line, start, end (exclusive)
+    """
+    column, row, place = player.exact_grid_location()
+    start, end = grid.span(column, row, place)
+    offset: int = player.place - place  # screen place of column start
+    return player.line, offset + start, offset + end + 1
+
+
+def view_rows(grid: "Backend", line_start: int, height: int) -> Tuple[int, int]:
+    """
+    Grid rows that fit on terminal.
+
+    Marathon grids scroll, so only MARATHON_MIN_ROWS need to fit.
+    :param grid: game grid
+    :param line_start: screen row of first grid row
+    :param height: terminal rows
+    :return: rows shown (0 when terminal is too short), minimum height
+    """
+    rows: int = grid.settings.NUM_OF_ROWS
+    min_rows: int = MARATHON_MIN_ROWS if grid.settings.SCREENS > 1 else rows
+    min_height: int = line_start + min_rows + 1
+    if height <= min_height:
+        return 0, min_height
+    return min(rows, height - line_start - 1), min_height
+
+
+def fit_view(grid: "Backend", player: "Interface", height: int, width: int) -> str:
+    """
+    Show as many grid rows as fit on terminal.
+
+    :param grid: game grid
+    :param player: player location on grid
+    :param height: terminal rows
+    :param width: terminal columns
+    :return: error message, empty when grid fits
+    """
+    rows, min_height = view_rows(grid, LINE_START, height)
+    if width <= player.width or not rows:
+        return (
+            f"The terminal is too narrow (min {player.width}) "
+            f"or short (min {min_height})"
+        )
+    player.resize(rows)
+    return ""
+
+
+def frame_lines(grid: "Backend", player: "Interface", hint: str) -> List["ScreenLine"]:
+    """
+    Screen lines of a frame, see grid.ansi.screen_lines.
+
+    :param grid: game grid
+    :param player: player location on grid
+    :param hint: hint line shown above the grid
+    :return: lines top to bottom
+    """
+    from grid.ansi import screen_lines
+
+    view = screen_lines(grid, LINE_START, player.top, player.view_rows)
+    view[LINE_START - 1] = view[LINE_START - 1]._replace(text=hint)
+    return view
+
+
+def waiting_hint(hints: Optional["HintService"]) -> bool:
+    """
+    Is a shown hint still being worked out.
+
+    :param hints: hint service, None when hints are off
+    :return: poll for the hint while waiting for input (T/F)
+    """
+    return hints is not None and hints.shown and hints.busy
+
+
+def draw_curses(
+    stdscr: Any,
+    grid: "Backend",
+    player: "Interface",
+    hints: Optional["HintService"],
+    drawn: Optional[Drawn],
+) -> Drawn:
+    """
+    Draw a frame with curses, only the highlight moves while the frame is the same.
+
+    :param stdscr: Curses screen
+    :param grid: game grid
+    :param player: player location on grid
+    :param hints: hint service, None when hints are off
+    :param drawn: what is on screen, None to redraw all
+    :return: what is on screen now
+    """
+    from grid.ansi import RED
+    from grid.profiling import RENDER, phase
+
+    with phase(RENDER):
+        frame = grid.revision, player.top, player.view_rows, hint_text(hints)
+        if drawn is None or frame != drawn.frame:
+            if drawn is None:
+                stdscr.clear()
+            else:  # curses only sends the cells that changed
+                stdscr.erase()
+            drawn = Drawn(frame, None, frame_lines(grid, player, frame[3]))
+            for i, line in enumerate(drawn.view):
+                color: int = 1 if line.style == RED else 2
+                stdscr.addstr(i, 0, line.text, curses.color_pair(color))
+        span = highlight(grid, player)
+        lit: Optional[Tuple[int, int, int]] = drawn.lit
+        if span != lit:  # only old and new span are redrawn
+            if lit is not None:
+                stdscr.chgat(lit[0], lit[1], lit[2] - lit[1], curses.color_pair(2))
+            stdscr.chgat(
+                span[0],
+                span[1],
+                span[2] - span[1],
+                curses.color_pair(2) | curses.A_REVERSE,
+            )
+        # Move cursor back to position
+        stdscr.move(player.line, player.place)
+        stdscr.refresh()
+        return drawn._replace(lit=span)
+
+
+def draw_ansi(
+    renderer: "AnsiRenderer",
+    grid: "Backend",
+    player: "Interface",
+    hints: Optional["HintService"],
+    drawn: Optional[Drawn],
+) -> Drawn:
+    """
+    Draw a frame with ANSI escapes, the renderer only writes what changed.
+
+    :param renderer: ANSI renderer of the terminal
+    :param grid: game grid
+    :param player: player location on grid
+    :param hints: hint service, None when hints are off
+    :param drawn: what is on screen, None to build all lines
+    :return: what is on screen now
+    """
+    from grid.profiling import RENDER, phase
+
+    with phase(RENDER):
+        frame = grid.revision, player.top, player.view_rows, hint_text(hints)
+        if drawn is None or frame != drawn.frame:
+            drawn = Drawn(frame, None, frame_lines(grid, player, frame[3]))
+        view: List["ScreenLine"] = drawn.view
+        span = highlight(grid, player)
+        lit: Optional[Tuple[int, int, int]] = drawn.lit
+        if span != lit:  # renderer only writes old and new span
+            if lit is not None:
+                view[lit[0]] = view[lit[0]]._replace(highlight=(0, 0))
+            view[span[0]] = view[span[0]]._replace(highlight=span[1:])
+        renderer.render(view, (player.line, player.place))
+        return drawn._replace(lit=span)
+
+
+def read_keys(stdin_fd: int, wait: bool) -> Optional[List[Union[str, "Mouse"]]]:
+    """
+    Wait for input then drain every byte already queued.
+
+    :param stdin_fd: terminal input
+    :param wait: give up after HINT_POLL_MS (T/F)
+    :return: keys pressed and mouse events oldest first (none when wait timed
+    out), None at end of input
+    """
+    import select
+    from grid.ansi import decode_keys
+
+    if wait and not select.select([stdin_fd], [], [], HINT_POLL_MS / 1000)[0]:
+        return []
+    data: bytes = os.read(stdin_fd, 1024)
+    if not data:
+        return None
+    while select.select([stdin_fd], [], [], 0)[0]:  # drain burst
+        more: bytes = os.read(stdin_fd, 1024)
+        if not more:
+            break
+        data += more
+    return decode_keys(data)
+
+
+@contextmanager
+def raw_terminal() -> Iterator[int]:
+    """
+    Put terminal in cbreak mode on the alternate screen with mouse reports.
+
+    Terminal is restored on exit.
+    :return: terminal input
+    """
+    import termios
+    import tty
+    from grid.ansi import MOUSE_OFF, MOUSE_ON
+
+    stdin_fd: int = stdin.fileno()
+    saved = termios.tcgetattr(stdin_fd)
+    stdout.buffer.write(b"\x1b[?1049h" + MOUSE_ON.encode())  # alternate screen
+    try:
+        tty.setcbreak(stdin_fd)
+        yield stdin_fd
+    finally:
+        termios.tcsetattr(stdin_fd, termios.TCSADRAIN, saved)
+        stdout.buffer.write(MOUSE_OFF.encode() + b"\x1b[0m\x1b[?1049l")
+        stdout.buffer.flush()
+
+
+def main(
+    stdscr: Any,
+    grid: "Backend",
+    profile: Optional[StartupProfile] = None,
+    hints: Optional["HintService"] = None,
+) -> Tuple[str, int]:
     """
     Set up Main loop and run main game loop.
 
     Call this function 'curses.wrapper'.
     :param stdscr: Curses screen
     :param grid: game grid
+    :param profile: startup profile, first frame is recorded
+    :param hints: hint service, polled between frames
     :return: Game message and exit code
     """
-    line_start: int = 4
-    action: str = ""
-    player = Interface(line_start, grid.settings)
+    from grid.ansi import MOTION_OFF, MOTION_ON
+    from grid.interface import Interface
+
+    player = Interface(LINE_START, grid.settings)
 
     if curses.has_colors():
         curses.start_color()
@@ -83,69 +753,127 @@ def main(stdscr: Any, grid: Backend) -> Tuple[str, int]:
         curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
     else:
         return "Terminal does not support Color", 4
+    # Clicks are reported without waiting for a release, motion needs MOTION_ON
+    curses.mousemask(curses.ALL_MOUSE_EVENTS | curses.REPORT_MOUSE_POSITION)
+    curses.mouseinterval(0)
+    stdout.write(MOTION_ON)
+    stdout.flush()
+    if profile:
+        profile.mark("curses setup")
 
-    terminal_x: int = 1  # Must be a min of 54
-    terminal_y: int = 1  # Must be a min of 21
-    selected: bool = False
-    while True:
-        if curses.is_term_resized(terminal_y, terminal_x):
-            terminal_y, terminal_x = stdscr.getmaxyx()
-            if terminal_x <= 54 or terminal_y <= 21:
-                return "The terminal is too narrow (min 54) or short (min 21)", 3
-        stdscr.clear()
-
-        stdscr.addstr(
-            0, 0, "Welcome to ROBCO Industries (TM) TermLink", curses.color_pair(2)
-        )
-        stdscr.addstr(1, 0, "Password Required", curses.color_pair(2))
-        if grid.tries == 1:
-            color: int = 1
-        else:
-            color = 2
-        # chr(9608) is black bar
-        stdscr.addstr(
-            2,
-            0,
-            "Attempts Remaining: " + f"{chr(9608)} " * grid.tries,
-            curses.color_pair(color),
-        )
-        for i in range(line_start, grid.settings.NUM_OF_ROWS + line_start, 1):
-            stdscr.addstr(i, 0, grid.full_row_str(i - line_start), curses.color_pair(2))
+    timer = FrameTimer(profile)
+    # Terminal rows and columns, must be a min of 21 and 54 (see fit_view)
+    size: Tuple[int, int] = (1, 1)
+    drawn: Optional[Drawn] = None
+    try:
+        while True:
+            if curses.is_term_resized(*size):
+                size = stdscr.getmaxyx()
+                too_small: str = fit_view(grid, player, *size)
+                if too_small:
+                    return too_small, 3
+                drawn = None
+            drawn = draw_curses(stdscr, grid, player, hints, drawn)
+            timer.drawn()
+            stdscr.timeout(HINT_POLL_MS if waiting_hint(hints) else -1)
+            keys: List[Union[str, "Mouse"]] = pending_keys(stdscr)
+            timer.pressed(bool(keys))
+            if not keys:  # poll hint
+                continue
+            game_over = handle_keys(keys, grid, player, hints)
+            if game_over:
+                return game_over
+    finally:
+        stdout.write(MOTION_OFF)
+        stdout.flush()
 
-        # Move cursor back to position
-        stdscr.move(player.line, player.place)
-        key: str = stdscr.getkey()
-        action = player.keyboard_input(key)
-        if action == "Q":
-            return "Game Quit", 0
-        if action == "S":
-            selected = True
-
-        # Update cursor location
-        stdscr.move(player.line, player.place)
-        offset_local = player.exact_grid_location()
-        if selected:
-            result: str = grid.select(
-                not offset_local[0], offset_local[1], offset_local[2]
+
+def ansi_main(
+    grid: "Backend",
+    profile: Optional[StartupProfile] = None,
+    hints: Optional["HintService"] = None,
+) -> Tuple[str, int]:
+    """
+    Run main game loop on a raw terminal without curses.
+
+    Each frame only writes what changed, for slow serial and SSH links.
+    :param grid: game grid
+    :param profile: startup profile, first frame is recorded
+    :param hints: hint service, polled between frames
+    :return: Game message and exit code
+    """
+    from grid.ansi import AnsiRenderer
+    from grid.interface import Interface
+
+    player = Interface(LINE_START, grid.settings)
+    terminal = os.get_terminal_size()
+    too_small: str = fit_view(grid, player, terminal.lines, terminal.columns)
+    if too_small:
+        return too_small, 3
+    renderer = AnsiRenderer(stdout.buffer)
+    timer = FrameTimer(profile)
+    drawn: Optional[Drawn] = None
+    with raw_terminal() as stdin_fd:
+        while True:
+            drawn = draw_ansi(renderer, grid, player, hints, drawn)
+            timer.drawn()
+            keys: Optional[List[Union[str, "Mouse"]]] = read_keys(
+                stdin_fd, waiting_hint(hints)
             )
-            selected = False
-            if result == "p":
-                return "Game Won: Password Found", 0
-            if result == "l":
-                return "Game Over: Attempts Exhausted", 0
-            continue  # Ensure update after pressing enter
+            if keys is None:  # end of input
+                return "Game Quit", 0
+            timer.pressed(bool(keys))
+            if not keys:  # poll hint
+                continue
+            game_over = handle_keys(keys, grid, player, hints)
+            if game_over:
+                return game_over
+
+
+def play(args: argparse.Namespace, profile: StartupProfile) -> Tuple[str, int]:
+    """
+    Build the grid and play it, profiled, timed and hinted as asked for.
+
+    :param args: parsed command line arguments
+    :param profile: startup profile to record phases in
+    :return: Game message and exit code
+    """
+    profiling: ContextManager[Any] = suppress()  # nothing to profile
+    if args.profile:
+        from grid.profiling import profile as profile_phases
+
+        profiling = profile_phases(args.profile)
+    latency: Optional["Latency"] = None
+    if args.latency:
+        from grid.latency import enable
+
+        latency = enable()
+        if hasattr(signal, "SIGUSR1"):  # dump on demand
+            signal.signal(signal.SIGUSR1, lambda *_: enable().dump(args.latency))
+    with profiling:
+        grid: "Backend" = commands(args, profile)
+        hints: Optional["HintService"] = start_hints(grid) if args.hints else None
+        result: Tuple[str, int]
+        if args.ansi:
+            result = ansi_main(grid, profile, hints)
         else:
-            grid.hover(not offset_local[0], offset_local[1], offset_local[2])
-        stdscr.refresh()
-        curses.doupdate()
+            result = curses.wrapper(main, grid, profile, hints)
+        if hints is not None:
+            hints.close()
+    if latency is not None:
+        latency.dump(args.latency)
+    return result
 
 
 if __name__ == "__main__":
-    grid_backend: Backend = commands()
-    MESSAGE, EXIT_CODE = curses.wrapper(main, grid_backend)
+    STARTUP = StartupProfile()
+    ARGS = arguments()
+    MESSAGE, EXIT_CODE = play(ARGS, STARTUP)
+    if ARGS.startup_profile:
+        print(STARTUP.report(), file=stderr)
     if EXIT_CODE != 0:  # Error
         print(f"Error: {MESSAGE}", file=stderr)
     else:
         print(MESSAGE)
         print("Thank you for playing!")
-    exit(EXIT_CODE)
+    sys.exit(EXIT_CODE)
@@ -1,5 +1,24 @@
 """
 Manages the internals/interface of the grid for prewar login.
 
-Use grid 'interface' for moving and 'backend' to status
+Use grid 'interface' for moving and 'backend' to status, grid.boards
+streams ready to play boards (see board_stream)
 """
+from typing import Any, Iterator, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grid.backend import Backend
+
+
+def boards(*args: Any, **kwargs: Any) -> Iterator["Backend"]:
+    """
+    Stream ready to play boards, see board_stream.boards.
+
+    board_stream is imported on first call, importing grid stays cheap.
+    :param args: see board_stream.boards
+    :param kwargs: see board_stream.boards
+    :return: iterator of boards
+    """
+    from grid.board_stream import boards as stream  # pylint: disable=C0415
+
+    return stream(*args, **kwargs)
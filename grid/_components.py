@@ -1,39 +1,74 @@
 """Components for the grid interactive Section."""
 import random
-from math import floor
-from typing import List, Tuple, Dict
+from itertools import repeat
+from math import ceil, floor
+from typing import Collection, List, NamedTuple, Optional, Sequence, Tuple, Dict
+from typing import Union
+from typing import TYPE_CHECKING
 from grid.settings import SettingGrid
-from grid._word_tools import similarity_sort, trim
+from grid._word_tools import similarity_sort
+from grid.profiling import COMPONENTS, profiled
+
+from grid.draws import Draws
+
+if TYPE_CHECKING:
+    from grid.frequency import Frequencies
+    from grid.letter_counts import LetterCounts
+    from grid.dictionary import Dictionary
 
 # Black styling Preferred
 # pylint: disable=c0330
 
+# Low and high similarity duds drawn per screen when weighted by frequency,
+# enough for any dud_mix and the adaptive search (adaptive.ALTERNATIVES)
+WEIGHTED_DUDS: int = 96
+# Passwords drawn again when letter counts show a drawn one has too few
+# high similarity duds
+PASSWORD_DRAWS: int = 8
+
+
+class _Duds(NamedTuple):
+    """Data container for the duds of a password, (word, similarity) each."""
+
+    zero: List[Tuple[str, int]]  # zero similarity
+    low: List[Tuple[str, int]]  # 50% similarity or under
+    high: List[Tuple[str, int]]  # over 50% similarity
+
 
 class Components:
     """Components - organizes in range words into password, zero duds, similar duds and secrets."""
 
-    def __init__(self, word_list: List[str], settings: SettingGrid) -> None:
+    @profiled(COMPONENTS)
+    def __init__(
+        self,
+        word_list: Union[Collection[str], "Dictionary"],
+        settings: SettingGrid,
+        password: Optional[str] = None,
+        draws: Draws = Draws(),
+    ) -> None:
         """
         Initialize the components based on set difficulty.
 
         :param settings: setting for to components and allowed passwords
-        :param word_list: source list of words
+        :param word_list: source list of words or Dictionary (no scan)
+        :param password: password to use (default random from pass_pool)
+        :param draws: random source, cache, frequencies (password and duds
+        are drawn weighted by them) and letter counts, see Draws
         """
-        random.seed()
         self._password: Tuple[str, str]
-        self._zero_duds: List[Tuple[str, int]] = []
-        # Under 50% similarity  (word, similarity)
-        self._low_similar_duds: List[Tuple[str, int]] = []
-        # Over 50% similarity  (word, similarity)
-        self._high_similar_duds: List[Tuple[str, int]] = []
+        self._duds: _Duds = _Duds([], [], [])
         self._secrets_list: List[Tuple[str, str]] = []
-        self._words_trimmed: List[str]
+        self._words_trimmed: Collection[str]
         self._settings: SettingGrid = settings
+        # every draw of the board comes from rng, never the random module
+        self._rng: random.Random = draws.rng or random.Random()
+        self._draws: Draws = draws._replace(rng=self._rng)
 
         minimum = settings.MIN
         maximum = settings.MAX
         # password set with pre-created list of viable passwords
-        self._password = random.choice(settings.pass_pool), "p"
+        drawn: bool = password is None
+        self._password = self._draw_password() if drawn else str(password), "p"
 
         # Validate
         if maximum <= minimum:
@@ -46,7 +81,11 @@ class Components:
             raise ValueError(
                 f"Password: ({self._password}) not in range (min: {minimum},  max:{maximum})"
             )
-        self._words_trimmed = list(trim(minimum, maximum, word_list))
+        from grid.dictionary import trimmed  # pylint: disable=C0415  # first board
+
+        self._words_trimmed = trimmed(minimum, maximum, word_list)
+        if draws.counts is not None and settings.LIKENESS == "positional":
+            self._check_password(draws.counts, drawn)
 
     @property
     def setting(self) -> SettingGrid:
@@ -57,6 +96,24 @@ class Components:
         """
         return self._settings
 
+    @property
+    def rng(self) -> random.Random:
+        """
+        Random source of the board.
+
+        :return: random source, the same for every draw
+        """
+        return self._rng
+
+    @property
+    def draws(self) -> Draws:
+        """
+        What the password and duds are drawn with.
+
+        :return: draws, rng set
+        """
+        return self._draws
+
     @property
     def password(self) -> Tuple[str, str]:
         """
@@ -74,7 +131,7 @@ class Components:
         :return: list (word, similarity)
         """
         self._set_duds()
-        return self._zero_duds.copy()
+        return self._duds.zero.copy()
 
     @property
     def low_similar_duds(self) -> List[Tuple[str, int]]:
@@ -85,7 +142,7 @@ class Components:
         :return: list (word, similarity)
         """
         self._set_duds()
-        return self._low_similar_duds.copy()
+        return self._duds.low.copy()
 
     @property
     def high_similar_duds(self) -> List[Tuple[str, int]]:
@@ -96,7 +153,27 @@ class Components:
         :return: list (word, similarity)
         """
         self._set_duds()
-        return self._high_similar_duds.copy()
+        return self._duds.high.copy()
+
+    def dud_mix(self, dud_range: int) -> List[Tuple[str, int]]:
+        """
+        Mix of zero, low and high similarity duds for a board.
+
+        A third of dud_range (at least 2) come from both zero and low
+        similarity duds, the rest are high similarity duds.
+        :param dud_range: number of duds before zero duds are added
+        :return: list (word, similarity)
+        """
+        low_sim_portion: int = ceil(dud_range / 3)
+        high_sim_portion: int = dud_range - low_sim_portion
+        zero_duds: List[Tuple[str, int]] = self.zero_duds[:low_sim_portion]
+        # low duds stand in for missing zero duds (see settings.LIKENESS)
+        low_sim_portion = 2 * low_sim_portion - len(zero_duds)
+        return (
+            zero_duds
+            + self.low_similar_duds[:low_sim_portion]
+            + self.high_similar_duds[:high_sim_portion]
+        )
 
     @property
     def secrets_list(self) -> List[Tuple[str, str]]:
@@ -107,26 +184,54 @@ class Components:
         with list size equal to NUM_OF_ROWS
         :return: list (secret, "s")
         """
-        if self._secrets_list:  # Already Defined
-            return self._secrets_list
-
-        symbol: List[str] = self._settings.FILLER_SYMBOLS.copy()
-        for _ in range(0, self._settings.NUM_OF_ROWS):
-            random.shuffle(symbol)
-            filler: str = "".join(symbol)
-            option: int = random.randint(0, 3)
-            if option == 0:
-                secret: str = "(" + filler[: random.randint(1, 8)] + ")"
-            elif option == 1:
-                secret = "[" + filler[: random.randint(1, 8)] + "]"
-            elif option == 2:
-                secret = "<" + filler[: random.randint(1, 8)] + ">"
-            else:
-                secret = "{" + filler[: random.randint(1, 8)] + "}"
-            self._secrets_list.append((secret, "s"))
-        return self._secrets_list
+        return self.secrets(self._settings.NUM_OF_ROWS)
+
+    def secrets(self, count: int) -> List[Tuple[str, str]]:
+        """
+        First count strings for use as secrets.
+
+        Secrets are only made when first asked for, so large grids
+        only pay for the secrets they use.
+        :param count: number of secrets
+        :return: list (secret, "s")
+        """
+        missing: int = count - len(self._secrets_list)
+        if missing > 0:
+            self._secrets_list += make_secrets(
+                self._rng, self._settings.FILLER_SYMBOLS, missing
+            )
+        return self._secrets_list[:count]
 
     # Private Methods
+    def _draw_password(self) -> str:
+        """
+        Draw a password from pass_pool, weighted by frequency when set.
+
+        :return: password
+        """
+        if self._draws.frequencies is not None:
+            return self._draws.frequencies.choice(self._settings.pass_pool, self._rng)
+        return self._rng.choice(self._settings.pass_pool)
+
+    def _check_password(self, counts: "LetterCounts", redraw: bool) -> None:
+        """
+        Reject a password the letter counts show has too few high duds.
+
+        Raises the RuntimeError of _set_duds before any scan, a drawn
+        password is drawn again up to PASSWORD_DRAWS times first.
+        :param counts: letter counts of the trimmed words
+        :param redraw: password was drawn from pass_pool
+        """
+        draws: int = PASSWORD_DRAWS if redraw else 0
+        while counts.viable(self._password[0]) is False:
+            if not draws:
+                raise RuntimeError(
+                    f"Not enough duds found for password: {self.password}"
+                )
+            draws -= 1
+            self._password = self._draw_password(), "p"
+
+    @profiled(COMPONENTS)
     def _set_duds(self) -> bool:
         """
         Set up the duds components.
@@ -138,31 +243,91 @@ class Components:
             return False
 
         low_sim = floor(len(self.password) / 2)
-        random.shuffle(self._words_trimmed)
         sim_results: Dict[int, List[str]]
         threshold: bool
-        sim_results, threshold = similarity_sort(self._words_trimmed, self.password[0])
+        if self._draws.cache is None:
+            sim_results, threshold = similarity_sort(
+                self._words_trimmed, self.password[0], self._settings.LIKENESS
+            )
+        else:
+            sim_results, threshold = self._draws.cache.buckets(
+                self._words_trimmed, self.password[0], self._settings.LIKENESS
+            )
         if not threshold:
             raise RuntimeError(f"Not enough duds found for password: {self.password}")
 
-        # Setting up zero duds
-        zero_duds = sim_results[0]
-        for zdud in zero_duds[:25]:  # only need 25
-            self._zero_duds.append((zdud, 0))
-        del sim_results[0]  # remove zero
+        # Setting up zero duds, overlap and edit likeness may have none
+        zero_duds = sim_results.pop(0, [])
+        # only need 25 per screen, sample instead of shuffling every trimmed word
+        needed: int = 25 * self._settings.SCREENS
+        if self._draws.frequencies is not None:
+            self._weighted_duds(
+                self._draws.frequencies, zero_duds, sim_results, low_sim
+            )
+            self._words_trimmed = ()  # Mark as done
+            return True
+        zero_drawn: List[str] = self._rng.sample(zero_duds, min(needed, len(zero_duds)))
+        self._duds.zero.extend(zip(zero_drawn, repeat(0)))
         sim_num: int
         for sim_num in sim_results:
             if sim_num > low_sim:
-                high_similar_duds = sim_results[sim_num]
-                for hdud in high_similar_duds:
-                    self._high_similar_duds.append((hdud, sim_num))
+                self._duds.high.extend(zip(sim_results[sim_num], repeat(sim_num)))
             else:
-                low_similar_duds = sim_results[sim_num]
-                for ldud in low_similar_duds:
-                    self._low_similar_duds.append((ldud, sim_num))
+                self._duds.low.extend(zip(sim_results[sim_num], repeat(sim_num)))
 
         # mixing similarity duds
-        random.shuffle(self._low_similar_duds)
-        random.shuffle(self._high_similar_duds)
-        self._words_trimmed.clear()  # Mark as done
+        self._rng.shuffle(self._duds.low)
+        self._rng.shuffle(self._duds.high)
+        self._words_trimmed = ()  # Mark as done
         return True
+
+    def _weighted_duds(
+        self,
+        frequencies: "Frequencies",
+        zero_duds: List[str],
+        sim_results: Dict[int, List[str]],
+        low_sim: int,
+    ) -> None:
+        """
+        Draw duds weighted by frequency, only as many as a board can use.
+
+        Each similarity bucket gets an alias table (cached with the bucket),
+        so a dud costs O(1) instead of a shuffle of the whole bucket.
+        :param frequencies: word frequencies
+        :param zero_duds: words with zero similarity
+        :param sim_results: other words by similarity
+        :param low_sim: highest low similarity
+        """
+        screens: int = self._settings.SCREENS
+        low: Dict[int, List[str]] = {}
+        high: Dict[int, List[str]] = {}
+        for sim_num, words in sim_results.items():
+            (high if sim_num > low_sim else low)[sim_num] = words
+        self._duds = _Duds(
+            frequencies.sample({0: zero_duds}, 25 * screens, self._rng),
+            frequencies.sample(low, WEIGHTED_DUDS * screens, self._rng),
+            frequencies.sample(high, WEIGHTED_DUDS * screens, self._rng),
+        )
+
+
+def make_secrets(
+    rng: random.Random, filler: Sequence[str], count: int
+) -> List[Tuple[str, str]]:
+    """
+    Make strings for use as secrets, in bulk.
+
+    :param rng: random source
+    :param filler: filler symbols between the brackets
+    :param count: number of secrets
+    :return: list (secret, "s")
+    """
+    sizes: List[int] = rng.choices(range(1, 9), k=count)
+    brackets: List[str] = rng.choices(("()", "[]", "<>", "{}"), k=count)
+    symbols: str = "".join(rng.choices(filler, k=sum(sizes)))
+    made: List[Tuple[str, str]] = []
+    start: int = 0
+    for size, bracket in zip(sizes, brackets):
+        end: int = start + size
+        made.append((bracket[0] + symbols[start:end] + bracket[1], "s"))
+        start = end
+    return made
@@ -1,13 +1,26 @@
 """Interactive Columns for grid."""
+
 import random
-import math
-from typing import List, Tuple, Union, NamedTuple, Any
-from grid.settings import SettingGrid
-from grid._components import Components
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from typing import Union
+from typing import NamedTuple
+from grid.settings import SECRET_BRACKETS, SettingGrid
+from grid._components import Components, make_secrets
+from grid.draws import Draws
+from grid.profiling import POPULATE, phase
 
 # Black styling Preferred
 # pylint: disable=c0330
 
+# Chance of a bracket in filler relative to a filler symbol (FILLER_SECRETS),
+# about as many bracket pairs per screen as standalone secrets
+BRACKET_WEIGHT: float = 0.6
+# Opening bracket -> closing bracket
+_CLOSERS: Dict[str, str] = dict(zip(SECRET_BRACKETS[::2], SECRET_BRACKETS[1::2]))
+
 
 class InteractiveCols:
     """InteractiveCols - contains grid data the user interacts with."""
@@ -27,7 +40,11 @@ class InteractiveCols:
         # Positive number and 0 for duds
 
     def __init__(
-        self, word_options: Components, tries: int, secrets: bool = True
+        self,
+        word_options: Components,
+        tries: int,
+        secrets: bool = True,
+        duds: Optional[List[Tuple[str, int]]] = None,
     ) -> None:
         """
         Initialize grid interactive element.
@@ -35,58 +52,130 @@ class InteractiveCols:
         :param word_options: componets for grid
         :param tries: number guesses allowed
         :param secrets: generate secrets (y/n)
+        :param duds: duds to place instead of a random mix (see adaptive)
         Tries used for setup, tries counter not managed.
         """
         if tries <= 2:
             raise ValueError("Tries must be 3 or more")
-        random.seed()
-        # L, R
-        self._active_col: Tuple[List[InteractiveCols.Line], List[InteractiveCols.Line]]
+        # Left to right
+        self._active_col: Tuple[_Column, ...]
         self._dud_pool: List[Tuple[str, Union[str, int]]] = [word_options.password]
         self._active_col_set: bool = False  # are active cols set
         self._found_duds: List[Tuple[int, int]] = [(-1, -1)]  # (col,row)
         self._settings: SettingGrid = word_options.setting
+        self._board: _Board = _Board(
+            word_options.draws,
+            word_options.rng,
+            word_options.rng.getrandbits(32),
+            {},
+            [],
+            [],
+            [],
+            {},
+        )
+        filler_secrets: bool = secrets and self._settings.FILLER_SECRETS
+        symbols: List[str] = list(self._settings.FILLER_SYMBOLS)
+        weights: List[float] = [1.0] * len(symbols)
+        if filler_secrets:
+            symbols += list(SECRET_BRACKETS)
+            weights += [BRACKET_WEIGHT] * len(SECRET_BRACKETS)
+        self._filler: _Filler = _Filler(
+            filler_secrets, symbols, list(accumulate(weights)), {}, set()
+        )
 
-        dud_range: int = random.randint(tries + 1, tries * 2)
-        # At least 2 from both zero and Low similarity
-        low_sim_portion: int = math.ceil(dud_range / 3)
-        high_sim_portion: int = dud_range - low_sim_portion
-
-        # Mix zero, low, high duds and secrets
-        self._dud_pool += (
-            word_options.zero_duds[:low_sim_portion]
-            + word_options.low_similar_duds[:low_sim_portion]
-            + word_options.high_similar_duds[:high_sim_portion]
+        screens: int = self._settings.SCREENS
+        if duds is None:
+            dud_range: int = self._board.rng.randint(
+                (tries + 1) * screens, tries * 2 * screens
+            )
+            duds = word_options.dud_mix(dud_range)
+        # Mix duds and secrets, secrets are blank until placed (see _place)
+        self._dud_pool += duds
+        if secrets and not self._filler.secrets:
+            self._dud_pool += [("", "s")] * self._board.rng.randint(
+                2 * screens, (tries + 2) * screens
+            )
+        # Screens are dealt every SCREENS-th entry of the pool (see _place),
+        # the password swaps in from a random screen
+        shown: int = self._board.rng.randrange(min(screens, len(duds) + 1))
+        pool: List[Tuple[str, Union[str, int]]] = self._dud_pool
+        pool[0], pool[shown] = pool[shown], pool[0]
+        self._board.waiting.update(
+            (screen, len(range(screen, len(duds) + 1, screens)) - (screen == shown))
+            for screen in range(screens)
         )
-        if secrets:
-            self._dud_pool += word_options.secrets_list[: random.randint(2, tries + 2)]
+
+    @property
+    def rng(self) -> random.Random:
+        """
+        Random source of the board, see Components.rng.
+
+        :return: random source
+        """
+        return self._board.rng
+
+    @property
+    def draws(self) -> Draws:
+        """
+        Draws the board was built with, see Components.draws.
+
+        :return: random source, cache, frequencies and letter counts
+        """
+        return self._board.draws
+
+    @property
+    def removed(self) -> List[str]:
+        """
+        Duds removed by remove_random_dud.
+
+        :return: words in order removed
+        """
+        return self._board.removed
 
     @property
     def left_active_col(self) -> Tuple[str, ...]:
         """
-        Left Active column.
+        Left Active column (first column).
 
         :return: left active_col for grid viewing
         """
-        self._populate_active_col()
-        col: List[str] = []
-        for left_line in self._active_col[0]:
-            col.append(left_line.line)
-        return tuple(col)
+        return self.active_col(0)
 
     @property
     def right_active_col(self) -> Tuple[str, ...]:
         """
-        Right Active column.
+        Right Active column (last column).
 
         :return: right active_col for grid viewing
         """
+        return self.active_col(self._settings.COLUMNS - 1)
+
+    def active_col(self, column: int) -> Tuple[str, ...]:
+        """
+        Active column.
+
+        :param column: active column (0 is left most)
+        :return: active_col for grid viewing
+        """
+        column = self._column_guard(column)
         self._populate_active_col()
         col: List[str] = []
-        for right_line in self._active_col[1]:
-            col.append(right_line.line)
+        for line in self._active_col[column]:
+            col.append(line.line)
         return tuple(col)
 
+    def active_line(self, column: int, row: int) -> str:
+        """
+        Line of an active column, without building the column.
+
+        :param column: active column (0 is left most)
+        :param row: row in active column
+        :return: line for grid viewing
+        """
+        column = self._column_guard(column)
+        self._populate_active_col()
+        return self._active_col[column][row].line
+
     @property
     def duds_left(self) -> bool:
         """
@@ -95,33 +184,65 @@ class InteractiveCols:
         :return: If there are duds left
         """
         self._populate_active_col()
-        return bool(self._found_duds)
+        return bool(self._found_duds) or any(self._board.waiting.values())
+
+    def entry_words(self) -> List[str]:
+        """
+        Words of duds and password still on the board.
+
+        :return: words in address order
+        """
+        self._populate_active_col()
+        self._place(range(self._settings.SCREENS))
+        removed = frozenset(self.removed)
+        placed: Dict[int, Tuple[str, Union[str, int]]] = self._board.placed
+        return [
+            placed[index][0]
+            for index in sorted(placed)
+            if placed[index][1] != "s" and placed[index][0] not in removed
+        ]
 
     def select_char(
-        self, right: bool, col: int, row: int
+        self, column: int, col: int, row: int
     ) -> Tuple[str, Union[str, int]]:
         """
         Reveals similarity of character selected along with word.
 
-        :param right: right active column? (T/F)
+        :param column: active column (0 is left most), or right (T/F)
         :param col: char column in active column
         :param row: row in active column
         :return: selected word or char on error, similarity
         """
-        if not isinstance(right, bool):
-            raise ValueError(f"Right is not a bool instead {type(right)}")
+        column = self._column_guard(column)
         self._populate_active_col()
-        line: InteractiveCols.Line = self._active_col[int(right)][col]
-        char = line.line[row]
-        # return secret when start char is selected and there are duds left
-        if line.similarity == "s" and row == line.start and self._found_duds:
+        line: InteractiveCols.Line = self._active_col[column][col]
+        closing: int = self._bracket_end(column, col, row)
+        if closing >= 0:
+            return line.line[row : closing + 1], "s"
+        if self._on_entry(line, row):
             return line.word, line.similarity
-        # row in range and dud similarity
-        if line.start <= row <= line.end and line.similarity != "e":
-            if isinstance(line.similarity, int) or line.similarity == "p":
-                return line.word, line.similarity
         # None error line where char outide start/end selected
-        return char, "e"
+        return line.line[row], "e"
+
+    def entry_span(self, column: int, row: int, place: int) -> Tuple[int, int]:
+        """
+        Span of the entry select_char would return for place.
+
+        Uses the start/end kept on the line, so no searching is done.
+        :param column: active column (0 is left most)
+        :param row: row in active column
+        :param place: char place in row
+        :return: start, end (inclusive) of word or secret, (place, place) for a char
+        """
+        column = self._column_guard(column)
+        self._populate_active_col()
+        line: InteractiveCols.Line = self._active_col[column][row]
+        closing: int = self._bracket_end(column, row, place)
+        if closing >= 0:
+            return place, closing
+        if self._on_entry(line, place):
+            return line.start, line.end
+        return place, place
 
     def remove_random_dud(self) -> bool:
         """
@@ -130,11 +251,24 @@ class InteractiveCols:
         Removes word from line and turns to error
         :return: was action taken (T/F)
         """
-        if not self._found_duds:  # No duds left (empty array)
+        if not self.duds_left:
             return False
-        self._populate_active_col()
-        if self._found_duds == [(-1, -1)]:  # need to make dud list
-            raise RuntimeError("Found duds not initialized")
+        waiting: Dict[int, int] = self._board.waiting
+        index: int = self._board.rng.randrange(
+            len(self._found_duds) + sum(waiting.values())
+        )
+        if index >= len(self._found_duds):  # on a screen not placed yet
+            index -= len(self._found_duds)
+            screens: List[int] = list(waiting)
+            ends: List[int] = list(accumulate(waiting.values()))
+            found: int = bisect_right(ends, index)
+            self._place((screens[found],))  # its duds are found last
+            index += len(self._found_duds) - ends[found]
+        # swap a random dud to the end instead of shuffling every dud up front
+        self._found_duds[index], self._found_duds[-1] = (
+            self._found_duds[-1],
+            self._found_duds[index],
+        )
         remove = self._found_duds.pop()
         original: InteractiveCols.Line = self._active_col[remove[0]][remove[1]]
         start_line: str = original.line[: original.start]
@@ -144,126 +278,537 @@ class InteractiveCols:
             word += "."
         newline = self.Line(start_line + word + end_line, "", -1, -1, "e")
         self._active_col[remove[0]][remove[1]] = newline
+        self._board.removed.append(original.word)
+        if self._filler.secrets:  # letters no longer split brackets on the row
+            self._scan_brackets(remove[0] * self._settings.NUM_OF_ROWS + remove[1])
+        self._reindex(remove[0], remove[1])
         return True
 
-    def inactivate_secret(self, right: bool, row: int) -> bool:
+    def inactivate_secret(self, column: int, row: int, place: int = -1) -> bool:
         """
         Turn selected secret into an error.
 
         Does not modify line.
-        :param right: Right active column? (T/F)
+        :param column: active column (0 is left most), or right (T/F)
         :param row: row in active column
+        :param place: opening bracket of a secret in filler (FILLER_SECRETS)
         :return: was action taken?
         """
-        if not isinstance(right, bool):
-            raise ValueError(f"Right is not a bool instead {type(right)}")
+        column = self._column_guard(column)
         self._populate_active_col()
-        old_line = self._active_col[int(right)][row]
+        index: int = column * self._settings.NUM_OF_ROWS + row
+        if self._bracket_end(column, row, place) >= 0:
+            del self._filler.brackets[index][place]
+            if not self._filler.brackets[index]:
+                del self._filler.brackets[index]
+            self._filler.used.add((index, place))
+            self._reindex(column, row)
+            return True
+        old_line = self._active_col[column][row]
         if old_line.similarity != "s":
             return False
             # Not a  secret, so action needed
         newline: InteractiveCols.Line = self.Line(old_line.line, "", -1, -1, "e")
-        self._active_col[int(right)][row] = newline
+        self._active_col[column][row] = newline
+        self._reindex(column, row)
         return True
 
+    def next_entry(
+        self, column: int, row: int, place: int, step: int = 1, secrets: bool = False
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Entry step entries after place (before when negative) in address order.
+
+        Entries are counted from the sorted line indexes, only the target line
+        and the line of place are looked at (every line passed when lines can
+        hold several secrets, see FILLER_SECRETS). Screens passed are placed.
+        Moving past the last (first) entry stops on it.
+        :param column: active column (0 is left most)
+        :param row: row in active column
+        :param place: char place in row
+        :param step: entries to move, negative moves back
+        :param secrets: only count secrets (T/F)
+        :return: column, row, start of entry, None when there is none that way
+        """
+        column = self._column_guard(column)
+        if step == 0:
+            raise ValueError("Step cannot be 0")
+        self._populate_active_col()
+        rows: int = self._settings.NUM_OF_ROWS
+        lines: List[int] = self._board.secrets if secrets else self._board.entries
+        current: int = column * rows + row
+        passed: int = current  # screens from current to passed are placed
+        found: Optional[Tuple[int, int, int]]
+        while True:
+            if self._filler.secrets:
+                found = self._walk_entries(lines, current, place, step, secrets)
+            else:
+                found = self._step_entries(lines, current, place, step)
+            end: int = (step > 0) * (rows * self._settings.COLUMNS - 1)
+            if found is not None:
+                end = found[0] * rows + found[1]
+            passed = self._unplaced(passed, end)
+            if passed < 0:
+                return found
+            self._place((self._screen(passed),))  # may hold nearer entries
+
     # Private
     def _populate_active_col(self) -> bool:
         """
         Populate the active columns.
 
-        sets self._active_col based on padded pool
+        Places entries of the pool on random lines, lines are only built
+        when first viewed (see _build_line).
         Line will be size -> ACTIVE_LINE_SIZE
         :return: Action taken? (T/F)
         """
         if self._active_col_set:  # already Set
             return False
-        # line_pool -> contains all lines to be use by self._active_col
-        line_pool: List[InteractiveCols.Line] = []
-        word_unpadded: str
-        word_similarity: Union[int, str]
-        for word_unpadded, word_similarity in self._dud_pool:
-            # No Padding Required
-            if len(word_unpadded) == self._settings.ACTIVE_LINE_SIZE:
-                line_pool.append(
-                    self.Line(
-                        word_unpadded,  # Line
-                        word_unpadded,  # word
-                        0,  # Start
-                        len(word_unpadded) - 1,  # End
-                        word_similarity,  # similarity
-                    )
-                )
-            else:  # Padding Required
-                padded_line: str = ""
-                placement: int = random.randint(
-                    0, self._settings.ACTIVE_LINE_SIZE - len(word_unpadded)
-                )
-                # pre-word
-                for _ in range(0, placement):
-                    padded_line += random.choice(self._settings.FILLER_SYMBOLS)
-                # add word
-                word_start: int = len(padded_line)  # where is word on line
-                padded_line += word_unpadded  # Adding word
-                word_end: int = len(padded_line) - 1  # location of last char on line
-                # post-word
-                end: int = len(padded_line)
-                for _ in range(end, self._settings.ACTIVE_LINE_SIZE):
-                    padded_line += random.choice(self._settings.FILLER_SYMBOLS)
-                # add Line info
-                line_pool.append(
-                    self.Line(
-                        padded_line,
-                        word_unpadded,
-                        word_start,
-                        word_end,
-                        word_similarity,
-                    )
-                )
-        # Add filler lines
-        line_pool += self._filler_lines(self._settings.NUM_OF_ROWS * 2 - len(line_pool))
-        random.shuffle(line_pool)
-        # set active_col
-        self._active_col = (
-            line_pool[self._settings.NUM_OF_ROWS :],
-            line_pool[: self._settings.NUM_OF_ROWS],
-        )
-        self._active_col_set = True
-        self._find_duds()
-        del self._dud_pool  # variable is no longer needed
+        with phase(POPULATE):
+            rows: int = self._settings.NUM_OF_ROWS
+            columns: int = self._settings.COLUMNS
+            height: int = rows // self._settings.SCREENS
+            # the first screen is dealt the most entries
+            if len(self._dud_pool[:: self._settings.SCREENS]) >= height * columns:
+                raise ValueError(f"Entries ({len(self._dud_pool)}) do not fit grid")
+            # Keep a few screens of built lines per column
+            self._active_col = tuple(
+                _Column(self._line_builder(column), rows, height * 4)
+                for column in range(columns)
+            )
+            self._active_col_set = True
+            self._found_duds.clear()
+            self._place((0,))  # first screen shown, others when reached
         return True
 
-    def _find_duds(self) -> None:
-        """Find and record dud locations."""
-        if (
-            self._found_duds == [(-1, -1)] and self._active_col_set
-        ):  # need to make dud list
-            col_index: int
-            row_index: int
-            self._found_duds.remove((-1, -1))
-            for col_index in range(len(self._active_col)):
-                for row_index in range(len(self._active_col[col_index])):
-                    if isinstance(
-                        self._active_col[col_index][row_index].similarity, int
-                    ):
-                        self._found_duds.append((col_index, row_index))
-            random.shuffle(self._found_duds)
+    def _place(self, screens: Iterable[int]) -> None:
+        """
+        Place entries of screens on random lines of each screen.
+
+        A screen is dealt every SCREENS-th entry of the pool and draws its
+        lines and secrets from its own random.Random, so it comes out the
+        same whichever screen is reached first. Placed screens are skipped.
+        :param screens: screens (NUM_OF_ROWS // SCREENS rows of every column)
+        """
+        board: _Board = self._board
+        rows: int = self._settings.NUM_OF_ROWS
+        dealt: List[int] = [screen for screen in screens if screen in board.waiting]
+        lines: List[int] = []
+        for screen in dealt:
+            del board.waiting[screen]
+            placed, pool = self._deal(screen)
+            board.placed.update(zip(placed, pool))
+            lines += placed
+        self._found_duds += [
+            divmod(index, rows)  # (col, row)
+            for index in lines
+            if isinstance(board.placed[index][1], int)
+        ]
+        secrets: List[int]
+        if self._filler.secrets:  # every line is scanned once
+            for index in self._screen_lines(dealt):
+                self._scan_brackets(index)
+            secrets = [
+                index
+                for index in self._screen_lines(dealt)
+                if index in self._filler.brackets
+            ]
+        else:
+            secrets = [index for index in lines if board.placed[index][1] == "s"]
+        board.entries.extend(set(lines).union(secrets))
+        board.entries.sort()
+        board.secrets.extend(secrets)
+        board.secrets.sort()
+
+    def _deal(self, screen: int) -> Tuple[List[int], List[Tuple[str, Union[str, int]]]]:
+        """
+        Lines and entries of a screen, secrets made.
+
+        :param screen: screen (NUM_OF_ROWS // SCREENS rows of every column)
+        :return: line index of each entry, entries
+        """
+        rows: int = self._settings.NUM_OF_ROWS
+        count: int = self._settings.SCREENS
+        height: int = rows // count
+        rng: random.Random = random.Random(f"{self._board.seed} {screen}")
+        pool: List[Tuple[str, Union[str, int]]] = self._dud_pool[screen::count]
+        places: List[int] = rng.sample(
+            range(height * self._settings.COLUMNS), len(pool)
+        )
+        made: Iterator[Tuple[str, str]] = iter(
+            make_secrets(
+                rng,
+                self._settings.FILLER_SYMBOLS,
+                [similarity for _, similarity in pool].count("s"),
+            )
+        )
+        pool = [next(made) if entry[1] == "s" else entry for entry in pool]
+        placed: List[int] = [
+            place // height * rows + screen * height + place % height
+            for place in places
+        ]
+        return placed, pool
+
+    def _screen_lines(self, screens: List[int]) -> Iterator[int]:
+        """
+        Line indexes of screens.
+
+        :param screens: screens
+        :return: line indexes, by screen then column
+        """
+        rows: int = self._settings.NUM_OF_ROWS
+        height: int = rows // self._settings.SCREENS
+        for screen in screens:
+            for column in range(self._settings.COLUMNS):
+                first: int = column * rows + screen * height
+                yield from range(first, first + height)
+
+    def _screen(self, index: int) -> int:
+        """
+        Screen of a line.
+
+        :param index: line index (column * NUM_OF_ROWS + row)
+        :return: screen (0 is the top)
+        """
+        height: int = self._settings.NUM_OF_ROWS // self._settings.SCREENS
+        return index // height % self._settings.SCREENS
+
+    def _unplaced(self, first: int, last: int) -> int:
+        """
+        First line met from line first to line last on a screen not placed yet.
+
+        :param first: line index to start from
+        :param last: line index to stop at (before first goes back)
+        :return: line index, -1 when every screen met is placed
+        """
+        if not self._board.waiting:
+            return -1
+        height: int = self._settings.NUM_OF_ROWS // self._settings.SCREENS
+        way: int = 1 if last >= first else -1
+        for block in range(first // height, last // height + way, way):
+            if block % self._settings.SCREENS in self._board.waiting:
+                return block * height
+        return -1
+
+    def _on_entry(self, line: "InteractiveCols.Line", place: int) -> bool:
+        """
+        Is place on the entry of line.
+
+        Secrets only count from their start char and while there are duds left.
+        :param line: line of active column
+        :param place: char place in line
+        :return: place selects line.word (T/F)
+        """
+        if line.similarity == "s":
+            return place == line.start and self.duds_left
+        # row in range and dud similarity
+        return line.start <= place <= line.end and line.similarity != "e"
+
+    def _reindex(self, column: int, row: int) -> None:
+        """
+        Update entry indexes after a line changed.
+
+        :param column: active column (0 is left most)
+        :param row: row in active column
+        """
+        index: int = column * self._settings.NUM_OF_ROWS + row
+        similarity: Union[str, int] = self._active_col[column][row].similarity
+        brackets: bool = index in self._filler.brackets
+        _index_line(self._board.entries, index, similarity != "e" or brackets)
+        _index_line(self._board.secrets, index, similarity == "s" or brackets)
+
+    def _scan_brackets(self, index: int) -> None:
+        """
+        Index unused bracket pairs of a line.
+
+        :param index: line index (column * NUM_OF_ROWS + row)
+        """
+        column, row = divmod(index, self._settings.NUM_OF_ROWS)
+        pairs: Dict[int, int] = {
+            opening: closing
+            for opening, closing in bracket_pairs(self._active_col[column][row].line)
+            if (index, opening) not in self._filler.used
+        }
+        if pairs:
+            self._filler.brackets[index] = pairs
         else:
-            raise RuntimeError("duds in unknown state")
+            self._filler.brackets.pop(index, None)
+
+    def _bracket_end(self, column: int, row: int, place: int) -> int:
+        """
+        Find closing bracket of the secret in filler opened at place.
+
+        Secrets only count while there are duds left.
+        :param column: active column (0 is left most)
+        :param row: row in active column
+        :param place: char place in row
+        :return: closing place, -1 when place does not open a secret
+        """
+        if not self._filler.brackets or not self.duds_left:
+            return -1
+        index: int = column * self._settings.NUM_OF_ROWS + row
+        return self._filler.brackets.get(index, {}).get(place, -1)
+
+    def _starts(self, index: int, secrets: bool) -> List[int]:
+        """
+        Start of every entry on a line.
+
+        :param index: line index (column * NUM_OF_ROWS + row)
+        :param secrets: only secrets (T/F)
+        :return: starts in order
+        """
+        column, row = divmod(index, self._settings.NUM_OF_ROWS)
+        line: InteractiveCols.Line = self._active_col[column][row]
+        starts: List[int] = list(self._filler.brackets.get(index, {}))
+        if line.similarity != "e" and (not secrets or line.similarity == "s"):
+            starts.append(line.start)
+        return sorted(starts)
+
+    def _step_entries(
+        self, lines: List[int], current: int, place: int, step: int
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Step over entries of the sorted line indexes, one entry a line.
+
+        :param lines: sorted line indexes of entries
+        :param current: line index of place
+        :param place: char place in line
+        :param step: entries to move, negative moves back
+        :return: column, row, start of entry, None when there is none that way
+        """
+        rows: int = self._settings.NUM_OF_ROWS
+        found: int = bisect_left(lines, current)  # first entry not before row
+        if found < len(lines) and lines[found] == current:
+            start: int = self._active_col[current // rows][current % rows].start
+            if start < place or (step > 0 and start == place):
+                found += 1  # entry on row is passed
+        if (step > 0 and found == len(lines)) or (step < 0 and found == 0):
+            return None
+        target: int = found + step - 1 if step > 0 else found + step
+        to_column, to_row = divmod(lines[min(max(target, 0), len(lines) - 1)], rows)
+        return to_column, to_row, self._active_col[to_column][to_row].start
+
+    def _walk_entries(
+        self, lines: List[int], current: int, place: int, step: int, secrets: bool
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Walk entries line by line, for lines with several entries.
+
+        :param lines: sorted line indexes of entries
+        :param current: line index of place
+        :param place: char place in line
+        :param step: entries to move, negative moves back
+        :param secrets: only count secrets (T/F)
+        :return: column, row, start of entry, None when there is none that way
+        """
+        target: Optional[Tuple[int, int]] = None  # line index, start
+        left: int = abs(step)
+        position: int = bisect_left(lines, current)  # first entry not before row
+        if step < 0 and not (position < len(lines) and lines[position] == current):
+            position -= 1
+        while left and 0 <= position < len(lines):
+            index: int = lines[position]
+            starts: List[int] = self._starts(index, secrets)
+            if step > 0:
+                starts = [
+                    start for start in starts if index != current or start > place
+                ]
+            else:
+                starts = [
+                    start for start in starts if index != current or start < place
+                ]
+                starts.reverse()
+            if starts:
+                target = index, starts[min(left, len(starts)) - 1]
+                left -= min(left, len(starts))
+            position += 1 if step > 0 else -1
+        if target is None:
+            return None
+        to_column, to_row = divmod(target[0], self._settings.NUM_OF_ROWS)
+        return to_column, to_row, target[1]
+
+    def _column_guard(self, column: int) -> int:
+        """
+        Guard for active column index.
+
+        A bool is right (T) or left (F), as in two column grids.
+        :param column: active column (0 is left most)
+        :return: active column index
+        """
+        if isinstance(column, bool):
+            return self._settings.COLUMNS - 1 if column else 0
+        if not isinstance(column, int):
+            raise ValueError(f"Column is not an int instead {type(column)}")
+        if not 0 <= column < self._settings.COLUMNS:
+            raise ValueError(f"Column ({column}) not in grid")
+        return column
+
+    def _line_builder(self, column: int) -> Callable[[int], "InteractiveCols.Line"]:
+        """
+        Line builder of a column.
+
+        :param column: active column (0 is left most)
+        :return: builds line of a row in column
+        """
+        offset: int = column * self._settings.NUM_OF_ROWS
+        return lambda row: self._build_line(offset + row)
+
+    def _build_line(self, index: int) -> "InteractiveCols.Line":
+        """
+        Build line from board model.
+
+        Same index always builds the same line.
+        :param index: line index (column * NUM_OF_ROWS + row)
+        :return: line with filler and entry placed on it
+        """
+        screen: int = self._screen(index)
+        if screen in self._board.waiting:  # first line built of the screen
+            self._place((screen,))
+        size: int = self._settings.ACTIVE_LINE_SIZE
+        rng = random.Random(self._board.seed + index)
+        filler: str = "".join(
+            rng.choices(self._filler.symbols, cum_weights=self._filler.weights, k=size)
+        )
+        if index not in self._board.placed:
+            return self.Line(filler, "", -1, -1, "e")
+        word, similarity = self._board.placed[index]
+        start: int = rng.randint(0, size - len(word))
+        end: int = start + len(word) - 1
+        return self.Line(
+            filler[:start] + word + filler[end + 1 :], word, start, end, similarity
+        )
+
+
+def bracket_pairs(line: str) -> Iterator[Tuple[int, int]]:
+    """
+    Bracket pairs of a line that are secrets in the original game.
+
+    An opening bracket pairs with the first closing bracket of its type after
+    it, when no letter is between them. Openings may share a closing bracket.
+    Line is scanned once.
+    :param line: line to scan
+    :return: (opening place, closing place) in order of closing place
+    """
+    waiting: Dict[str, List[int]] = {closer: [] for closer in _CLOSERS.values()}
+    for place, char in enumerate(line):
+        if char in _CLOSERS:
+            waiting[_CLOSERS[char]].append(place)
+        elif char in waiting:
+            for opening in waiting[char]:
+                yield opening, place
+            waiting[char].clear()
+        elif char.isalpha():  # letters split pairs
+            for openings in waiting.values():
+                openings.clear()
+
+
+class _Board(NamedTuple):
+    """Data container for the board model, entries are placed by screen."""
+
+    draws: Draws  # draws the board was built with
+    rng: random.Random  # random source of the board, draws.rng
+    seed: int  # lines are built from seed + line index
+    # line index -> entry on line, other lines are filler
+    placed: Dict[int, Tuple[str, Union[str, int]]]
+    # Sorted line indexes of lines with an entry (words and secrets) and of
+    # secrets, entries removed from the board are removed from both
+    entries: List[int]
+    secrets: List[int]
+    removed: List[str]  # duds removed by remove_random_dud in order
+    waiting: Dict[int, int]  # screen -> duds dealt to it, of screens not placed
+
+
+class _Filler(NamedTuple):
+    """Data container for filler of lines."""
+
+    secrets: bool  # secrets are bracket pairs in filler (FILLER_SECRETS)
+    symbols: List[str]  # filler symbols, brackets too with secrets
+    weights: List[float]  # cumulative weights of symbols
+    # line index -> {opening place: closing place} of unused bracket pairs
+    brackets: Dict[int, Dict[int, int]]
+    used: Set[Tuple[int, int]]  # (line index, opening) of used bracket pairs
+
+
+def _index_line(lines: List[int], index: int, member: bool) -> None:
+    """
+    Add or remove line index in sorted line indexes.
+
+    :param lines: sorted line indexes
+    :param index: line index
+    :param member: should index be in lines (T/F)
+    """
+    found: int = bisect_left(lines, index)
+    present: bool = found < len(lines) and lines[found] == index
+    if member and not present:
+        lines.insert(found, index)
+    elif present and not member:
+        del lines[found]
+
+
+class _Column:
+    """_Column - lines of an active column built on first view."""
+
+    def __init__(
+        self, build: Callable[[int], InteractiveCols.Line], rows: int, cached: int
+    ) -> None:
+        """
+        Initialize column, no lines are built.
+
+        :param build: builds line of a row
+        :param rows: lines in column
+        :param cached: built lines kept, least recently used are dropped
+        """
+        self._build: Callable[[int], InteractiveCols.Line] = build
+        self._rows: int = rows
+        self._cached: int = cached
+        self._cache: "OrderedDict[int, InteractiveCols.Line]" = OrderedDict()
+        self._changed: Dict[int, InteractiveCols.Line] = {}  # never dropped
+
+    def __len__(self) -> int:
+        """
+        Lines in column.
+
+        :return: number of rows
+        """
+        return self._rows
+
+    def __getitem__(self, row: int) -> InteractiveCols.Line:
+        """
+        Line of row, built if not cached.
+
+        :param row: row in column (negative counts from end)
+        :return: line
+        """
+        if row < 0:
+            row += self._rows
+        if not 0 <= row < self._rows:
+            raise IndexError(f"row ({row}) out of range")
+        if row in self._changed:
+            return self._changed[row]
+        if row in self._cache:
+            self._cache.move_to_end(row)
+            return self._cache[row]
+        line: InteractiveCols.Line = self._build(row)
+        self._cache[row] = line
+        if len(self._cache) > self._cached:
+            self._cache.popitem(last=False)
+        return line
+
+    def __setitem__(self, row: int, line: InteractiveCols.Line) -> None:
+        """
+        Replace line of row.
+
+        :param row: row in column
+        :param line: new line
+        """
+        self._cache.pop(row, None)
+        self._changed[row] = line
 
-    def _filler_lines(self, line_count: int) -> List[Any]:
+    def __iter__(self) -> Iterator[InteractiveCols.Line]:
         """
-        Create filler error lines for grid.
+        Lines from top to bottom.
 
-        self._populate_active_col helper function
-        :param line_count:  number of lines to create
-        :return: list of filler lines
+        :return: iterator of lines
         """
-        if line_count <= 0:
-            raise ValueError(f"Line_count: {line_count} is zero or less")
-        filler_column: List[InteractiveCols.Line] = []
-        for _ in range(line_count):
-            line_str: str = ""  # display line
-            for __ in range(self._settings.ACTIVE_LINE_SIZE):
-                line_str += random.choice(self._settings.FILLER_SYMBOLS)
-            filler_column.append(self.Line(line_str, "", -1, -1, "e"))
-        return filler_column
+        for row in range(self._rows):
+            yield self[row]
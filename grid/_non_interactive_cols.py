@@ -1,35 +1,40 @@
 """Non-Interactive Columns for the grid."""
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from grid.settings import SettingGrid
 
 
 class NonInteractiveCols:
     """NonInteractiveCols - contains grid data the user does not interact with."""
 
-    def __init__(self, settings: SettingGrid) -> None:
+    def __init__(
+        self, settings: SettingGrid, rng: Optional[random.Random] = None
+    ) -> None:
         """
         Initialize Grid data to be used by property.
 
         :param settings: loaded game settings
+        :param rng: random source of the board (default a new one)
         """
         self._left_hex: Tuple[str, ...] = ("Pre", "Fill")
         self._right_hex: Tuple[str, ...] = ("Pre", "Fill")
+        self._first_hex: int = -1  # address of first right hex line
         self._settings: SettingGrid = settings
-        # Blanking feedback column
+        self._rng: random.Random = rng or random.Random()
+        self._revision: int = 0  # counts changes to feedback column
+        # Blanking feedback column, one screen tall
         self._feedback_col: List[str] = [
             " " * self._settings.FEEDBACK_LINE_SIZE
-            for _ in range(self._settings.NUM_OF_ROWS)
+            for _ in range(self._settings.NUM_OF_ROWS // self._settings.SCREENS)
         ]
 
-        random.seed()
         # Hover Feedback Row
         self._feedback_col[-1] = ">" + " " * (self._settings.FEEDBACK_LINE_SIZE - 1)
 
     @property
     def left_hex(self) -> Tuple[str, ...]:
         """
-        Left hex column that acts a filler column.
+        Left hex column that acts a filler column (first column).
 
         :return:  Left filler column
         """
@@ -40,7 +45,7 @@ class NonInteractiveCols:
     @property
     def right_hex(self) -> Tuple[str, ...]:
         """
-        Right hex column that acts a filler column.
+        Right hex column that acts a filler column (last column).
 
         :return:  Right filler column
         """
@@ -48,6 +53,37 @@ class NonInteractiveCols:
             self._generate_hex()
         return self._right_hex
 
+    def hex_line(self, column: int, row: int) -> str:
+        """
+        Line of a hex column, without building the column.
+
+        :param column: hex column (0 is left most)
+        :param row: row in column
+        :return: hex address
+        """
+        if self._first_hex < 0:
+            self._set_first_hex()
+        # addresses continue from the bottom of the column to the left
+        return hex(self._first_hex + 2 * (column * self._settings.NUM_OF_ROWS + row))
+
+    @property
+    def settings(self) -> SettingGrid:
+        """
+        Settings the columns are laid out by.
+
+        :return: loaded game settings
+        """
+        return self._settings
+
+    @property
+    def revision(self) -> int:
+        """
+        Change counter of feedback column, see add_feedback.
+
+        :return: number of changes
+        """
+        return self._revision
+
     @property
     def feedback_col(self) -> Tuple[str, ...]:
         """
@@ -70,6 +106,7 @@ class NonInteractiveCols:
         if size <= self._settings.FEEDBACK_LINE_SIZE - 1:  # test_size
             missing: int = self._settings.FEEDBACK_LINE_SIZE - size - 1
             feedback = ">" + feedback + " " * missing
+            self._revision += 1
             if hover:
                 self._feedback_col[-1] = feedback
             else:
@@ -82,16 +119,18 @@ class NonInteractiveCols:
         else:
             raise ValueError(f"feedback string size ({size}) is to long")
 
-    def _generate_hex(self) -> None:
-        """Generate Hex columns lines between HEX_COL_MIN and HEX_COL_MAX."""
-        num: int = random.randint(
+    def _set_first_hex(self) -> None:
+        """Pick first hex address between HEX_COL_MIN and HEX_COL_MAX."""
+        num: int = self._rng.randint(
             self._settings.HEX_COL_MIN, self._settings.HEX_COL_MAX
         )
         if num % 2 != 0:
             num += 1  # make even
-        hex_full: List[str] = []
-        while len(hex_full) != self._settings.NUM_OF_ROWS * 2:  # generate both columns
-            hex_full.append(str(hex(num)))
-            num += 2
-        self._left_hex = tuple(hex_full[self._settings.NUM_OF_ROWS :])
-        self._right_hex = tuple(hex_full[: self._settings.NUM_OF_ROWS])
+        self._first_hex = num
+
+    def _generate_hex(self) -> None:
+        """Generate Hex columns lines between HEX_COL_MIN and HEX_COL_MAX."""
+        rows: int = self._settings.NUM_OF_ROWS
+        right: int = self._settings.COLUMNS - 1
+        self._left_hex = tuple(self.hex_line(0, row) for row in range(rows))
+        self._right_hex = tuple(self.hex_line(right, row) for row in range(rows))
@@ -1,19 +1,50 @@
 """Tools to sort word list based on similarity and word size range."""
-from typing import List, Iterable, Set, Dict, Tuple
+
+from typing import Callable, List, Iterable, Mapping, Optional, Pattern, Set, Dict
+from typing import Sized, Tuple, TYPE_CHECKING
 import random
+import re
 from math import floor
+from operator import eq
+from string import ascii_lowercase
+from grid.packed import PackedWords
+from grid.settings import LIKENESS_MODES
+from grid.trie import WordTrie
+
+if TYPE_CHECKING:
+    from grid.letter_counts import LetterCounts
 
 # Black styling Preferred
 # pylint: disable=c0330
 
+# Words kept once lowercased, digits, hyphens and brackets would break the grid
+WORD: Pattern[str] = re.compile("[a-z]+")
+# High similarity words (over half the letters in place) a password needs
+HIGH_DUDS: int = 15
+# Letter -> first layer bit of letter_mask
+_LETTER_BITS: Dict[str, int] = {
+    char: 1 << place for place, char in enumerate(ascii_lowercase)
+}
+
 
-def set_passwords(word_subset: List[str], count: int) -> List[str]:
+def set_passwords(
+    word_subset: List[str],
+    count: int,
+    mode: str = "positional",
+    trie: Optional[WordTrie] = None,
+) -> List[str]:
     """
     Find a list of passwords per difficulty for count.
 
-    This function is slow especially with larger word sets and counts
+    This function is slow especially with larger word sets and counts,
+    in positional mode letter counts (see letter_counts) settle some words
+    without comparing them to every other word and the rest are compared
+    packed (see packed).
     :param word_subset: lists of words
     :param count: number of passwords to try and find
+    :param mode: likeness mode, see settings.LIKENESS_MODES
+    :param trie: word_subset as a trie, positional mode then stops counting
+    similar words at the threshold (faster for short words)
     :return: list of passwords per difficulty
     """
     if count <= 0:
@@ -23,9 +54,22 @@ def set_passwords(word_subset: List[str], count: int) -> List[str]:
     pass_arr = []
     word_subset_cpy = list(word_subset.copy())
     random.shuffle(word_subset_cpy)
+    counts: Optional["LetterCounts"] = None
+    compared: Iterable[str] = word_subset_cpy
+    if mode == "positional":
+        from grid.letter_counts import LetterCounts  # pylint: disable=C0415
+
+        counts = LetterCounts(word_subset_cpy)
+        compared = PackedWords(word_subset_cpy)  # packed once, compared often
     for word in word_subset_cpy:
-        result = similarity_sort(word_subset_cpy, word)
-        if result[1]:
+        viable: Optional[bool] = None if counts is None else counts.viable(word)
+        if viable is not None:
+            if viable:
+                pass_arr.append(word)
+        elif trie is not None and mode == "positional":
+            if _threshold(trie, word):
+                pass_arr.append(word)
+        elif similarity_sort(compared, word, mode)[1]:
             pass_arr.append(word)
         if len(pass_arr) == count:
             break
@@ -39,6 +83,7 @@ def trim(minimum: int, maximum: int, word_list: Iterable[str]) -> Set[str]:
     Output word list in lowercase based on min/max letter count.
 
     Does not validate maximum and maximum, expected to be done before calling.
+    Words other than letters a to z once lowercased (see WORD) are dropped.
     :param minimum: minimum letters allowed in a word.
     :param maximum: maximum letters allowed in a word.
     :param word_list: source list of words to be trimmed.
@@ -47,36 +92,166 @@ def trim(minimum: int, maximum: int, word_list: Iterable[str]) -> Set[str]:
     reduced_words = set()  # prevent duplicates
     word: str
     for word in word_list:
-        if minimum <= len(word) <= maximum:
+        if minimum <= len(word) <= maximum and WORD.fullmatch(word.lower()):
             reduced_words.add(word.lower())
     return reduced_words
 
 
 def similarity_sort(
-    word_list: Iterable[str], compare_string: str
+    word_list: Iterable[str], compare_string: str, mode: str = "positional"
 ) -> Tuple[Dict[int, List[str]], bool]:
     """
     Separate word_list based on similarity.
 
+    :param word_list: words, PackedWords and Dictionary ranges are compared
+    with SWAR in positional mode (see packed)
     :param compare_string: string to compare against for similarity
+    :param mode: likeness mode, see settings.LIKENESS_MODES
     :return dictionary with similarity count as keys, was threshold met?
     """
+    # PackedWords and WordRange sort themselves
+    sort: Optional[Callable[[str], Dict[int, List[str]]]] = getattr(
+        word_list, "similarity_sort", None
+    )
+    if sort is not None and mode == "positional":
+        packed_store: Dict[int, List[str]] = sort(compare_string)
+        return packed_store, threshold_met(packed_store, compare_string)
     word_set = frozenset(word_list)  # remove duplicates
     similarity_store: Dict[int, List[str]] = {}
-    low_sim = floor(len(compare_string) / 2)
-    # number of words that has more then 1/2 words in same place as compare string
-    high_sim_count: int = 0
+    likeness_of: Callable[[str], int] = likeness(compare_string, mode)
     for word in word_set:
         if word == compare_string:
             continue
-        similarity: int = 0
-        lj_word = word.ljust(len(compare_string))
-        for index, char in enumerate(compare_string):
-            if lj_word[index] == char:
-                similarity += 1
+        similarity: int = likeness_of(word)
         if similarity not in similarity_store:
             similarity_store[similarity] = []
         similarity_store[similarity].append(word)
-        if similarity > low_sim:
-            high_sim_count += 1
-    return similarity_store, high_sim_count >= 15
+    return similarity_store, threshold_met(similarity_store, compare_string)
+
+
+def threshold_met(buckets: Mapping[int, Sized], compare_string: str) -> bool:
+    """
+    Tell whether buckets hold HIGH_DUDS words of high similarity.
+
+    High similarity words have more then half the letters of compare_string
+    in the same place.
+    :param buckets: similarity -> words (or ids) with it
+    :param compare_string: string words were compared against
+    :return: T/F
+    """
+    low_sim: int = floor(len(compare_string) / 2)
+    high: int = sum(len(buckets[sim]) for sim in buckets if sim > low_sim)
+    return high >= HIGH_DUDS
+
+
+def likeness(compare_string: str, mode: str = "positional") -> Callable[[str], int]:
+    """
+    Build a function counting likeness of words to compare_string.
+
+    Work that only depends on compare_string is done once here.
+    positional - same letter in same place, letters past the shorter word
+    never match
+    overlap - letters in common in any place (multiset), popcount of the
+    AND of letter masks
+    edit - longest word length less Levenshtein distance (Myers bit-parallel)
+    :param compare_string: string to compare against
+    :param mode: one of settings.LIKENESS_MODES
+    :return: function of word to likeness
+    """
+    if mode == "positional":
+        return lambda word: sum(map(eq, word, compare_string))
+    if mode == "overlap":
+        target: int = letter_mask(compare_string)
+        return lambda word: bin(letter_mask(word) & target).count("1")
+    if mode == "edit":
+        distance: Callable[[str], int] = edit_distance(compare_string)
+        size: int = len(compare_string)
+        return lambda word: max(len(word), size) - distance(word)
+    raise ValueError(f"Unknown likeness mode ({mode}), expected {LIKENESS_MODES}")
+
+
+def letter_mask(word: str) -> int:
+    """
+    Letters of word as 26 bit layers, layer n has the letters seen over n times.
+
+    Popcount of the AND of two masks is the number of letters in common,
+    counting repeated letters. Characters outside a-z are ignored.
+    :param word: lowercase word
+    :return: mask
+    """
+    mask: int = 0
+    next_bit: Dict[str, int] = {}  # bit of letter in the next layer
+    for char in word:
+        bit: int = next_bit.get(char) or _LETTER_BITS.get(char, 0)
+        mask |= bit
+        next_bit[char] = bit << 26
+    return mask
+
+
+def edit_distance(pattern: str) -> Callable[[str], int]:
+    """
+    Build a Levenshtein distance function to pattern (Myers bit-parallel).
+
+    Columns of the distance table are kept as bit vectors, so a word costs one
+    round of integer operations per letter.
+    :param pattern: string measured against
+    :return: function of word to edit distance
+    """
+    size: int = len(pattern)
+    if not size:
+        return len
+    peq: Dict[str, int] = {}  # char -> places of char in pattern
+    for place, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | 1 << place
+    everything: int = (1 << size) - 1
+    last: int = 1 << (size - 1)
+
+    def distance(word: str) -> int:
+        """
+        Levenshtein distance of word to pattern.
+
+        :param word: word to measure
+        :return: edits to turn word into pattern
+        """
+        positive: int = everything  # vertical +1 deltas
+        negative: int = 0  # vertical -1 deltas
+        score: int = size
+        for char in word:
+            match: int = peq.get(char, 0)
+            vertical: int = match | negative
+            horizontal: int = (((match & positive) + positive) ^ positive) | match
+            up_h: int = negative | ~(horizontal | positive)
+            down_h: int = positive & horizontal
+            if up_h & last:
+                score += 1
+            elif down_h & last:
+                score -= 1
+            up_h = (up_h << 1) | 1
+            down_h <<= 1
+            positive = (down_h | ~(vertical | up_h)) & everything
+            negative = up_h & vertical
+        return score
+
+    return distance
+
+
+# Private
+def _threshold(trie: WordTrie, compare_string: str) -> bool:
+    """
+    Threshold of similarity_sort, counting high similarity words with a trie.
+
+    The trie only walks branches that can still be high similarity and the
+    count stops at the threshold.
+    :param trie: words to compare
+    :param compare_string: string to compare against for similarity
+    :return: are HIGH_DUDS words more than half similar?
+    """
+    low_sim: int = floor(len(compare_string) / 2)
+    similar = trie.similar(compare_string, low_sim + 1)
+    count: int = 0
+    for word, _ in similar:
+        if word != compare_string:
+            count += 1
+            if count >= HIGH_DUDS:
+                return True
+    return False
@@ -0,0 +1,318 @@
+"""
+Adaptive boards picked to hit a target solve effort.
+
+Effort is the expected number of guesses the minimax solver (see hints)
+needs to find the password, averaged over every word on the board being
+the password. Passwords from pass_pool and duds from the Components
+buckets are searched until a board is close enough or the budget runs out.
+"""
+
+import random
+from time import perf_counter
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, Union
+from grid._components import Components
+from grid.draws import Draws
+from grid.dictionary import Dictionary
+from grid._word_tools import likeness, trim
+from grid.settings import SettingGrid
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Seconds allowed to pick a board at game start
+BUDGET: float = 0.020
+# Search stops once expected guesses are this close to the target
+TOLERANCE: float = 0.05
+# Budget divided between passwords tried
+PASSWORD_SHARE: int = 4
+# Duds of each similarity bucket tried as swaps
+ALTERNATIVES: int = 64
+
+
+class BoardScore:
+    """BoardScore - expected guesses of a board, rescored one word at a time."""
+
+    def __init__(self, words: Sequence[str], mode: str = "positional") -> None:
+        """
+        Score a board.
+
+        :param words: different words on the board, password included
+        :param mode: likeness mode, see settings.LIKENESS_MODES
+        """
+        if not words:
+            raise ValueError("Board has no words")
+        self._mode: str = mode
+        self._words: List[str] = list(words)
+        # likeness table, likeness is symmetric so rows are columns too
+        self._rows: List[List[int]] = [self._row(word) for word in self._words]
+        self.score: float = self._solve()
+        self._undo: Optional[Tuple[int, str, List[int], float]] = None
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """
+        Words on the board.
+
+        :return: words in board order
+        """
+        return tuple(self._words)
+
+    def swap(self, index: int, word: str) -> float:
+        """
+        Replace a word and rescore.
+
+        Only the row and column of index are recomputed, the board is only
+        solved again when the new word answers differently.
+        :param index: board place of word to replace
+        :param word: new word, not on the board
+        :return: expected guesses
+        """
+        row: List[int] = self._row(word)
+        row[index] = self._rows[index][index]  # likeness to itself
+        self._undo = index, self._words[index], self._rows[index], self.score
+        self._set(index, word, row)
+        if row != self._undo[2]:
+            self.score = self._solve()
+        return self.score
+
+    def undo(self) -> None:
+        """Take back the last swap without rescoring."""
+        if self._undo is None:
+            return
+        index, word, row, self.score = self._undo
+        self._set(index, word, row)
+        self._undo = None
+
+    # Private
+    def _row(self, word: str) -> List[int]:
+        """
+        Likeness of every board word to word.
+
+        :param word: word to compare
+        :return: likeness in board order
+        """
+        return list(map(likeness(word, self._mode), self._words))
+
+    def _set(self, index: int, word: str, row: List[int]) -> None:
+        """
+        Put word and its likeness row and column in the table.
+
+        :param index: board place
+        :param word: word
+        :param row: likeness of every board word to word
+        """
+        self._words[index] = word
+        self._rows[index] = row
+        for other, value in zip(self._rows, row):
+            other[index] = value
+
+    def _solve(self) -> float:
+        """
+        Average guesses over every word being the password.
+
+        :return: average guesses
+        """
+        return self._guesses(list(range(len(self._words)))) / len(self._words)
+
+    def _guesses(self, candidates: List[int]) -> int:
+        """
+        Guesses to find each candidate, summed, with the minimax solver.
+
+        The solver guesses the candidate leaving the fewest candidates in the
+        worst case, a perfect split ends the search for a guess early.
+        :param candidates: board places that can still be the password
+        :return: total guesses
+        """
+        if len(candidates) == 1:
+            return 1
+        best: Dict[int, List[int]] = {}
+        worst: int = len(candidates)
+        for guess in candidates:
+            row: List[int] = self._rows[guess]
+            buckets: Dict[int, List[int]] = {}
+            for other in candidates:
+                if other != guess:
+                    buckets.setdefault(row[other], []).append(other)
+            size: int = max(map(len, buckets.values()))
+            if size < worst:
+                best, worst = buckets, size
+                if size == 1:  # cannot split better
+                    break
+        # every candidate pays for this guess, the guess itself is found
+        return len(candidates) + sum(map(self._guesses, best.values()))
+
+
+def pick_board(
+    word_list: Union[Collection[str], Dictionary],
+    settings: SettingGrid,
+    tries: int,
+    budget: float = BUDGET,
+    draws: Draws = Draws(),
+) -> Tuple[Components, List[Tuple[str, int]], float]:
+    """
+    Board closest to settings.TARGET_GUESSES found within budget.
+
+    Passwords are tried in random order, duds of each are improved by
+    swapping in duds from the similarity buckets while the board gets
+    closer to the target. The budget starts on entry, trimming and the
+    first password count against it. At least one password is always
+    scored, so a pick takes the budget or the setup and first password,
+    whichever is longer. Others are only tried while their duds can be
+    sorted within budget.
+    :param word_list: source list of words or Dictionary (its cached letter
+    counts then drop passwords with too few high duds before a scan)
+    :param settings: settings with TARGET_GUESSES
+    :param tries: number guesses allowed, sets the number of duds
+    :param budget: seconds to search
+    :param draws: random source (default new random.Random), cache (cached
+    passwords cost little) and frequencies duds are drawn by, see Draws
+    :return: components (password), duds (word, similarity), expected guesses
+    """
+    deadline: float = perf_counter() + budget
+    words, draws, rng = _prepare(word_list, settings, draws)
+    dud_range: int = rng.randint(tries + 1, tries * 2)
+    best: Optional[Tuple[Components, List[Tuple[str, int]], float]] = None
+    build: float = 0.0  # seconds to sort duds of the last password
+    for password in rng.sample(settings.pass_pool, len(settings.pass_pool)):
+        start: float = perf_counter()
+        if best is not None and start + build > deadline:  # would not fit
+            break
+        board: Optional[Tuple[Components, List[Tuple[str, int]]]] = _board(
+            words, settings, password, draws, dud_range
+        )
+        if board is None:  # not enough duds in word_list
+            continue
+        build = perf_counter() - start
+        picked: Tuple[Components, List[Tuple[str, int]], float] = (
+            *board,
+            _improve(*board, _share(deadline, budget), rng),
+        )
+        if _miss(picked, settings) < _miss(best, settings):
+            best = picked
+        if _miss(best, settings) <= TOLERANCE or perf_counter() >= deadline:
+            break
+    if best is None:
+        raise RuntimeError("No password in pass_pool has enough duds")
+    return best
+
+
+# Private
+def _prepare(
+    word_list: Union[Collection[str], Dictionary], settings: SettingGrid, draws: Draws
+) -> Tuple[Dictionary, Draws, random.Random]:
+    """
+    Trim words once and fill in the random source and letter counts.
+
+    :param word_list: source list of words or Dictionary
+    :param settings: settings with TARGET_GUESSES
+    :param draws: draws asked for
+    :return: words (every password gets a view of the same range), draws
+    with rng (and counts of a Dictionary, built once per Dictionary), rng
+    """
+    rng: random.Random = draws.rng or random.Random()
+    draws = draws._replace(rng=rng)
+    if isinstance(word_list, Dictionary):
+        if settings.LIKENESS == "positional":
+            draws = draws._replace(
+                counts=word_list.letter_counts(settings.MIN, settings.MAX)
+            )
+        return word_list, draws, rng
+    return Dictionary(trim(settings.MIN, settings.MAX, word_list)), draws, rng
+
+
+def _board(
+    words: Dictionary, settings: SettingGrid, password: str, draws: Draws, duds: int
+) -> Optional[Tuple[Components, List[Tuple[str, int]]]]:
+    """
+    Components and a dud mix of a password.
+
+    :param words: trimmed words
+    :param settings: settings with TARGET_GUESSES
+    :param password: password to try
+    :param draws: see pick_board
+    :param duds: number of duds before zero duds are added (see dud_mix)
+    :return: components, duds (word, similarity), None when password has
+    too few duds
+    """
+    try:
+        components = Components(words, settings, password, draws)
+        return components, components.dud_mix(duds)
+    except RuntimeError:
+        return None
+
+
+def _share(deadline: float, budget: float) -> float:
+    """
+    Deadline of a password, a share of what is left so several are tried.
+
+    :param deadline: perf_counter time the search stops at
+    :param budget: seconds of the whole search
+    :return: perf_counter time to stop improving the password's duds at
+    """
+    return min(deadline, perf_counter() + budget / PASSWORD_SHARE)
+
+
+def _miss(
+    board: Optional[Tuple[Components, List[Tuple[str, int]], float]],
+    settings: SettingGrid,
+) -> float:
+    """
+    Distance of a board's expected guesses from the target.
+
+    :param board: components, duds and expected guesses, or None
+    :param settings: settings with TARGET_GUESSES
+    :return: absolute difference, infinite without a board
+    """
+    if board is None:
+        return float("inf")
+    return abs(board[2] - settings.TARGET_GUESSES)
+
+
+def _improve(
+    components: Components,
+    duds: List[Tuple[str, int]],
+    deadline: float,
+    rng: random.Random,
+) -> float:
+    """
+    Swap duds in place while the board gets closer to TARGET_GUESSES.
+
+    :param components: components of the board password
+    :param duds: duds on the board, changed in place
+    :param deadline: perf_counter time to stop at
+    :param rng: random source
+    :return: expected guesses of board
+    """
+    target: float = components.setting.TARGET_GUESSES
+    board = BoardScore(
+        [components.password[0]] + [word for word, _ in duds],
+        components.setting.LIKENESS,
+    )
+    on_board = frozenset(board.words)
+    alternatives: List[Tuple[str, int]] = [
+        dud
+        for bucket in (
+            components.zero_duds,
+            components.low_similar_duds,
+            components.high_similar_duds,
+        )
+        for dud in bucket[:ALTERNATIVES]
+        if dud[0] not in on_board
+    ]
+    while (
+        duds
+        and alternatives
+        and abs(board.score - target) > TOLERANCE
+        and perf_counter() < deadline
+    ):
+        index: int = rng.randrange(len(duds))
+        choice: int = rng.randrange(len(alternatives))
+        before: float = board.score
+        # sideways moves are kept to cross plateaus of equal scores
+        if abs(board.swap(index + 1, alternatives[choice][0]) - target) <= abs(
+            before - target
+        ):
+            duds[index], alternatives[choice] = alternatives[choice], duds[index]
+        else:
+            board.undo()
+    return board.score
@@ -0,0 +1,296 @@
+"""
+Diff based ANSI renderer and key decoding without curses.
+
+The renderer keeps a shadow copy of the screen and writes only the escape
+sequences needed to turn the previous frame into the next, in one write.
+"""
+from typing import BinaryIO, List, NamedTuple, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING
+from grid.interface import Mouse
+
+if TYPE_CHECKING:
+    from grid.backend import Backend
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+CSI: str = "\x1b["
+# Styles (SGR parameters)
+GREEN: str = "32"
+RED: str = "31"
+REVERSE: str = ";7"  # added to a style to highlight
+
+# Mouse tracking of every event (motion too) and of SGR encoded events
+MOTION_ON: str = CSI + "?1003h"
+MOTION_OFF: str = CSI + "?1003l"
+MOUSE_ON: str = MOTION_ON + CSI + "?1006h"
+MOUSE_OFF: str = CSI + "?1006l" + MOTION_OFF
+# SGR mouse button bits
+_MOUSE_BUTTONS: int = 0b11  # 0 is left button, 3 is none
+_MOUSE_MOTION: int = 32
+_MOUSE_WHEEL: int = 64
+# Escape sequence -> curses key name
+KEYS = {
+    "\x1b[A": "KEY_UP",
+    "\x1b[B": "KEY_DOWN",
+    "\x1b[C": "KEY_RIGHT",
+    "\x1b[D": "KEY_LEFT",
+    "\x1bOA": "KEY_UP",
+    "\x1bOB": "KEY_DOWN",
+    "\x1bOC": "KEY_RIGHT",
+    "\x1bOD": "KEY_LEFT",
+    "\x1b[5~": "KEY_PPAGE",
+    "\x1b[6~": "KEY_NPAGE",
+    "\x1b[Z": "KEY_BTAB",
+    "\x1b[H": "KEY_HOME",
+    "\x1bOH": "KEY_HOME",
+    "\x1b[1~": "KEY_HOME",
+}
+
+
+class ScreenLine(NamedTuple):
+    """Line of screen."""
+
+    text: str
+    style: str  # SGR parameters, e.g. GREEN
+    highlight: Tuple[int, int] = (0, 0)  # start, end (exclusive) shown in REVERSE
+
+
+class AnsiRenderer:
+    """AnsiRenderer - writes the difference between frames as ANSI escapes."""
+
+    def __init__(self, out: BinaryIO) -> None:
+        """
+        Initialize renderer, first frame clears the screen.
+
+        :param out: binary stream frames are written to
+        """
+        self._out: BinaryIO = out
+        self._shadow: List[ScreenLine] = []
+        self._cursor: Optional[Tuple[int, int]] = None  # terminal (row, col)
+        self._style: str = ""  # active SGR
+        self.bytes_written: int = 0
+
+    def reset(self) -> None:
+        """Forget the shadow screen so the next frame is drawn in full."""
+        self._shadow = []
+        self._cursor = None
+        self._style = ""
+
+    def diff(self, lines: Sequence[ScreenLine], cursor: Tuple[int, int]) -> str:
+        """
+        Escape sequences to turn the shadow screen into lines.
+
+        Shadow screen is updated to lines.
+        :param lines: next frame
+        :param cursor: (row, col) to leave cursor at
+        :return: escape sequences and text
+        """
+        parts: List[str] = []
+        if self._cursor is None:  # first frame
+            parts.append(CSI + "0m" + CSI + "2J")
+            self._style = "0"
+        blank: ScreenLine = ScreenLine("", "")
+        for row in range(max(len(lines), len(self._shadow))):
+            old: ScreenLine = self._shadow[row] if row < len(self._shadow) else blank
+            new: ScreenLine = lines[row] if row < len(lines) else blank
+            if old == new:
+                continue
+            start, end = _changed_span(old, new)
+            if start < end:
+                parts.append(self._move(row, start))
+                parts.append(self._text(new, start, end))
+                self._cursor = row, end
+            if len(new.text) < len(old.text):
+                parts.append(self._move(row, len(new.text)) + CSI + "K")
+        parts.append(self._move(*cursor))
+        self._shadow = list(lines)
+        return "".join(parts)
+
+    def render(self, lines: Sequence[ScreenLine], cursor: Tuple[int, int]) -> int:
+        """
+        Write frame in one write call.
+
+        :param lines: next frame
+        :param cursor: (row, col) to leave cursor at
+        :return: bytes written
+        """
+        data: bytes = self.diff(lines, cursor).encode("utf-8")
+        if data:
+            self._out.write(data)
+            self._out.flush()
+            self.bytes_written += len(data)
+        return len(data)
+
+    # Private
+    def _text(self, line: ScreenLine, start: int, end: int) -> str:
+        """
+        Text of line between start and end with style changes.
+
+        :param line: line to write
+        :param start: first char written
+        :param end: end of text written (exclusive)
+        :return: escape sequences and text
+        """
+        parts: List[str] = []
+        low, high = line.highlight
+        reverse: str = line.style + REVERSE
+        for part_start, part_end, style in (
+            (start, min(end, low), line.style),
+            (max(start, low), min(end, high), reverse),
+            (max(start, high, low), end, line.style),
+        ):
+            if part_start >= part_end:
+                continue
+            if style != self._style:
+                # SGR 27 ends reverse video
+                reset: str = "27;" if self._style.endswith(REVERSE) else ""
+                parts.append(CSI + reset + style + "m")
+                self._style = style
+            parts.append(line.text[part_start:part_end])
+        return "".join(parts)
+
+    def _move(self, row: int, col: int) -> str:
+        """
+        Shortest escape sequence to move the cursor.
+
+        :param row: row to move to (starts at 0)
+        :param col: column to move to (starts at 0)
+        :return: escape sequence (empty if already there)
+        """
+        previous: Optional[Tuple[int, int]] = self._cursor
+        self._cursor = row, col
+        if previous == (row, col):
+            return ""
+        absolute: str = f"{CSI}{row + 1};{col + 1}H"
+        if previous is None or previous[0] != row:
+            return absolute
+        distance: int = col - previous[1]
+        relative: str = f"{CSI}{abs(distance)}{'C' if distance > 0 else 'D'}"
+        return relative if len(relative) < len(absolute) else absolute
+
+
+def screen_lines(
+    grid: "Backend", line_start: int, top: int = 0, rows: Optional[int] = None
+) -> List[ScreenLine]:
+    """
+    Lines of the game screen.
+
+    Only the grid rows in view are built.
+    :param grid: game grid
+    :param line_start: screen row of first grid row (header is above)
+    :param top: first grid row in view
+    :param rows: grid rows in view (default NUM_OF_ROWS)
+    :return: header, blank lines up to line_start, then grid rows in view
+    """
+    if rows is None:
+        rows = grid.settings.NUM_OF_ROWS
+    # chr(9608) is black bar
+    attempts: str = "Attempts Remaining: " + f"{chr(9608)} " * grid.tries
+    lines: List[ScreenLine] = [
+        ScreenLine("Welcome to ROBCO Industries (TM) TermLink", GREEN),
+        ScreenLine("Password Required", GREEN),
+        ScreenLine(attempts, RED if grid.tries == 1 else GREEN),
+    ]
+    while len(lines) < line_start:
+        lines.append(ScreenLine("", GREEN))
+    for screen_row in range(rows):
+        # feedback column is kept at the bottom of view
+        row_str: str = grid.full_row_str(top + screen_row, screen_row - rows)
+        lines.append(ScreenLine(row_str, GREEN))
+    return lines
+
+
+def decode_keys(data: bytes) -> List[Union[str, Mouse]]:
+    """
+    Split terminal input into curses style key names and mouse events.
+
+    Arrow keys become KEY_UP, KEY_DOWN, KEY_LEFT and KEY_RIGHT, page keys
+    KEY_PPAGE and KEY_NPAGE, shift tab KEY_BTAB, home KEY_HOME, enter
+    becomes a newline and other characters
+    are returned as is. SGR mouse reports (see MOUSE_ON) become Mouse, wheel
+    events are dropped.
+    :param data: bytes read from terminal
+    :return: keys in order
+    """
+    text: str = data.decode("utf-8", "replace")
+    keys: List[Union[str, Mouse]] = []
+    index: int = 0
+    while index < len(text):
+        if text.startswith(CSI + "<", index):
+            end: int = index + 3
+            while end < len(text) and text[end] not in "Mm":
+                end += 1
+            mouse: Optional[Mouse] = _decode_mouse(text[index : end + 1])
+            if mouse is not None:
+                keys.append(mouse)
+            index = end + 1
+            continue
+        sequence: str = text[index : index + 4]
+        if sequence in KEYS:
+            keys.append(KEYS[sequence])
+            index += 4
+            continue
+        if sequence[:3] in KEYS:
+            keys.append(KEYS[sequence[:3]])
+            index += 3
+            continue
+        char: str = text[index]
+        keys.append("\n" if char == "\r" else char)
+        index += 1
+    return keys
+
+
+# Private
+def _decode_mouse(sequence: str) -> Optional[Mouse]:
+    """
+    Decode SGR mouse report, e.g. CSI + '<0;10;5M'.
+
+    :param sequence: report from CSI to final M (press) or m (release)
+    :return: mouse event, None for wheel or malformed reports
+    """
+    try:
+        button, column, line = (int(part) for part in sequence[3:-1].split(";"))
+    except ValueError:
+        return None
+    if button & _MOUSE_WHEEL:
+        return None
+    click: bool = (
+        sequence.endswith("M")
+        and not button & _MOUSE_MOTION
+        and button & _MOUSE_BUTTONS == 0
+    )
+    return Mouse(line - 1, column - 1, click)
+
+
+def _changed_span(old: ScreenLine, new: ScreenLine) -> Tuple[int, int]:
+    """
+    Part of new line that must be written over old line.
+
+    :param old: line on screen
+    :param new: line to show
+    :return: start, end (end exclusive) in new.text
+    """
+    if old.style != new.style:
+        return 0, len(new.text)
+    shortest: int = min(len(old.text), len(new.text))
+    start: int = 0
+    while start < shortest and old.text[start] == new.text[start]:
+        start += 1
+    end: int = len(new.text)
+    if len(old.text) == len(new.text):
+        while end > start and old.text[end - 1] == new.text[end - 1]:
+            end -= 1
+    if old.highlight != new.highlight:  # old and new highlight are redrawn
+        marks: List[int] = [
+            mark
+            for low, high in (old.highlight, new.highlight)
+            if low < high
+            for mark in (low, high)
+        ]
+        if marks and start < end:
+            start, end = min(start, *marks), max(end, *marks)
+        elif marks:
+            start, end = min(marks), max(marks)
+        end = min(end, len(new.text))
+    return start, end
@@ -1,10 +1,16 @@
 """Backend interface for Grid."""
-from random import randint
-from typing import List, Union, Tuple
+from typing import Collection, List, Optional, Union, Tuple, TYPE_CHECKING
 from grid._components import Components
+from grid.draws import Draws
 from grid._interactive_cols import InteractiveCols
 from grid._non_interactive_cols import NonInteractiveCols
 from grid.settings import SettingGrid
+from grid.latency import FULL_ROW_STR, HOVER, SELECT, timed
+
+if TYPE_CHECKING:
+    from grid.bucket_cache import BucketCache
+    from grid.dictionary import Dictionary
+    from grid.events import EventBus
 
 # Black styling Preferred
 # pylint: disable=c0330
@@ -14,25 +20,45 @@ class Backend:
     """Backend - contains the parts needed for the grid and interactions."""
 
     def __init__(
-        self, settings: SettingGrid, word_list: List[str], tries: int, secret: bool
+        self,
+        settings: SettingGrid,
+        word_list: Union[Collection[str], "Dictionary"],
+        tries: int,
+        secret: bool,
+        draws: Draws = Draws(),
     ):
         """
         Initialize Grid Backend.
 
         :Param settings: Game setting based on difficulty
-        :Param word_list: list of words to use for game
+        :Param word_list: list of words or Dictionary to use for game
         :Param tries: Number of tries player has
         :Param secret: enable or disable secrets
+        :Param draws: random source (every draw of the game, default a new
+        one), similarity buckets cache (default always sort) and word
+        frequencies the password and duds are drawn by, see Draws
         """
         self._tries: int = tries
-        self._tries_original: int = tries
+        # tries and secrets the game started with, see start()
+        self._started: Tuple[int, bool] = (tries, secret)
         self._state: int = 0
-        self._settings: SettingGrid = settings
-        self._non_interactive: NonInteractiveCols = NonInteractiveCols(settings)
+        self._non_interactive: NonInteractiveCols
         self._interactive: InteractiveCols
 
-        comp: Components = Components(word_list, settings)
-        self._interactive = InteractiveCols(comp, tries, secret)
+        self._events: Optional["EventBus"] = None
+        # (column, row, start, end) of entry shown in hover feedback
+        self._hovered: Optional[Tuple[int, int, int, int]] = None
+
+        comp: Components
+        duds: Optional[List[Tuple[str, int]]] = None
+        if settings.TARGET_GUESSES:
+            from grid.adaptive import pick_board  # pylint: disable=C0415
+
+            comp, duds, _ = pick_board(word_list, settings, tries, draws=draws)
+        else:
+            comp = Components(word_list, settings, None, draws)
+        self._non_interactive = NonInteractiveCols(settings, comp.rng)
+        self._interactive = InteractiveCols(comp, tries, secret, duds)
 
     @property
     def tries(self) -> int:
@@ -62,50 +88,144 @@ class Backend:
 
         :return: active loaded settings
         """
-        return self._settings
+        return self._non_interactive.settings
+
+    @property
+    def events(self) -> Optional["EventBus"]:
+        """
+        Event bus game events are published on.
+
+        :return: event bus or None
+        """
+        return self._events
+
+    def start(self, events: Optional["EventBus"] = None) -> None:
+        """
+        Publish game events on events from now on, starting with GameStarted.
+
+        Call once subscribers are attached, so they see the whole game.
+        :param events: event bus (default none, nothing is published)
+        """
+        self._events = events
+        if events is not None:
+            from grid.events import GameStarted  # pylint: disable=C0415
+
+            events.publish(GameStarted(*self._started))
+
+    @property
+    def cache(self) -> Optional["BucketCache"]:
+        """
+        Similarity buckets cache the board was built with.
+
+        :return: cache (e.g. a NeighbourIndex) or None
+        """
+        return self._interactive.draws.cache
+
+    @property
+    def revision(self) -> int:
+        """
+        Change counter of board and feedback, redraw when it moves.
+
+        Every change to the board comes with feedback.
+        :return: number of changes
+        """
+        return self._non_interactive.revision
+
+    def span(self, column: int, row: int, place: int) -> Tuple[int, int]:
+        """
+        Span of the entry under place.
 
-    def full_row_str(self, row: int) -> str:
+        :param column: Active column in use (0 is left most)
+        :param row: row in column
+        :param place: char place in row
+        :return: start, end (inclusive) of word or secret, (place, place) for a char
+        """
+        return self._interactive.entry_span(column, row, place)
+
+    def next_entry(
+        self, column: int, row: int, place: int, step: int = 1, secrets: bool = False
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        Entry step entries after place (before when negative) in address order.
+
+        :param column: Active column in use (0 is left most)
+        :param row: row in column
+        :param place: char place in row
+        :param step: entries to move, negative moves back
+        :param secrets: only count secrets (T/F)
+        :return: column, row, start of entry, None when there is none that way
+        """
+        return self._interactive.next_entry(column, row, place, step, secrets)
+
+    def entry_words(self) -> List[str]:
+        """
+        Words of duds and password still on the board.
+
+        :return: words in address order
+        """
+        return self._interactive.entry_words()
+
+    @timed(FULL_ROW_STR)
+    def full_row_str(self, row: int, screen_row: Optional[int] = None) -> str:
         """
         Entire row over all columns.
 
+        Only the lines of row are built, so large grids cost the same per row.
         :param row: column number to print (col starts at 0)
+        :param screen_row: feedback row shown next to row (default row),
+        negative counts up from hover row, blank outside feedback column
         :return: column string
         """
-        if row >= self._settings.NUM_OF_ROWS:
+        if row >= self.settings.NUM_OF_ROWS:
             raise IndexError(f"col ({row}) is above range")
         if row < 0:
             raise IndexError(f"col ({row}) is below range")
-        return (
-            self._non_interactive.left_hex[row]
-            + " "
-            + self._interactive.left_active_col[row]
-            + " "
-            + self._non_interactive.right_hex[row]
-            + " "
-            + self._interactive.right_active_col[row]
-            + " "
-            + self._non_interactive.feedback_col[row]
-        )
-
-    def hover(self, right: bool, row: int, place: int) -> None:
+        feedback_col: Tuple[str, ...] = self._non_interactive.feedback_col
+        if screen_row is None:
+            screen_row = row
+        if -len(feedback_col) <= screen_row < len(feedback_col):
+            feedback: str = feedback_col[screen_row]
+        else:
+            feedback = " " * self.settings.FEEDBACK_LINE_SIZE
+        parts: List[str] = []
+        for column in range(self.settings.COLUMNS):
+            parts.append(self._non_interactive.hex_line(column, row))
+            parts.append(self._interactive.active_line(column, row))
+        parts.append(feedback)
+        return " ".join(parts)
+
+    @timed(HOVER)
+    def hover(self, column: int, row: int, place: int) -> bool:
         """
         Update feedback when hovering.
 
-        :param right: Active column in use (t/f)
+        Nothing is done while the same entry stays hovered.
+        :param column: Active column in use (0 is left most)
         :param row: row in column
         :param place: what entry are we selecting from row
         Place starts at 0 for first Entry
+        :return: was feedback changed (T/F)
         """
         self._select_and_hover_guard()
+        start, end = self._interactive.entry_span(column, row, place)
+        if (column, row, start, end) == self._hovered:
+            return False
+        self._hovered = column, row, start, end
         word: str
-        word, _ = self._interactive.select_char(right, row, place)
+        word, _ = self._interactive.select_char(column, row, place)
         self._non_interactive.add_feedback(word, True)
+        if self._events is not None:
+            from grid.events import Hovered  # pylint: disable=C0415
+
+            self._events.publish(Hovered(column, row, place, word))
+        return True
 
-    def select(self, right: bool, row: int, place: int) -> str:
+    @timed(SELECT)
+    def select(self, column: int, row: int, place: int) -> str:
         """
         Run a selected entry and update feedback.
 
-        :param right: Active column in use (t/f)
+        :param column: Active column in use (0 is left most)
         :param row: row in column
         :param place: what entry are we selecting from row
         Place starts at 0 for first Entry
@@ -117,11 +237,13 @@ class Backend:
         'l' -> Terminal Locked (Game Lost)
         """
         self._select_and_hover_guard()
+        self._hovered = None  # select clears hover feedback
         feedback_items: Tuple[str, ...]
         return_char: str
         word: str
         similarity: Union[int, str]
-        word, similarity = self._interactive.select_char(right, row, place)
+        word, similarity = self._interactive.select_char(column, row, place)
+        secret: Tuple[str, str] = ("", "")  # see _use_secret
 
         # Only Secrets front counts as Secret
         if similarity == "e":  # error
@@ -132,20 +254,10 @@ class Backend:
             return_char = "p"
             self._state = 1
         elif similarity == "s":  # secret
-            self._interactive.inactivate_secret(right, row)
+            self._interactive.inactivate_secret(column, row, place)
+            secret = self._use_secret()
+            feedback_items = word, secret[0]
             return_char = "s"
-            action: int = randint(0, 2)
-            feedback_action: str
-            if action == 0:  # Reset Tries
-                self._tries = self._tries_original
-                feedback_action = "Tries Reset"
-            elif action in (1, 2):  # Remove DUD
-                # Prefer removed dud action over reset tries
-                self._interactive.remove_random_dud()
-                feedback_action = "Dud Removed"
-            else:
-                raise ValueError("Invalid action selected")
-            feedback_items = word, feedback_action
         elif isinstance(similarity, int):  # dud
             if similarity < 0:
                 raise RuntimeError(f"Negative Similarity Value ({similarity})")
@@ -163,9 +275,59 @@ class Backend:
 
         for feedback_word in feedback_items:
             self._non_interactive.add_feedback(feedback_word, False)
+        if self._events is not None:
+            selected = column, row, place, word, return_char, similarity
+            self._publish_select(self._events, selected, secret)
         return return_char
 
     # Private
+    def _use_secret(self) -> Tuple[str, str]:
+        """
+        Reset tries or remove a dud at random.
+
+        :return: feedback action, dud removed ("" when none was)
+        """
+        action: int = self._interactive.rng.randint(0, 2)
+        if action == 0:  # Reset Tries
+            self._tries = self._started[0]
+            return "Tries Reset", ""
+        if action in (1, 2):  # Remove DUD
+            # Prefer removed dud action over reset tries
+            removed: bool = self._interactive.remove_random_dud()
+            return "Dud Removed", self._interactive.removed[-1] if removed else ""
+        raise ValueError("Invalid action selected")
+
+    def _publish_select(
+        self,
+        events: "EventBus",
+        selected: Tuple[int, int, int, str, str, Union[int, str]],
+        secret: Tuple[str, str],
+    ) -> None:
+        """
+        Publish Selected and the events it led to.
+
+        :param events: event bus
+        :param selected: column, row, place, word, select return code and
+        similarity
+        :param secret: feedback action and dud removed of a used secret
+        """
+        from grid import events as ev  # pylint: disable=C0415
+
+        word: str = selected[3]
+        published: List[ev.Event] = [ev.Selected(*selected)]
+        if selected[4] == "p":
+            published.append(ev.GameWon(word, self._tries))
+        elif selected[4] == "l":
+            published.append(ev.GameLost(word))
+        elif selected[4] == "s":
+            published.append(ev.SecretUsed(word, secret[0]))
+            if secret[0] == "Tries Reset":
+                published.append(ev.TriesReset(self._tries))
+            else:
+                published.append(ev.DudRemoved(self._interactive.duds_left, secret[1]))
+        for event in published:
+            events.publish(event)
+
     def _select_and_hover_guard(self) -> None:
         """Guard for hover and select."""
         if self.game_state == 1:
@@ -0,0 +1,158 @@
+"""
+Ready to play boards streamed from one word list.
+
+The word list is bucketed once, its trimmed range, similarity buckets and
+letter counts are shared by every board, so boards after the first only
+draw a password and duds. Boards can be built ahead on a worker thread
+(servers, kiosks and simulators wanting a steady supply).
+"""
+import queue
+import random
+import threading
+import weakref
+from typing import Callable, Collection, Iterator, Optional, Union
+from grid.backend import Backend
+from grid.bucket_cache import BucketCache
+from grid.dictionary import Dictionary
+from grid.draws import Draws
+from grid.settings import SettingGrid
+from grid.word_sources import load
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Boards tried in a row before the word list is given up on
+ATTEMPTS: int = 8
+# Seconds the worker waits on a full queue before checking for a stop
+_POLL: float = 0.05
+
+WordSource = Union[str, Collection[str], Dictionary]  # path, words or Dictionary
+
+
+def boards(
+    settings: SettingGrid,
+    word_source: WordSource,
+    tries: int,
+    secret: bool,
+    draws: Draws = Draws(),
+) -> Iterator[Backend]:
+    """
+    Stream new boards of one word list, without end.
+
+    The word list is loaded and bucketed here, once. Every board draws
+    from its own random.Random, seeded from draws.rng: a seeded rng makes
+    the stream repeat its boards (passwords, duds, places and addresses)
+    and the random module is never used. See prefetch to build ahead.
+    :param settings: Game setting based on difficulty
+    :param word_source: word list file (see word_sources.load), words or
+    Dictionary
+    :param tries: Number of tries player has
+    :param secret: enable or disable secrets
+    :param draws: stream random source (default different every time),
+    similarity buckets cache (default in memory, one entry per pass_pool
+    password) and word frequencies, see Backend
+    :return: iterator of boards, not started (see Backend.start)
+    """
+    dictionary: Dictionary
+    if isinstance(word_source, Dictionary):
+        dictionary = word_source
+    elif isinstance(word_source, str):
+        dictionary = load(word_source, settings.MIN, settings.MAX)
+    else:
+        dictionary = Dictionary(word_source, settings.MIN, settings.MAX)
+    if draws.cache is None:
+        draws = draws._replace(cache=BucketCache("", memory=len(settings.pass_pool)))
+    dictionary.range(settings.MIN, settings.MAX)  # shared by every board
+    if settings.TARGET_GUESSES and settings.LIKENESS == "positional":
+        dictionary.letter_counts(settings.MIN, settings.MAX)  # see pick_board
+    seeds: random.Random = draws.rng or random.Random()
+
+    def build() -> Backend:
+        failed: Optional[RuntimeError] = None
+        for _ in range(ATTEMPTS):
+            rng: random.Random = random.Random(seeds.getrandbits(64))
+            try:
+                board: Backend = Backend(
+                    settings, dictionary, tries, secret, draws._replace(rng=rng)
+                )
+                board.entry_words()  # entries placed now, not when first shown
+                return board
+            except RuntimeError as error:  # drawn password has too few duds
+                failed = error
+        raise RuntimeError(f"No board in {ATTEMPTS} attempts") from failed
+
+    return _built(build)
+
+
+def prefetch(stream: Iterator[Backend], ahead: int) -> Iterator[Backend]:
+    """
+    Build boards of a stream on a worker from now on, up to ahead waiting.
+
+    A failed build is raised by the returned stream, the worker stops when
+    it is closed or dropped. The worker is the only user of stream.
+    :param stream: boards (see boards)
+    :param ahead: boards kept ready, 0 builds them when asked for
+    :return: iterator of boards
+    """
+    if ahead < 0:
+        raise ValueError("ahead must be 0 or more")
+    if not ahead:
+        return stream
+    return _prefetched(stream.__next__, ahead)
+
+
+# Private
+def _built(build: Callable[[], Backend]) -> Iterator[Backend]:
+    """
+    Build boards when asked for.
+
+    :param build: board builder
+    :return: iterator of boards
+    """
+    while True:
+        yield build()
+
+
+def _prefetched(build: Callable[[], Backend], ahead: int) -> Iterator[Backend]:
+    """
+    Build boards on a worker from now on, up to ahead boards waiting.
+
+    :param build: board builder
+    :param ahead: boards kept ready
+    :return: iterator of boards
+    """
+    ready: "queue.Queue[Union[Backend, Exception]]" = queue.Queue(ahead)
+    stop: threading.Event = threading.Event()
+
+    def work() -> None:
+        while not stop.is_set():
+            board: Union[Backend, Exception]
+            try:
+                board = build()
+            except Exception as error:  # pylint: disable=W0703
+                board = error
+            while not stop.is_set():
+                try:
+                    ready.put(board, timeout=_POLL)
+                    break
+                except queue.Full:
+                    continue
+            if isinstance(board, Exception):
+                return
+
+    def stream() -> Iterator[Backend]:
+        try:
+            while True:
+                board: Union[Backend, Exception] = ready.get()
+                if isinstance(board, StopIteration):  # stream ran out
+                    return
+                if isinstance(board, Exception):
+                    raise board
+                yield board
+        finally:
+            stop.set()
+
+    threading.Thread(target=work, name="grid-boards", daemon=True).start()
+    boards_ahead: Iterator[Backend] = stream()
+    weakref.finalize(boards_ahead, stop.set)  # never started streams
+    return boards_ahead
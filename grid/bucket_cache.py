@@ -0,0 +1,266 @@
+"""
+Similarity buckets cached on disk, keyed by dictionary content and password.
+
+For a fixed dictionary the buckets of a password never change, so they are
+worked out once and only the shuffle and selection happen at game start.
+Files are evicted least recently used first once the directory grows past
+max_bytes, recent buckets are also kept in memory.
+"""
+import os
+import zlib
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Collection, Dict, List, Optional, Tuple
+from grid._word_tools import similarity_sort
+from grid.dictionary import WordRange, digest
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Cache directory used instead of the default
+CACHE_DIR_ENV: str = "PREWAR_LOGIN_CACHE"
+# Bytes of bucket files kept on disk
+MAX_BYTES: int = 64 * 1024 * 1024
+# Buckets kept in memory
+MEMORY_ENTRIES: int = 32
+# Bumped when the file layout changes, old files are never read
+VERSION: int = 1
+SUFFIX: str = ".buckets"
+
+Buckets = Tuple[Dict[int, List[str]], bool]  # see _word_tools.similarity_sort
+
+
+def cache_dir() -> str:
+    """
+    Find default cache directory.
+
+    :return: $PREWAR_LOGIN_CACHE, else prewar_login_game in $XDG_CACHE_HOME
+    or ~/.cache
+    """
+    if CACHE_DIR_ENV in os.environ:
+        return os.environ[CACHE_DIR_ENV]
+    base: str = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "prewar_login_game")
+
+
+def fingerprint(words: Collection[str]) -> str:
+    """
+    Content hash of a word collection, the same whatever its order.
+
+    blake2b of the sorted words (see dictionary.digest), a Dictionary range
+    reuses the hashes of its length buckets so no word is read again.
+    :param words: different words (e.g. trimmed dictionary)
+    :return: hex digest
+    """
+    return (words.digest() if isinstance(words, WordRange) else digest(words)).hex()
+
+
+class BucketCache:
+    """BucketCache - similarity buckets in memory and on disk."""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = MAX_BYTES,
+        memory: int = MEMORY_ENTRIES,
+    ) -> None:
+        """
+        Initialize cache, directory is made when first written.
+
+        :param directory: where bucket files are kept (default cache_dir(),
+        memory only when empty)
+        :param max_bytes: bytes of bucket files kept, least recently used are
+        removed first
+        :param memory: buckets kept in memory
+        """
+        if max_bytes < 0 or memory < 0:
+            raise ValueError("max_bytes and memory must be 0 or more")
+        self.directory: str = cache_dir() if directory is None else directory
+        self._max_bytes: int = max_bytes
+        self._memory: int = memory
+        self._recent: "OrderedDict[str, Buckets]" = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def buckets(self, words: Collection[str], password: str, mode: str) -> Buckets:
+        """
+        Similarity buckets of words, from cache or worked out and cached.
+
+        Bucket lists are shared with the cache, they must not be changed.
+        :param words: different words (e.g. trimmed dictionary)
+        :param password: word to compare against
+        :param mode: likeness mode, see settings.LIKENESS_MODES
+        :return: dictionary with similarity count as keys, was threshold met?
+        """
+        key: str = self.key(fingerprint(words), password, mode)
+        found: Optional[Buckets] = self.get(key)
+        if found is not None:
+            self.hits += 1
+            return dict(found[0]), found[1]
+        self.misses += 1
+        result: Buckets = similarity_sort(words, password, mode)
+        self.put(key, result)
+        return dict(result[0]), result[1]
+
+    @staticmethod
+    def key(words_fingerprint: str, password: str, mode: str) -> str:
+        """
+        Cache key of the buckets of a password.
+
+        :param words_fingerprint: fingerprint() of the words
+        :param password: word compared against
+        :param mode: likeness mode
+        :return: hex digest
+        """
+        content: str = f"{VERSION}\n{words_fingerprint}\n{mode}\n{password}"
+        return blake2b(content.encode(), digest_size=20).hexdigest()
+
+    def get(self, key: str) -> Optional[Buckets]:
+        """
+        Look up cached buckets, memory first then disk.
+
+        Unreadable files count as missing and are removed.
+        :param key: see key()
+        :return: buckets, None when not cached
+        """
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            return self._recent[key]
+        if not self.directory:
+            return None
+        path: str = self._path(key)
+        try:
+            with open(path, "rb") as cached:
+                found: Buckets = _decode(cached.read())
+            os.utime(path)  # most recently used
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error):
+            _remove(path)
+            return None
+        self._remember(key, found)
+        return found
+
+    def put(self, key: str, buckets: Buckets) -> None:
+        """
+        Cache buckets in memory and on disk, disk errors are ignored.
+
+        :param key: see key()
+        :param buckets: dictionary with similarity count as keys, was threshold met?
+        """
+        self._remember(key, buckets)
+        if not self.directory:
+            return
+        path: str = self._path(key)
+        temporary: str = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary, "wb") as cached:
+                cached.write(_encode(buckets))
+            os.replace(temporary, path)  # readers never see part of a file
+        except OSError:
+            _remove(temporary)
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached bucket, in memory and on disk."""
+        self._recent.clear()
+        for path, _, _ in self._files():
+            _remove(path)
+
+    # Private
+    def _path(self, key: str) -> str:
+        """
+        File of a key.
+
+        :param key: see key()
+        :return: path
+        """
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def _remember(self, key: str, buckets: Buckets) -> None:
+        """
+        Keep buckets in memory, forgetting the least recently used.
+
+        :param key: see key()
+        :param buckets: buckets
+        """
+        self._recent[key] = buckets
+        self._recent.move_to_end(key)
+        while len(self._recent) > self._memory:
+            self._recent.popitem(last=False)
+
+    def _files(self) -> List[Tuple[str, float, int]]:
+        """
+        Bucket files on disk.
+
+        :return: list (path, last used, bytes)
+        """
+        found: List[Tuple[str, float, int]] = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return found
+        for entry in entries:
+            if entry.name.endswith(SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:  # removed by another game
+                    continue
+                found.append((entry.path, stat.st_mtime, stat.st_size))
+        return found
+
+    def _evict(self) -> None:
+        """Remove least recently used files until they fit in max_bytes."""
+        files: List[Tuple[str, float, int]] = self._files()
+        total: int = sum(size for _, _, size in files)
+        for path, _, size in sorted(files, key=lambda file: file[1]):
+            if total <= self._max_bytes:
+                break
+            _remove(path)
+            total -= size
+
+
+def _encode(buckets: Buckets) -> bytes:
+    """
+    Compact file form of buckets.
+
+    Threshold line, then one line per bucket: similarity and its words.
+    :param buckets: dictionary with similarity count as keys, was threshold met?
+    :return: zlib compressed text
+    """
+    lines: List[str] = [str(int(buckets[1]))]
+    lines += [f"{sim} " + " ".join(words) for sim, words in buckets[0].items()]
+    return zlib.compress("\n".join(lines).encode())
+
+
+def _decode(data: bytes) -> Buckets:
+    """
+    Buckets from their file form.
+
+    :param data: see _encode
+    :return: dictionary with similarity count as keys, was threshold met?
+    """
+    lines: List[str] = zlib.decompress(data).decode().split("\n")
+    if lines[0] not in ("0", "1"):
+        raise ValueError("Not a bucket file")
+    similarity: Dict[int, List[str]] = {}
+    for line in lines[1:]:
+        sim, *words = line.split(" ")
+        similarity[int(sim)] = words
+    return similarity, lines[0] == "1"
+
+
+def _remove(path: str) -> None:
+    """
+    Remove a file if it is still there.
+
+    :param path: file
+    """
+    try:
+        os.remove(path)
+    except OSError:
+        pass
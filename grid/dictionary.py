@@ -0,0 +1,306 @@
+"""
+Word list lowercased, deduplicated and split by word length once.
+
+Boards of every difficulty can be built from one Dictionary, each
+(min, max) range is a view over the length buckets instead of a new scan
+of the whole word list.
+"""
+
+from itertools import chain
+from typing import AbstractSet, Collection, Dict, Iterable, Iterator, List
+from typing import Optional, Set, Tuple, TYPE_CHECKING
+from grid._word_tools import WORD, trim
+from grid.packed import bucket_similarity
+
+if TYPE_CHECKING:
+    from grid.letter_counts import LetterCounts
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Bytes of each blake2b digest
+DIGEST_SIZE: int = 16
+
+
+def digest(words: Iterable[str]) -> bytes:
+    """
+    Content hash of different words, the same whatever their order.
+
+    Words of each length are sorted and hashed with blake2b, then the
+    hashes of the lengths, shortest first, so a Dictionary range reuses
+    the hashes of its buckets (see WordRange.digest).
+    :param words: different words
+    :return: blake2b digest
+    """
+    buckets: Dict[int, Set[str]] = {}
+    for word in words:
+        buckets.setdefault(len(word), set()).add(word)
+    return _combine(bucket_digest(buckets[length]) for length in sorted(buckets))
+
+
+def bucket_digest(words: Iterable[str]) -> bytes:
+    """
+    Hash of different words of one length.
+
+    :param words: different words
+    :return: blake2b digest of the sorted words, one per line
+    """
+    return _blake2b("\n".join(sorted(words)).encode())
+
+
+class Dictionary:
+    """Dictionary - words bucketed by length, served by (min, max) range."""
+
+    def __init__(
+        self, words: Iterable[str], minimum: int = 1, maximum: Optional[int] = None
+    ) -> None:
+        """
+        Lowercase, deduplicate and bucket words by length in one pass.
+
+        Words are streamed, only the buckets are kept, so a word list file
+        is never held whole (see word_sources). Words other than letters a
+        to z once lowercased (see _word_tools.WORD) are dropped.
+        :param words: source list of words
+        :param minimum: shortest word kept
+        :param maximum: longest word kept (default every length)
+        """
+        by_length: Dict[int, Set[str]] = {}
+        for word in map(str.lower, words):
+            size: int = len(word)
+            if size < minimum or (maximum is not None and size > maximum):
+                continue
+            if not WORD.fullmatch(word):
+                continue
+            if size not in by_length:
+                by_length[size] = set()
+            by_length[size].add(word)
+        self._set_buckets(by_length)
+
+    @classmethod
+    def from_buckets(cls, buckets: Dict[int, Set[str]]) -> "Dictionary":
+        """
+        Build a dictionary of words already lowercased and bucketed.
+
+        :param buckets: length -> words of that length, kept not copied (e.g.
+        read from an index)
+        :return: dictionary
+        """
+        dictionary: Dictionary = cls(())
+        dictionary._set_buckets(buckets)
+        return dictionary
+
+    @property
+    def lengths(self) -> Tuple[int, ...]:
+        """
+        Word lengths in dictionary.
+
+        :return: lengths, shortest first
+        """
+        return tuple(self._buckets)
+
+    def bucket(self, length: int) -> AbstractSet[str]:
+        """
+        Words of a length.
+
+        :param length: letters in word
+        :return: words, empty when there are none
+        """
+        return self._buckets.get(length, frozenset())
+
+    def range(self, minimum: int, maximum: int) -> "WordRange":
+        """
+        Words between minimum and maximum letters, a view of the buckets.
+
+        Views are cached, the same range is the same view.
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        :return: view of words in range
+        """
+        key: Tuple[int, int] = (minimum, maximum)
+        if key not in self._ranges:
+            self._ranges[key] = WordRange(self, minimum, maximum)
+        return self._ranges[key]
+
+    def letter_counts(self, minimum: int, maximum: int) -> "LetterCounts":
+        """
+        Letter counts of words between minimum and maximum letters, cached.
+
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        :return: letter counts of the range
+        """
+        key: Tuple[int, int] = (minimum, maximum)
+        if key not in self._letter_counts:
+            from grid.letter_counts import LetterCounts  # pylint: disable=C0415
+
+            self._letter_counts[key] = LetterCounts(self.range(minimum, maximum))
+        return self._letter_counts[key]
+
+    def digest(self, length: int) -> bytes:
+        """
+        Hash of words of a length, worked out once.
+
+        :param length: letters in word
+        :return: see bucket_digest()
+        """
+        if length not in self._digests:
+            self._digests[length] = bucket_digest(self.bucket(length))
+        return self._digests[length]
+
+    def __len__(self) -> int:
+        """
+        Words in dictionary.
+
+        :return: number of words
+        """
+        return sum(map(len, self._buckets.values()))
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Words in dictionary, shortest first.
+
+        :return: iterator of words
+        """
+        return chain.from_iterable(self._buckets.values())
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Word in dictionary (lowercase).
+
+        :param word: word
+        :return: T/F
+        """
+        return isinstance(word, str) and word in self.bucket(len(word))
+
+    # Private
+    def _set_buckets(self, buckets: Dict[int, Set[str]]) -> None:
+        """
+        Keep buckets, shortest first, and forget cached ranges and counts.
+
+        :param buckets: length -> words of that length
+        """
+        self._buckets: Dict[int, AbstractSet[str]] = {
+            length: buckets[length] for length in sorted(buckets) if buckets[length]
+        }
+        self._digests: Dict[int, bytes] = {}
+        self._ranges: Dict[Tuple[int, int], "WordRange"] = {}
+        self._letter_counts: Dict[Tuple[int, int], "LetterCounts"] = {}
+
+
+class WordRange(Collection[str]):
+    """WordRange - words of a Dictionary between two lengths, nothing copied."""
+
+    def __init__(self, dictionary: Dictionary, minimum: int, maximum: int) -> None:
+        """
+        Initialize view, use Dictionary.range.
+
+        :param dictionary: dictionary viewed
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        """
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+        self._dictionary: Dictionary = dictionary
+        self._lengths: Tuple[int, ...] = tuple(
+            length for length in dictionary.lengths if minimum <= length <= maximum
+        )
+        self._size: int = sum(len(dictionary.bucket(size)) for size in self._lengths)
+
+    def digest(self) -> bytes:
+        """
+        Hash of words in range, combined from cached bucket hashes.
+
+        :return: see digest()
+        """
+        return _combine(map(self._dictionary.digest, self._lengths))
+
+    def buckets(self) -> Iterator[AbstractSet[str]]:
+        """
+        Words in range, one set per length, shortest first.
+
+        :return: iterator of word sets
+        """
+        return map(self._dictionary.bucket, self._lengths)
+
+    def similarity_sort(self, compare_string: str) -> Dict[int, List[str]]:
+        """
+        Separate words in range by positional likeness to compare_string.
+
+        Same buckets as _word_tools.similarity_sort in positional mode, each
+        length is compared at once (see packed.bucket_similarity).
+        :param compare_string: string to compare against
+        :return: dictionary with likeness as keys, compare_string left out
+        """
+        buckets: Dict[int, List[str]] = {}
+        for bucket in self.buckets():
+            for matched, words in bucket_similarity(bucket, compare_string).items():
+                buckets.setdefault(matched, []).extend(words)
+        return buckets
+
+    def __len__(self) -> int:
+        """
+        Words in range.
+
+        :return: number of words
+        """
+        return self._size
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Words in range, shortest first.
+
+        :return: iterator of words
+        """
+        return chain.from_iterable(self.buckets())
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Word in range (lowercase).
+
+        :param word: word
+        :return: T/F
+        """
+        return (
+            isinstance(word, str)
+            and self.minimum <= len(word) <= self.maximum
+            and word in self._dictionary
+        )
+
+
+def trimmed(minimum: int, maximum: int, word_list: Iterable[str]) -> Collection[str]:
+    """
+    Different lowercase words between minimum and maximum letters.
+
+    A Dictionary serves its cached view, other word lists are scanned
+    (see _word_tools.trim).
+    :param minimum: minimum letters allowed in a word.
+    :param maximum: maximum letters allowed in a word.
+    :param word_list: Dictionary or source list of words
+    :return: words in range
+    """
+    if isinstance(word_list, Dictionary):
+        return word_list.range(minimum, maximum)
+    return trim(minimum, maximum, word_list)
+
+
+# Private
+def _combine(digests: Iterable[bytes]) -> bytes:
+    """
+    Hash bucket hashes, shortest words first.
+
+    :param digests: bucket_digest() of each length
+    :return: blake2b digest
+    """
+    return _blake2b(b"".join(digests))
+
+
+def _blake2b(data: bytes) -> bytes:
+    """
+    Hash bytes, hashlib is imported when first needed.
+
+    :param data: bytes hashed
+    :return: blake2b digest
+    """
+    from hashlib import blake2b  # pylint: disable=C0415
+
+    return blake2b(data, digest_size=DIGEST_SIZE).digest()
@@ -0,0 +1,30 @@
+"""
+What a board's password and duds are drawn with.
+
+Backend, board_stream.boards and adaptive.pick_board take one Draws
+instead of a parameter each, fields left out keep their defaults.
+"""
+import random
+from typing import NamedTuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from grid.bucket_cache import BucketCache
+    from grid.frequency import Frequencies
+    from grid.letter_counts import LetterCounts
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+
+class Draws(NamedTuple):
+    """Data container for what a board's password and duds are drawn with."""
+
+    # random source of every draw of a board (default a new one), the
+    # random module is never used
+    rng: Optional[random.Random] = None
+    cache: Optional["BucketCache"] = None  # similarity buckets (default sort)
+    frequencies: Optional["Frequencies"] = None  # word weights (default uniform)
+    # letter counts of the trimmed words, passwords with too few high duds
+    # are then rejected (or drawn again) before any scan (positional
+    # likeness, see Dictionary.letter_counts)
+    counts: Optional["LetterCounts"] = None
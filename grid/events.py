@@ -0,0 +1,261 @@
+"""
+Game events published by the backend.
+
+Events are queued and handed to subscribers on a worker thread, so logging,
+metrics, replays and spectators never slow down the input path.
+"""
+import queue
+import threading
+from typing import Callable, List, NamedTuple, Optional, Union
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+
+class GameStarted(NamedTuple):
+    """Board is ready."""
+
+    tries: int
+    secrets: bool
+
+
+class Hovered(NamedTuple):
+    """Player hovered over an entry."""
+
+    column: int  # active column, 0 is left most
+    row: int
+    place: int
+    word: str  # word or char under cursor
+
+
+class Selected(NamedTuple):
+    """Player selected an entry."""
+
+    column: int  # active column, 0 is left most
+    row: int
+    place: int
+    word: str  # word or char selected
+    result: str  # Backend.select return code
+    similarity: Union[int, str]
+
+
+class SecretUsed(NamedTuple):
+    """Secret was selected and used."""
+
+    secret: str
+    action: str  # feedback shown
+
+
+class DudRemoved(NamedTuple):
+    """A random dud was removed from grid."""
+
+    duds_left: bool
+    word: str = ""  # dud removed, empty when there was none
+
+
+class TriesReset(NamedTuple):
+    """Tries set back to original count."""
+
+    tries: int
+
+
+class GameWon(NamedTuple):
+    """Password found."""
+
+    password: str
+    tries: int
+
+
+class GameLost(NamedTuple):
+    """Attempts exhausted."""
+
+    word: str  # last guess
+
+
+Event = Union[
+    GameStarted,
+    Hovered,
+    Selected,
+    SecretUsed,
+    DudRemoved,
+    TriesReset,
+    GameWon,
+    GameLost,
+]
+Subscriber = Callable[[Event], None]
+
+
+class EventWorker:
+    """EventWorker - daemon thread handing queued events to a handler in batches."""
+
+    def __init__(
+        self, handle: Callable[[List[Event]], None], name: str, maxsize: int = 0
+    ) -> None:
+        """
+        Initialize worker and start its thread.
+
+        :param handle: called on the worker with the events queued since its
+        last call, oldest first, errors it raises are counted (see failed)
+        :param name: thread name
+        :param maxsize: events queued before new events are dropped (default
+        no limit)
+        """
+        self._handle: Callable[[List[Event]], None] = handle
+        self._queue: "queue.Queue[Optional[Event]]" = queue.Queue(maxsize)
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: int = 0  # events queued or being handled
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._run, name=name, daemon=True
+        )
+        self.errors: int = 0  # handler errors, the worker kept running
+        self.last_error: Optional[Exception] = None
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """
+        Events queued or being handled.
+
+        :return: number of events
+        """
+        return self._pending
+
+    @property
+    def closed(self) -> bool:
+        """
+        Worker was stopped.
+
+        :return: T/F
+        """
+        return self._thread is None
+
+    def put(self, event: Event) -> bool:
+        """
+        Queue event for the handler, never blocks.
+
+        :param event: event to handle
+        :return: was event queued (False when closed or the queue is full)
+        """
+        if self._thread is None:
+            return False
+        with self._lock:
+            self._pending += 1
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._lock:
+                self._pending -= 1
+            return False
+        return True
+
+    def failed(self, error: Exception) -> None:
+        """
+        Count an error of the handler, for handlers carrying on past it.
+
+        :param error: error raised
+        """
+        self.errors += 1
+        self.last_error = error
+
+    def flush(self) -> None:
+        """Wait until every queued event has been handled."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Handle queued events and stop the worker."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    # Private
+    def _run(self) -> None:
+        """Worker loop, hands every queued event to the handler at once."""
+        while True:
+            batch: List[Optional[Event]] = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            events: List[Event] = [event for event in batch if event is not None]
+            try:
+                if events:
+                    self._handle(events)
+            except Exception as error:  # pylint: disable=W0703
+                self.failed(error)
+            finally:
+                with self._lock:
+                    self._pending -= len(events)
+                for _ in batch:
+                    self._queue.task_done()
+            if len(events) < len(batch):  # closed
+                return
+
+
+class EventBus:
+    """EventBus - bounded queue of events dispatched on a worker thread."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize event bus, worker starts on first subscriber.
+
+        :param maxsize: events queued before new events are dropped
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be 1 or more")
+        self._maxsize: int = maxsize
+        self._subscribers: List[Subscriber] = []
+        self._worker: Optional[EventWorker] = None
+        self.dropped: int = 0  # events lost to a full queue
+        self.errors: int = 0  # subscriber calls that raised
+        self.last_error: Optional[Exception] = None
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """
+        Call subscriber with every event published from now on.
+
+        :param subscriber: called on the worker thread
+        Exceptions raised by subscriber are counted in errors and last_error.
+        """
+        self._subscribers.append(subscriber)
+        if self._worker is None:
+            self._worker = EventWorker(self._dispatch, "grid-events", self._maxsize)
+
+    def publish(self, event: Event) -> bool:
+        """
+        Queue event for subscribers, never blocks.
+
+        :param event: event to publish
+        :return: was event queued (False if no subscribers or queue full)
+        """
+        if self._worker is None or self._worker.closed:
+            return False
+        if not self._worker.put(event):
+            self.dropped += 1
+            return False
+        return True
+
+    def flush(self) -> None:
+        """Wait until every queued event has been dispatched."""
+        if self._worker is not None:
+            self._worker.flush()
+
+    def close(self) -> None:
+        """Dispatch queued events and stop the worker."""
+        if self._worker is not None:
+            self._worker.close()
+
+    # Private
+    def _dispatch(self, events: List[Event]) -> None:
+        """
+        Hand events to every subscriber, on the worker.
+
+        :param events: events in the order published
+        """
+        for event in events:
+            for subscriber in list(self._subscribers):
+                try:
+                    subscriber(event)
+                except Exception as error:  # pylint: disable=W0703
+                    self.errors += 1
+                    self.last_error = error
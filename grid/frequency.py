@@ -0,0 +1,184 @@
+"""
+Word frequency weighted sampling with Walker alias tables.
+
+An alias table is built once per word list in O(n), every draw after that
+is O(1): one random column, one biased coin. Tables are kept for word
+lists that stay in memory, e.g. buckets of the bucket cache and pass_pool.
+"""
+import random
+from collections import OrderedDict
+from math import log
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Weights are frequency ** POWER, common words win without the same few
+# words on every board
+POWER: float = 0.5
+# Alias tables kept
+TABLES: int = 64
+# Failed draws (word already drawn) allowed per word wanted before the
+# rest are drawn by sorting
+RETRIES: int = 8
+
+_RNG: random.Random = random.Random()
+
+
+class AliasTable:
+    """AliasTable - Walker alias method, O(1) draws of weighted indexes."""
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Build table (Vose), each column holds at most two indexes.
+
+        :param weights: weight of each index, not negative, some positive
+        """
+        size: int = len(weights)
+        self.total: float = float(sum(weights))
+        if not size or self.total <= 0 or min(weights) < 0:
+            raise ValueError("weights must not be negative and total above 0")
+        scaled: List[float] = [weight * size / self.total for weight in weights]
+        self._probability: List[float] = [1.0] * size
+        self._alias: List[int] = list(range(size))
+        small: List[int] = [index for index, value in enumerate(scaled) if value < 1]
+        large: List[int] = [index for index, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            low: int = small.pop()
+            high: int = large[-1]
+            self._probability[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] -= 1 - scaled[low]
+            if scaled[high] < 1:
+                small.append(large.pop())
+        # left overs are 1 give or take rounding
+
+    def __len__(self) -> int:
+        """
+        Indexes in table.
+
+        :return: number of weights
+        """
+        return len(self._alias)
+
+    def sample(self, rng: Optional[random.Random] = None) -> int:
+        """
+        Draw an index with probability weight / total.
+
+        :param rng: random source (default module random source)
+        :return: index
+        """
+        if rng is None:
+            rng = _RNG
+        column: int = int(rng.random() * len(self._alias))
+        if rng.random() < self._probability[column]:
+            return column
+        return self._alias[column]
+
+
+class Frequencies:
+    """Frequencies - word weights and cached alias tables of word lists."""
+
+    def __init__(self, counts: Mapping[str, float], power: float = POWER) -> None:
+        """
+        Initialize weights, words without a count weigh as the rarest word.
+
+        :param counts: word -> frequency (any scale, e.g. corpus counts)
+        :param power: weight is frequency ** power
+        """
+        self._weights: Dict[str, float] = {
+            word.lower(): count**power for word, count in counts.items() if count > 0
+        }
+        self.missing: float = min(self._weights.values(), default=1.0)
+        # id(words) -> (words, table), words are kept so id is not reused
+        self._tables: "OrderedDict[int, Tuple[Sequence[str], AliasTable]]" = (
+            OrderedDict()
+        )
+
+    def weight(self, word: str) -> float:
+        """
+        Weight of a word.
+
+        :param word: word (lowercase)
+        :return: weight, missing when word has no count
+        """
+        return self._weights.get(word, self.missing)
+
+    def table(self, words: Sequence[str]) -> AliasTable:
+        """
+        Alias table of words, cached while the same list is used.
+
+        words must not change while it is cached (bucket cache buckets and
+        pass_pool never do).
+        :param words: words
+        :return: alias table, index is place in words
+        """
+        key: int = id(words)
+        if key in self._tables and self._tables[key][0] is words:
+            self._tables.move_to_end(key)
+            return self._tables[key][1]
+        table = AliasTable([self.weight(word) for word in words])
+        self._tables[key] = words, table
+        while len(self._tables) > TABLES:
+            self._tables.popitem(last=False)
+        return table
+
+    def choice(self, words: Sequence[str], rng: Optional[random.Random] = None) -> str:
+        """
+        Draw a word weighted by frequency.
+
+        :param words: words to draw from
+        :param rng: random source (default module random source)
+        :return: word
+        """
+        return words[self.table(words).sample(rng)]
+
+    def sample(
+        self,
+        buckets: Mapping[int, Sequence[str]],
+        count: int,
+        rng: Optional[random.Random] = None,
+    ) -> List[Tuple[str, int]]:
+        """
+        Draw different words of similarity buckets weighted by frequency.
+
+        A bucket is drawn by its total weight, then a word of it, both O(1).
+        Words drawn twice are drawn again, after RETRIES per word wanted
+        (a few heavy words) or when most words are wanted the rest are
+        ordered by weighted random keys instead.
+        :param buckets: similarity -> words with that similarity
+        :param count: words wanted
+        :param rng: random source (default module random source)
+        :return: list (word, similarity) in draw order, at most count
+        """
+        if rng is None:
+            rng = _RNG
+        similarities: List[int] = [sim for sim in buckets if buckets[sim]]
+        available: int = sum(len(buckets[sim]) for sim in similarities)
+        count = min(count, available)
+        drawn: List[Tuple[str, int]] = []
+        if count * 2 < available:
+            tables: List[AliasTable] = [
+                self.table(buckets[sim]) for sim in similarities
+            ]
+            chooser = AliasTable([table.total for table in tables])
+            seen: Set[str] = set()
+            for _ in range(count * RETRIES):
+                place: int = chooser.sample(rng)
+                word: str = buckets[similarities[place]][tables[place].sample(rng)]
+                if word not in seen:
+                    seen.add(word)
+                    drawn.append((word, similarities[place]))
+                    if len(drawn) == count:
+                        return drawn
+        # Efraimidis-Spirakis, sort by random() ** (1 / weight) in logs
+        taken: Set[str] = {word for word, _ in drawn}
+        rest: List[Tuple[float, str, int]] = [
+            (log(1.0 - rng.random()) / self.weight(word), word, sim)
+            for sim in similarities
+            for word in buckets[sim]
+            if word not in taken
+        ]
+        rest.sort(reverse=True)
+        drawn += [(word, sim) for _, word, sim in rest[: count - len(drawn)]]
+        return drawn
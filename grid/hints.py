@@ -0,0 +1,182 @@
+"""
+Password hints worked out from the likeness answers already given.
+
+Candidates are narrowed on a worker thread as answers arrive, the game loop
+only polls for the finished hint and never waits on it.
+"""
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING
+import grid.events as ev
+from grid._word_tools import likeness
+
+if TYPE_CHECKING:
+    from grid.neighbours import NeighbourIndex
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Guesses scored per hint, candidates first, keeps a hint in milliseconds
+MAX_GUESSES: int = 64
+# Candidates a guess is scored against (evenly spaced sample)
+MAX_SAMPLE: int = 512
+
+
+class Hint(NamedTuple):
+    """Best next guess."""
+
+    guess: str  # empty when no word is left to guess
+    candidates: int  # words that can still be the password
+
+
+class HintService:
+    """HintService - narrows password candidates on a worker thread."""
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        mode: str = "positional",
+        neighbours: Optional["NeighbourIndex"] = None,
+    ) -> None:
+        """
+        Initialize hint service, first hint is worked out on the worker.
+
+        :param words: words on the board, one of them is the password
+        :param mode: likeness mode of the board, see settings.LIKENESS_MODES
+        :param neighbours: stored likeness rows, answers for row words narrow
+        candidates without working out likeness (positional mode)
+        """
+        likeness("", mode)  # raise ValueError on unknown mode
+        self._mode: str = mode
+        self._neighbours: Optional["NeighbourIndex"] = (
+            neighbours if mode == "positional" else None
+        )
+        self._words: List[str] = list(dict.fromkeys(words))  # guesses left
+        self._candidates: List[str] = list(self._words)
+        self._hint: Optional[Hint] = None
+        self.shown: bool = False  # player asked for hints
+        self._worker: ev.EventWorker = ev.EventWorker(self._work, "grid-hints")
+        self._worker.put(ev.GameStarted(0, False))  # work out first hint
+
+    @property
+    def busy(self) -> bool:
+        """
+        Answers are waiting or being worked on.
+
+        :return: T/F
+        """
+        return self._worker.pending > 0
+
+    @property
+    def errors(self) -> int:
+        """
+        Answers and hints that raised, the worker kept running.
+
+        :return: number of errors, last_error holds the last one
+        """
+        return self._worker.errors
+
+    @property
+    def last_error(self) -> Optional[Exception]:
+        """
+        Last error raised working out hints.
+
+        :return: error, None when there was none
+        """
+        return self._worker.last_error
+
+    def update(self, event: ev.Event) -> None:
+        """
+        Queue a game event, never blocks (an events.EventBus subscriber).
+
+        Dud answers (Selected) and removed duds (DudRemoved) narrow hints.
+        :param event: game event
+        """
+        if isinstance(event, ev.Selected) and isinstance(event.similarity, int):
+            self._worker.put(event)
+        elif isinstance(event, ev.DudRemoved) and event.word:
+            self._worker.put(event)
+
+    def poll(self) -> Optional[Hint]:
+        """
+        Latest finished hint.
+
+        :return: hint, None until the first is worked out
+        """
+        return self._hint
+
+    def flush(self) -> None:
+        """Wait until queued answers are applied and the hint worked out."""
+        self._worker.flush()
+
+    def close(self) -> None:
+        """Apply queued answers and stop the worker, later answers are ignored."""
+        self._worker.close()
+
+    # Private
+    def _work(self, events: List[ev.Event]) -> None:
+        """
+        Apply every queued answer then work out the hint, on the worker.
+
+        An answer that raises is counted in errors and skipped.
+        :param events: answers in the order given
+        """
+        for event in events:
+            try:
+                self._apply(event)
+            except Exception as error:  # pylint: disable=W0703
+                self._worker.failed(error)
+        self._hint = self._best()
+
+    def _apply(self, event: ev.Event) -> None:
+        """
+        Narrow candidates and guesses with an event.
+
+        :param event: Selected dud or DudRemoved
+        """
+        if isinstance(event, ev.Selected) and isinstance(event.similarity, int):
+            answer: int = event.similarity
+            kept: Optional[List[str]] = None
+            if self._neighbours is not None:
+                kept = self._neighbours.consistent(event.word, answer, self._candidates)
+            if kept is None:
+                likeness_of: Callable[[str], int] = likeness(event.word, self._mode)
+                kept = [
+                    word
+                    for word in self._candidates
+                    if word != event.word and likeness_of(word) == answer
+                ]
+            self._candidates = kept
+            self._words = [word for word in self._words if word != event.word]
+        elif isinstance(event, ev.DudRemoved):
+            self._candidates = [word for word in self._candidates if word != event.word]
+            self._words = [word for word in self._words if word != event.word]
+
+    def _best(self) -> Hint:
+        """
+        Guess leaving the fewest candidates whatever the answer (minimax).
+
+        Ties go to candidates, they may win outright.
+        :return: hint
+        """
+        candidates: List[str] = self._candidates
+        if len(candidates) <= 2:
+            return Hint(candidates[0] if candidates else "", len(candidates))
+        sample: List[str] = candidates[:: max(len(candidates) // MAX_SAMPLE, 1)]
+        possible = frozenset(candidates)
+        guesses: List[str] = candidates[:MAX_GUESSES]
+        guesses += [word for word in self._words if word not in possible][
+            : MAX_GUESSES - len(guesses)
+        ]
+        best: str = candidates[0]
+        best_score = (len(sample) + 1, True)
+        for guess in guesses:
+            likeness_of: Callable[[str], int] = likeness(guess, self._mode)
+            buckets: Dict[Union[int, str], int] = {}
+            for word in sample:
+                answer: Union[int, str] = "p" if word == guess else likeness_of(word)
+                buckets[answer] = buckets.get(answer, 0) + 1
+            buckets.pop("p", None)  # found, nothing left
+            score = (max(buckets.values(), default=0), guess not in possible)
+            if score < best_score:
+                best, best_score = guess, score
+        return Hint(best, len(candidates))
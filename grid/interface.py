@@ -1,51 +1,102 @@
 """Manages player movement on the grid."""
-from typing import Tuple
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from grid.settings import SettingGrid
 
 # Black styling Preferred
 # pylint: disable=c0330
 
+# Jump key -> (entries to move, only secrets)
+JUMPS: Dict[str, Tuple[int, bool]] = {
+    "\t": (1, False),  # Tab, next word
+    "KEY_BTAB": (-1, False),  # Shift Tab, previous word
+    "]": (1, True),  # next secret bracket
+    "[": (-1, True),  # previous secret bracket
+}
+# Row start key -> rows to move
+ROW_STARTS: Dict[str, int] = {"+": 1, "-": -1, "0": 0, "KEY_HOME": 0}
+# Key -> action of keys that do not move (see keyboard_input)
+ACTIONS: Dict[str, str] = {"q": "Q", "\x1b": "Q", "\n": "S", "h": "H"}
+# Move key -> Interface method moving one step, False at the edge
+MOVES: Dict[str, str] = {
+    "KEY_UP": "_move_up",
+    "w": "_move_up",
+    "KEY_DOWN": "_move_down",
+    "s": "_move_down",
+    "KEY_LEFT": "_move_left",
+    "a": "_move_left",
+    "KEY_RIGHT": "_move_right",
+    "d": "_move_right",
+    "KEY_NPAGE": "_page_down",  # Page Down
+    "KEY_PPAGE": "_page_up",  # Page Up
+}
+# Largest count prefix (e.g. '12d' moves right 12 times)
+MAX_COUNT: int = 9999
+
+
+class Mouse(NamedTuple):
+    """Mouse event on screen."""
+
+    line: int  # screen line (starts at 0)
+    place: int  # screen column (starts at 0)
+    click: bool  # button pressed, otherwise mouse moved or was released
+
 
 class Interface:
     """Interface - translate keyboard presses to movement on the grid."""
 
-    def __init__(self, line_start: int, settings: SettingGrid) -> None:
+    def __init__(
+        self, line_start: int, settings: SettingGrid, view_rows: Optional[int] = None
+    ) -> None:
         """
         Set Indicator location boundaries.
 
         :Param line_start: starting line of active column in grid
         :Param settings: game settings
+        :Param view_rows: grid rows shown at once, scrolls when fewer than
+        NUM_OF_ROWS (default NUM_OF_ROWS)
         """
-        self.start: Tuple[int, int, int]  # line_start, left_start, right_start
-        self.end: Tuple[int, int, int]  # line_end, left_end, right_end
-
-        left_start = settings.HEX_LINE_SIZE + 1
-        right_start = (
-            settings.HEX_LINE_SIZE
-            + 1
-            + settings.ACTIVE_LINE_SIZE
-            + 1
-            + settings.HEX_LINE_SIZE
-            + 1
-        )
+        self.start: Tuple[int, ...]  # line_start, start of each active column
+        self.end: Tuple[int, ...]  # line_end, end of each active column
+
+        self._top: int = 0  # grid row shown on line_start
+        if view_rows is None:
+            view_rows = settings.NUM_OF_ROWS
+        if not 0 < view_rows <= settings.NUM_OF_ROWS:
+            raise ValueError(f"view_rows ({view_rows}) not between 1 and NUM_OF_ROWS")
         # Last allowed sport line (-1 to account for 0 start of index)
-        line_end = settings.NUM_OF_ROWS + line_start - 1
-        # Last allowed place on left
-        left_end = settings.HEX_LINE_SIZE + settings.ACTIVE_LINE_SIZE
-        # Last allowed place on Right
-        right_end = (
-            settings.HEX_LINE_SIZE
-            + 1
-            + settings.ACTIVE_LINE_SIZE
-            + 1
-            + settings.HEX_LINE_SIZE
-            + settings.ACTIVE_LINE_SIZE
+        line_end = view_rows + line_start - 1
+        # Each column pair is hex, space, active column, space
+        starts: List[int] = []
+        place: int = 0
+        for _ in range(settings.COLUMNS):
+            place += settings.HEX_LINE_SIZE + 1
+            starts.append(place)
+            place += settings.ACTIVE_LINE_SIZE + 1
+        width: int = place + settings.FEEDBACK_LINE_SIZE  # of a grid row
+        ends: List[int] = [start + settings.ACTIVE_LINE_SIZE - 1 for start in starts]
+        self.start = (line_start, *starts)
+        self.end = (line_end, *ends)
+
+        self._layout: _Layout = _Layout(
+            settings.NUM_OF_ROWS,
+            width,
+            [(-1, -1)] * width,
+            list(range(width)),
+            list(range(width)),
         )
-        self.start = line_start, left_start, right_start
-        self.end = line_end, left_end, right_end
+        places: List[int] = []  # every place inside an active column
+        for column, start in enumerate(starts):
+            for offset in range(settings.ACTIVE_LINE_SIZE):
+                self._layout.cells[start + offset] = column, offset
+                places.append(start + offset)
+        for before, after in zip(places, places[1:]):
+            self._layout.right[before] = after
+            self._layout.left[after] = before
         # Player starts on the left
         self._line: int = self.start[0]
         self._place: int = self.start[1]
+        self._keys: _Keys = _Keys(0, (1, False))
 
     @property
     def line(self) -> int:
@@ -65,66 +116,169 @@ class Interface:
         """
         return self._place
 
+    @property
+    def width(self) -> int:
+        """
+        Screen places of a grid row, feedback included.
+
+        :return: width of grid
+        """
+        return self._layout.width
+
+    @property
+    def jump(self) -> Tuple[int, bool]:
+        """
+        Last jump asked for, see JUMPS.
+
+        :return: entries to move (count included), only secrets
+        """
+        return self._keys.jump
+
+    @property
+    def top(self) -> int:
+        """
+        Grid row shown on first line of view.
+
+        :return: grid row
+        """
+        return self._top
+
+    @property
+    def view_rows(self) -> int:
+        """
+        Grid rows shown at once.
+
+        :return: number of rows
+        """
+        return self.end[0] - self.start[0] + 1
+
+    def resize(self, view_rows: int) -> None:
+        """
+        Change number of grid rows shown, player stays on the same grid row.
+
+        :Param view_rows: grid rows shown at once
+        """
+        if not 0 < view_rows <= self._layout.rows:
+            raise ValueError(f"view_rows ({view_rows}) not between 1 and NUM_OF_ROWS")
+        row: int = self._top + self._line - self.start[0]
+        self.end = (self.start[0] + view_rows - 1, *self.end[1:])
+        self._top = min(
+            max(self._top, row - view_rows + 1), self._layout.rows - view_rows
+        )
+        self._line = self.start[0] + row - self._top
+
     def keyboard_input(self, button: str) -> str:
         """
         Move along grid based on keyboard output.
 
+        Digits are a count prefix for the next move or jump.
         :Param button: button pressed
         :return: Action
         Q -> Quit game
         S -> Select
         M -> Player moved
+        J -> Jump to an entry (see jump), needs the grid to resolve
+        H -> Toggle hint
         N -> No action
         """
-        player_moved: bool = False
-        if button in ("q", "\x1b"):  # Escape key is '\x1b'
-            return "Q"
-        if button == "\n":
+        count: int = self._keys.prefix
+        if len(button) == 1 and button.isdigit() and (button != "0" or count):
+            self._keys = self._keys._replace(
+                prefix=min(count * 10 + int(button), MAX_COUNT)
+            )
+            return "N"
+        self._keys = self._keys._replace(prefix=0)
+        count = max(count, 1)
+        if button in ACTIONS:
+            return ACTIONS[button]
+        if button in JUMPS:
+            step, secrets = JUMPS[button]
+            self._keys = self._keys._replace(jump=(step * count, secrets))
+            return "J"
+        if button in ROW_STARTS:
+            player_moved: bool = self._move_row_start(ROW_STARTS[button] * count)
+            return "M" if player_moved else "N"
+        if button not in MOVES:
+            return "N"
+        move: Callable[[], bool] = getattr(self, MOVES[button])
+        player_moved = False
+        for _ in range(count):
+            if not move():  # at edge
+                break
+            player_moved = True
+        return "M" if player_moved else "N"
+
+    def move_to(self, column: int, row: int, place: int) -> bool:
+        """
+        Move player to a grid location, view scrolls just enough to show it.
+
+        :Param column: active column (0 is left most)
+        :Param row: grid row
+        :Param place: place in active column
+        :return: True or False if player moved.
+        """
+        if not 0 <= column < len(self.start) - 1:
+            raise ValueError(f"Column ({column}) not in grid")
+        if not 0 <= row < self._layout.rows:
+            raise ValueError(f"Row ({row}) not in grid")
+        if not 0 <= place <= self.end[1] - self.start[1]:
+            raise ValueError(f"Place ({place}) not in active column")
+        top: int = min(max(self._top, row - self.view_rows + 1), row)
+        line: int = self.start[0] + row - top
+        place += self.start[1 + column]
+        if (top, line, place) == (self._top, self._line, self._place):
+            return False
+        self._top, self._line, self._place = top, line, place
+        return True
+
+    def mouse_input(self, mouse: Mouse) -> str:
+        """
+        Move player to mouse when it is over an active column.
+
+        Screen place is looked up in a table, so every event costs the same.
+        :Param mouse: mouse event
+        :return: Action
+        S -> Select (player moved to mouse first)
+        M -> Player moved
+        N -> No action (outside active columns or already there)
+        """
+        if not self.start[0] <= mouse.line <= self.end[0]:
+            return "N"
+        if (
+            not 0 <= mouse.place < self._layout.width
+            or self._layout.cells[mouse.place][0] < 0
+        ):
+            return "N"
+        moved: bool = (mouse.line, mouse.place) != (self._line, self._place)
+        self._line, self._place = mouse.line, mouse.place
+        if mouse.click:
             return "S"
-        if button in ("KEY_UP", "w"):
-            player_moved = self._move_up()
-        elif button in ("KEY_DOWN", "s"):
-            player_moved = self._move_down()
-        elif button in ("KEY_LEFT", "a"):
-            player_moved = self._move_left()
-        elif button in ("KEY_RIGHT", "d"):
-            player_moved = self._move_right()
-        if player_moved:
-            return "M"
-        return "N"
+        return "M" if moved else "N"
 
     def exact_grid_location(self) -> Tuple[int, int, int]:
         """
         Provide player location that can be used by hover or select from backend.
 
         remove offsets from start to account for start values
-        :return: column_left, offset line, offset_place
+        :return: active column (0 is left most), offset line, offset_place
         """
-        if self._column_left:
-            offset_place: int = self.place - self.start[1]
-        else:
-            offset_place = self.place - self.start[2]
-        return self._column_left, self.line - self.start[0], offset_place
+        column, offset_place = self._layout.cells[self.place]
+        row: int = self._top + self.line - self.start[0]
+        return column, row, offset_place
 
     # Private
-    @property
-    def _column_left(self) -> bool:
-        """
-        Player in left column.
-
-        :return: Is player in left column (T/F)
-        """
-        return self.place <= self.end[1]
-
     def _move_up(self) -> bool:
         """
         Move player up by one.
 
         :return: True or False if task completed.
         """
-        if self.line <= self.start[0]:
+        if self.line > self.start[0]:
+            self._line -= 1
+        elif self._top > 0:  # scroll
+            self._top -= 1
+        else:
             return False
-        self._line -= 1
         return True
 
     def _move_down(self) -> bool:
@@ -133,25 +287,69 @@ class Interface:
 
         :return: True or False if task completed.
         """
-        if self.line >= self.end[0]:
+        if self.line < self.end[0]:
+            self._line += 1
+        elif self._top + self.view_rows < self._layout.rows:  # scroll
+            self._top += 1
+        else:
             return False
-        self._line += 1
         return True
 
+    def _move_page(self, rows: int) -> bool:
+        """
+        Scroll view by rows, player stays on the same line of view.
+
+        Moves to first or last line when view cannot scroll further.
+        :param rows: rows to scroll, negative scrolls up
+        :return: True or False if task completed.
+        """
+        top: int = min(max(self._top + rows, 0), self._layout.rows - self.view_rows)
+        line: int = self._line
+        if top == self._top:
+            line = self.start[0] if rows < 0 else self.end[0]
+        if (top, line) == (self._top, self._line):
+            return False
+        self._top, self._line = top, line
+        return True
+
+    def _page_down(self) -> bool:
+        """
+        Scroll view down by a page.
+
+        :return: True or False if task completed.
+        """
+        return self._move_page(self.view_rows)
+
+    def _page_up(self) -> bool:
+        """
+        Scroll view up by a page.
+
+        :return: True or False if task completed.
+        """
+        return self._move_page(-self.view_rows)
+
+    def _move_row_start(self, rows: int) -> bool:
+        """
+        Move player to start of the active column rows below (negative above).
+
+        Stops at first or last row.
+        :param rows: rows to move
+        :return: True or False if task completed.
+        """
+        column: int = self._layout.cells[self.place][0]
+        row: int = self._top + self.line - self.start[0]
+        return self.move_to(column, min(max(row + rows, 0), self._layout.rows - 1), 0)
+
     def _move_left(self) -> bool:
         """
         Move player left by one.
 
         :return: True or False if task completed.
         """
-        # At Left boundary (left start)
-        if self.place == self.start[1]:
+        place: int = self._layout.left[self.place]
+        if place == self.place:  # At Left boundary (left start)
             return False
-        # Move back to left column
-        if self.place == self.start[2]:
-            self._place = self.end[1]
-        else:
-            self._place -= 1
+        self._place = place
         return True
 
     def _move_right(self) -> bool:
@@ -160,12 +358,25 @@ class Interface:
 
         :return: True or False if task completed.
         """
-        # At Right boundary (right end)
-        if self.place == self.end[2]:
+        place: int = self._layout.right[self.place]
+        if place == self.place:  # At Right boundary (right end)
             return False
-        # Move to right column
-        if self._column_left and self.place == self.end[1]:
-            self._place = self.start[2]
-        else:
-            self._place += 1
+        self._place = place
         return True
+
+
+class _Layout(NamedTuple):
+    """Data container for grid rows and lookup tables indexed by screen place."""
+
+    rows: int  # grid rows (NUM_OF_ROWS)
+    width: int  # screen places of a grid row
+    cells: List[Tuple[int, int]]  # (active column, place), (-1, -1) outside
+    left: List[int]  # place after moving left, same place at the edge
+    right: List[int]  # place after moving right, same place at the edge
+
+
+class _Keys(NamedTuple):
+    """Data container for keys carried over to the next key press."""
+
+    prefix: int  # count prefix typed so far
+    jump: Tuple[int, bool]  # last jump, see JUMPS
@@ -0,0 +1,258 @@
+"""
+Latency histograms for grid operations and frames.
+
+Histograms use fixed log-linear buckets (8 linear buckets per power of two
+nanoseconds) so recording is a few integer operations and percentiles are
+within 12.5% of the true value.
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+# Black styling Preferred
+# pylint: disable=c0330, W0603
+
+# Operations
+FRAME: str = "frame"  # keypress to frame rendered
+HOVER: str = "hover"
+SELECT: str = "select"
+FULL_ROW_STR: str = "full_row_str"
+
+SUB_BUCKET_BITS: int = 3
+SUB_BUCKETS: int = 1 << SUB_BUCKET_BITS
+MAX_BITS: int = 40  # ~18 minutes in nanoseconds, larger values are clamped
+BUCKETS: int = (MAX_BITS - SUB_BUCKET_BITS + 1) * SUB_BUCKETS
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+# Clock in nanoseconds, time.perf_counter_ns is Python 3.7+
+perf_counter_ns: Callable[[], int] = getattr(
+    time, "perf_counter_ns", lambda: int(time.perf_counter() * 1e9)
+)
+
+
+def bucket_index(nanoseconds: int) -> int:
+    """
+    Find bucket for a value.
+
+    :param nanoseconds: value to place
+    :return: bucket index
+    """
+    if nanoseconds < SUB_BUCKETS:
+        return max(nanoseconds, 0)
+    shift: int = nanoseconds.bit_length() - SUB_BUCKET_BITS - 1
+    index: int = (shift + 1) * SUB_BUCKETS + (nanoseconds >> shift) - SUB_BUCKETS
+    return min(index, BUCKETS - 1)
+
+
+def bucket_upper(index: int) -> int:
+    """
+    Upper bound (exclusive) of a bucket.
+
+    :param index: bucket index
+    :return: nanoseconds
+    """
+    if index < SUB_BUCKETS:
+        return index + 1
+    shift: int = index // SUB_BUCKETS - 1
+    return (index % SUB_BUCKETS + SUB_BUCKETS + 1) << shift
+
+
+class Histogram:
+    """Histogram - log-linear latency histogram in nanoseconds."""
+
+    def __init__(self) -> None:
+        """Initialize empty histogram."""
+        self._counts: List[int] = [0] * BUCKETS
+        self.count: int = 0
+        self.total: int = 0  # nanoseconds
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Add a value to histogram.
+
+        :param nanoseconds: value to add
+        """
+        self._counts[bucket_index(nanoseconds)] += 1
+        self.count += 1
+        self.total += nanoseconds
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """
+        Non-empty buckets.
+
+        :return: list (upper bound nanoseconds, count)
+        """
+        return [
+            (bucket_upper(index), count)
+            for index, count in enumerate(self._counts)
+            if count
+        ]
+
+    def percentile(self, percent: float) -> int:
+        """
+        Value that percent of recorded values are under.
+
+        :param percent: 0 to 100
+        :return: bucket upper bound in nanoseconds (0 when empty)
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError(f"Percent ({percent}) not between 0 and 100")
+        if not self.count:
+            return 0
+        rank: float = percent / 100 * self.count
+        seen: int = 0
+        upper: int = 0
+        for upper, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                break
+        return upper
+
+
+class Latency:
+    """Latency - named histograms that can be exported."""
+
+    def __init__(self) -> None:
+        """Initialize with no histograms."""
+        self.histograms: Dict[str, Histogram] = {}
+
+    def record(self, name: str, nanoseconds: int) -> None:
+        """
+        Add a value to named histogram.
+
+        :param name: operation name
+        :param nanoseconds: value to add
+        """
+        if name not in self.histograms:
+            self.histograms[name] = Histogram()
+        self.histograms[name].record(nanoseconds)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Record how long block takes.
+
+        :param name: operation name
+        """
+        start: int = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter_ns() - start)
+
+    def to_json(self) -> str:
+        """
+        Export as JSON.
+
+        :return: count, sum, p50/p90/p99/max and buckets per operation (seconds)
+        """
+        import json  # pylint: disable=C0415  # only needed on export
+
+        export: Dict[str, Any] = {}
+        for name, histogram in self.histograms.items():
+            export[name] = {
+                "count": histogram.count,
+                "sum": histogram.total / 1e9,
+                "p50": histogram.percentile(50) / 1e9,
+                "p90": histogram.percentile(90) / 1e9,
+                "p99": histogram.percentile(99) / 1e9,
+                "max": histogram.percentile(100) / 1e9,
+                "buckets": [
+                    [upper / 1e9, count] for upper, count in histogram.buckets()
+                ],
+            }
+        return json.dumps(export, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Export in Prometheus text format.
+
+        :return: histogram metric 'prewar_latency_seconds' labeled by operation
+        """
+        lines: List[str] = [
+            "# HELP prewar_latency_seconds Latency of prewar login operations.",
+            "# TYPE prewar_latency_seconds histogram",
+        ]
+        metric: str = "prewar_latency_seconds"
+        for name, histogram in self.histograms.items():
+            label: str = f'op="{name}"'
+            cumulative: int = 0
+            for upper, count in histogram.buckets():
+                cumulative += count
+                bound: str = f"{upper / 1e9:g}"
+                lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum{{{label}}} {histogram.total / 1e9:g}")
+            lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str) -> None:
+        """
+        Write histograms to file.
+
+        :param path: '.prom' is written in Prometheus text format, otherwise JSON
+        """
+        if path.endswith(".prom"):
+            export: str = self.to_prometheus()
+        else:
+            export = self.to_json()
+        with open(path, "w", encoding="utf-8") as out:
+            out.write(export)
+
+
+_ACTIVE: Optional[Latency] = None
+
+
+def enable() -> Latency:
+    """
+    Start recording latency of timed operations.
+
+    :return: active latency recorder (existing one if already enabled)
+    """
+    global _ACTIVE
+    if _ACTIVE is None:
+        _ACTIVE = Latency()
+    return _ACTIVE
+
+
+def disable() -> None:
+    """Stop recording latency."""
+    global _ACTIVE
+    _ACTIVE = None
+
+
+def active() -> Optional[Latency]:
+    """
+    Active latency recorder.
+
+    :return: recorder or None when disabled
+    """
+    return _ACTIVE
+
+
+def timed(name: str) -> Callable[[FuncT], FuncT]:
+    """
+    Record latency of every call of decorated function when enabled.
+
+    :param name: operation name
+    :return: decorator
+    """
+
+    def decorator(func: FuncT) -> FuncT:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _ACTIVE is None:
+                return func(*args, **kwargs)
+            start: int = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if _ACTIVE is not None:
+                    _ACTIVE.record(name, perf_counter_ns() - start)
+
+        return wrapper  # type: ignore
+
+    return decorator
@@ -0,0 +1,145 @@
+"""
+Positional letter counts of a word list, per word length.
+
+Words of a length sharing letters in place with a password are bounded by
+the counts of the password's letters at each place, so whether a password
+can have HIGH_DUDS high similarity duds (see _word_tools.similarity_sort)
+is often known from a few table lookups, without scanning the word list.
+"""
+from collections import Counter
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from grid._word_tools import HIGH_DUDS
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+Table = List[Dict[str, int]]  # place -> letter -> words with letter there
+
+
+class LetterCounts:
+    """LetterCounts - (place, letter) word counts per length, bounds likeness."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Count letters and adjacent letter pairs by place of different words.
+
+        One table per length, pairs are places (0, 1), (2, 3) and so on.
+        :param words: words, repeats counted once
+        """
+        by_length: Dict[int, Set[str]] = {}
+        for word in words:
+            by_length.setdefault(len(word), set()).add(word)
+        # length -> (words, letters table, pairs table)
+        self._tables: Dict[int, Tuple[int, Table, Table]] = {}
+        for length, group in sorted(by_length.items()):
+            if not length:
+                continue
+            letters: Table = [
+                dict(Counter(map(itemgetter(place), group))) for place in range(length)
+            ]
+            pairs: Table = [
+                dict(Counter(map(itemgetter(slice(place, place + 2)), group)))
+                for place in range(0, length - 1, 2)
+            ]
+            self._tables[length] = len(group), letters, pairs
+
+    @property
+    def lengths(self) -> Tuple[int, ...]:
+        """
+        Word lengths counted.
+
+        :return: lengths, shortest first
+        """
+        return tuple(self._tables)
+
+    def count(self, length: int, place: int, letters: str) -> int:
+        """
+        Words of a length with letters at place.
+
+        :param length: letters in word
+        :param place: index in word, even for two letters
+        :param letters: a letter or two (a pair starting at an even place)
+        :return: number of words
+        """
+        if length not in self._tables or not 0 <= place <= length - len(letters):
+            return 0
+        _, singles, pairs = self._tables[length]
+        if len(letters) == 1:
+            return singles[place].get(letters, 0)
+        if len(letters) == 2 and place % 2 == 0:
+            return pairs[place // 2].get(letters, 0)
+        raise ValueError(f"No table of {letters} at place {place}")
+
+    def bounds(self, password: str) -> Tuple[int, int]:
+        """
+        Bound the words with over half of password's letters in place.
+
+        Per length, with k places to compare and m matches needed, a high
+        word matches one of any k - m + 1 places (the least common taken)
+        and one whole block of places (0, 1), (2, 3)... (a lone last place
+        is a block) as fewer than m places are left otherwise. At least
+        the words matching all of the m most common places, or a pair and
+        the m - 2 most common other places, are high (counts less words
+        missing one). The password itself is not counted in the lower
+        bound, it may be in the list.
+        :param password: lowercase password
+        :return: lower, upper number of words
+        """
+        needed: int = len(password) // 2 + 1
+        lower: int = 0
+        upper: int = 0
+        for length, (words, singles, pairs) in self._tables.items():
+            places: int = min(length, len(password))
+            if places < needed:
+                continue  # too few places to match
+            counts: List[int] = [
+                singles[place].get(password[place], 0) for place in range(places)
+            ]
+            blocks: List[int] = [
+                pairs[place // 2].get(password[place : place + 2], 0)
+                for place in range(0, places - 1, 2)
+            ] + counts[places - places % 2 : places]
+            length_lower, length_upper = _bounds(words, counts, blocks, needed)
+            lower, upper = lower + length_lower, upper + length_upper
+        return max(lower - 1, 0), upper
+
+    def viable(self, password: str, wanted: int = HIGH_DUDS) -> Optional[bool]:
+        """
+        Tell from the counts alone whether password has wanted high duds.
+
+        :param password: lowercase password
+        :param wanted: high similarity words needed
+        :return: True or False when the bounds settle it, None needs a scan
+        """
+        lower, upper = self.bounds(password)
+        if upper < wanted:
+            return False
+        if lower >= wanted:
+            return True
+        return None
+
+
+# Private
+def _bounds(
+    words: int, counts: List[int], blocks: List[int], needed: int
+) -> Tuple[int, int]:
+    """
+    Bound the high words of one length, see LetterCounts.bounds.
+
+    :param words: words of the length
+    :param counts: words matching the password in each place compared
+    :param blocks: words matching each block of places
+    :param needed: matches a high word needs
+    :return: lower, upper number of words
+    """
+    places: int = len(counts)
+    ordered: List[int] = sorted(counts)
+    upper: int = min(words, sum(ordered[: places - needed + 1]), sum(blocks))
+    common: int = sum(ordered[places - needed :]) - (needed - 1) * words
+    if places >= 2:
+        pair: int = blocks.index(max(blocks[: places // 2]))
+        rest: List[int] = sorted(counts[: 2 * pair] + counts[2 * pair + 2 :])
+        with_pair: int = blocks[pair] + sum(rest[len(rest) - needed + 2 :])
+        common = max(common, with_pair - (needed - 2) * words)
+    return max(common, 0), upper
@@ -0,0 +1,262 @@
+"""
+Positional likeness of words to chosen row words, worked out offline.
+
+write_neighbours stores, for each row word (e.g. every pass_pool password),
+the ids of the words with each likeness to it as packed id arrays. A
+NeighbourIndex maps the file and reads one row per password, so
+similarity buckets are a lookup instead of a scan. Passwords and word
+lists the file was not built for fall back to the BucketCache it extends.
+"""
+import mmap
+from array import array
+from bisect import bisect_left
+from typing import AbstractSet, Collection, Dict, Iterable, List, NamedTuple
+from typing import Optional, Tuple
+from grid.bucket_cache import BucketCache, Buckets, MAX_BYTES, MEMORY_ENTRIES
+from grid.bucket_cache import fingerprint
+from grid._word_tools import likeness, threshold_met
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# First line of neighbour files
+HEADER: bytes = b"#prewar-login-neighbours 1\n"
+# Only positional likeness is stored (Hamming-style, place by place)
+MODE: str = "positional"
+
+Row = Dict[int, "array[int]"]  # likeness -> ids of words with it, sorted
+
+
+def write_neighbours(
+    words: Collection[str], path: str, rows: Optional[Iterable[str]] = None
+) -> None:
+    """
+    Save likeness rows of words as a neighbour file.
+
+    Header line, 'fingerprint words typecode words bytes' line, then one
+    'row offset likeness count ...' line per row and a blank line, the
+    sorted words (a word's id is its place), then the packed ids of every
+    row, likeness by likeness. Every row costs a scan of words, the
+    full square of a large list is better left to pass_pool rows.
+    :param words: different lowercase words (e.g. trimmed dictionary)
+    :param path: neighbour file
+    :param rows: words rows are kept for (default every word)
+    """
+    ordered: List[str] = sorted(words)
+    ids: Dict[str, int] = {word: place for place, word in enumerate(ordered)}
+    typecode: str = "H" if len(ordered) <= 1 << 16 else "I"
+    packed: "array[int]" = array(typecode)
+    table: List[str] = []
+    for row in dict.fromkeys(ordered if rows is None else rows):
+        groups: Dict[int, List[int]] = _row_ids(ordered, ids, row)
+        counts: str = " ".join(f"{sim} {len(groups[sim])}" for sim in sorted(groups))
+        table.append(f"{row} {len(packed)} {counts}\n")
+        for sim in sorted(groups):
+            packed.extend(groups[sim])
+    text: bytes = "\n".join(ordered).encode()
+    with open(path, "wb") as index:
+        index.write(HEADER)
+        index.write(f"{fingerprint(words)} {len(ordered)} {typecode} ".encode())
+        index.write(f"{len(text)}\n".encode() + "".join(table).encode() + b"\n")
+        index.write(text)
+        index.write(packed.tobytes())
+
+
+class _Header(NamedTuple):
+    """Data container for the header line of a neighbour file."""
+
+    fingerprint: str  # see bucket_cache.fingerprint
+    size: int  # words
+    typecode: str  # of the packed ids
+    itemsize: int  # bytes per id
+    words: Tuple[int, int]  # start and end of the words, the ids follow
+
+
+class NeighbourIndex(BucketCache):
+    """NeighbourIndex - memory mapped likeness rows, BucketCache for the rest."""
+
+    def __init__(
+        self,
+        path: str,
+        directory: Optional[str] = None,
+        max_bytes: int = MAX_BYTES,
+        memory: int = MEMORY_ENTRIES,
+    ) -> None:
+        """
+        Map a neighbour file, only the row table is read.
+
+        :param path: neighbour file (see write_neighbours)
+        :param directory: see BucketCache, used for words without a row
+        :param max_bytes: see BucketCache
+        :param memory: see BucketCache
+        """
+        super().__init__(directory, max_bytes, memory)
+        # row word -> (offset, [(likeness, count)])
+        self._rows: Dict[str, Tuple[int, List[Tuple[int, int]]]] = {}
+        with open(path, "rb") as index:
+            if index.readline() != HEADER:
+                raise ValueError(f"{path} is not a neighbour file")
+            fields: List[str] = index.readline().decode().split()
+            if len(fields) != 4 or fields[2] not in ("H", "I"):
+                raise ValueError(f"{path} has a broken header")
+            for line in iter(index.readline, b"\n"):
+                if not line:
+                    raise ValueError(f"{path} row table is cut short")
+                row, offset, *pairs = line.decode().split()
+                numbers: List[int] = list(map(int, pairs))
+                self._rows[row] = int(offset), list(zip(numbers[::2], numbers[1::2]))
+            start: int = index.tell()
+            self._map: mmap.mmap = mmap.mmap(index.fileno(), 0, access=mmap.ACCESS_READ)
+        self._header: _Header = _Header(
+            fields[0],
+            int(fields[1]),
+            fields[2],
+            array(fields[2]).itemsize,
+            (start, start + int(fields[3])),
+        )
+        self._words: Optional[List[str]] = None
+        # last words compared by fingerprint, kept so its id is not reused
+        self._checked: Tuple[Optional[Collection[str]], bool] = (None, False)
+        ids: int = sum(count for _, pairs in self._rows.values() for _, count in pairs)
+        if self._header.words[1] + ids * self._header.itemsize > len(self._map):
+            raise ValueError(f"{path} ids are cut short")
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Fingerprint of the words the file was built from.
+
+        :return: see bucket_cache.fingerprint
+        """
+        return self._header.fingerprint
+
+    @property
+    def rows(self) -> Tuple[str, ...]:
+        """
+        Words with a stored row.
+
+        :return: row words, in file order
+        """
+        return tuple(self._rows)
+
+    @property
+    def words(self) -> List[str]:
+        """
+        Words of the index, sorted, read once when first needed.
+
+        :return: words, a word's id is its place
+        """
+        if self._words is None:
+            start, end = self._header.words
+            text: str = self._map[start:end].decode()
+            self._words = text.split("\n") if text else []
+            if len(self._words) != self._header.size:
+                raise ValueError(f"Neighbour file has {len(self._words)} words")
+        return self._words
+
+    def row(self, word: str) -> Optional[Row]:
+        """
+        Ids of words with each likeness to word.
+
+        :param word: row word
+        :return: likeness -> ids, None when word has no row
+        """
+        if word not in self._rows:
+            return None
+        offset, pairs = self._rows[word]
+        found: Row = {}
+        size: int = self._header.itemsize
+        start: int = self._header.words[1] + offset * size
+        for sim, count in pairs:
+            ids: "array[int]" = array(self._header.typecode)
+            ids.frombytes(self._map[start : start + count * size])
+            found[sim] = ids
+            start += count * size
+        return found
+
+    def matching(self, word: str, similarity: int) -> Optional[List[str]]:
+        """
+        Words with exactly similarity likeness to word.
+
+        :param word: row word
+        :param similarity: likeness
+        :return: words, None when word has no row
+        """
+        found: Optional[Row] = self.row(word)
+        if found is None:
+            return None
+        words: List[str] = self.words
+        return [words[place] for place in found.get(similarity, ())]
+
+    def consistent(
+        self, word: str, similarity: int, candidates: Iterable[str]
+    ) -> Optional[List[str]]:
+        """
+        Keep candidates with exactly similarity likeness to word, from the row.
+
+        :param word: row word (e.g. the dud a likeness answer was given for)
+        :param similarity: likeness
+        :param candidates: words to keep or drop
+        :return: candidates kept, in order, None when word has no row or a
+        candidate is not in the index
+        """
+        found: Optional[Row] = self.row(word)
+        if found is None:
+            return None
+        words: List[str] = self.words
+        kept: List[str] = []
+        same: AbstractSet[int] = set(found.get(similarity, ()))
+        for candidate in candidates:
+            place: int = bisect_left(words, candidate)
+            if place == len(words) or words[place] != candidate:
+                return None
+            if place in same:
+                kept.append(candidate)
+        return kept
+
+    def buckets(self, words: Collection[str], password: str, mode: str) -> Buckets:
+        """
+        Similarity buckets of words, from the row of password when stored.
+
+        Rows only answer for the words the file was built from, compared
+        by fingerprint (once while the same words are passed, they must not
+        change), others go to BucketCache.buckets.
+        :param words: different words (e.g. trimmed dictionary)
+        :param password: word to compare against
+        :param mode: likeness mode, see settings.LIKENESS_MODES
+        :return: dictionary with similarity count as keys, was threshold met?
+        """
+        if mode == MODE and password in self._rows:
+            if self._checked[0] is not words:  # e.g. the same Dictionary range
+                self._checked = words, fingerprint(words) == self.fingerprint
+            if self._checked[1]:
+                self.hits += 1
+                found: Row = self.row(password) or {}
+                known: List[str] = self.words
+                similarity: Dict[int, List[str]] = {
+                    sim: [known[place] for place in ids] for sim, ids in found.items()
+                }
+                return similarity, threshold_met(found, password)
+        return super().buckets(words, password, mode)
+
+    def close(self) -> None:
+        """Unmap the file, the index is unusable after."""
+        self._map.close()
+
+
+# Private
+def _row_ids(ordered: List[str], ids: Dict[str, int], row: str) -> Dict[int, List[int]]:
+    """
+    Group the ids of words by likeness to a row word.
+
+    :param ordered: sorted words
+    :param ids: word -> id
+    :param row: row word, left out
+    :return: likeness -> ids of words with it, sorted
+    """
+    likeness_of = likeness(row)
+    groups: Dict[int, List[int]] = {}
+    for word in ordered:
+        if word != row:
+            groups.setdefault(likeness_of(word), []).append(ids[word])
+    return groups
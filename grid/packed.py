@@ -0,0 +1,206 @@
+"""
+Words packed 5 bits a letter into ints, positional likeness by SWAR.
+
+Letter n of a word sits in bits 5n to 5n + 4 (a = 1 ... z = 26, lanes past
+the word are 0). Two packed words XOR to a zero lane where their letters
+match, a carry into each lane's top bit marks the other lanes, so the
+mismatched lanes of a word are a few int operations instead of a loop over
+its letters. Words are grouped by mismatched lanes and each group is
+counted once. Words are packed once and compared many times.
+
+A single compare costs less than packing, bucket_similarity joins the words
+of one length into one int (8 bits a letter) and compares them all at once.
+"""
+from operator import eq
+from string import ascii_lowercase
+from typing import Callable, Collection, Dict, Iterable, Iterator, List, Optional
+from typing import Tuple
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Longest word packed, 60 bits stay within a machine word
+MAX_LETTERS: int = 12
+BITS: int = 5
+
+_CODES: Dict[str, int] = {char: code for code, char in enumerate(ascii_lowercase, 1)}
+# Low 4 bits of every lane, adding it carries into the top bit of non zero lanes
+_LOW: int = sum(0b01111 << (BITS * lane) for lane in range(MAX_LETTERS))
+# int.bit_count is Python 3.10+
+_popcount: Callable[[int], int] = getattr(int, "bit_count", lambda x: bin(x).count("1"))
+
+
+def pack(word: str) -> Optional[int]:
+    """
+    Pack a word, 5 bits a letter.
+
+    :param word: word
+    :return: packed word, None when over MAX_LETTERS or not all a-z
+    """
+    if len(word) > MAX_LETTERS:
+        return None
+    packed: int = 0
+    for lane, char in enumerate(word):
+        code: Optional[int] = _CODES.get(char)
+        if code is None:
+            return None
+        packed |= code << (BITS * lane)
+    return packed
+
+
+def top_bits(length: int) -> int:
+    """
+    Top bit of each of the first length lanes.
+
+    :param length: lanes
+    :return: mask
+    """
+    return sum(0b10000 << (BITS * lane) for lane in range(length))
+
+
+def bucket_similarity(
+    words: Collection[str], compare_string: str
+) -> Dict[int, List[str]]:
+    """
+    Separate words of one length by positional likeness to compare_string.
+
+    The words, a space after each, are one little endian int of 8 bit
+    lanes and compare_string is repeated under them. XOR zeroes the lanes
+    that match, a carry into each lane's top bit marks the others, the
+    matches of a word's first lanes are added into its first lane and read
+    back a byte a word. Words or a compare_string that are not ASCII are
+    compared letter by letter.
+    :param words: different words of one length
+    :param compare_string: string to compare against
+    :return: dictionary with likeness as keys, compare_string left out
+    """
+    buckets: Dict[int, List[str]] = {}
+    if not words:
+        return buckets
+    ordered: List[str] = list(words)
+    stride: int = len(ordered[0]) + 1  # letters and a space
+    compared: int = min(stride - 1, len(compare_string))
+    matched: Optional[int] = _matched_lanes(ordered, compare_string[:compared], stride)
+    likeness_of: Iterable[int] = (
+        (sum(map(eq, word, compare_string)) for word in ordered)
+        if matched is None
+        else _lane_counts(matched, stride, compared, len(ordered))
+    )
+    for word, similarity in zip(ordered, likeness_of):
+        if similarity in buckets:
+            buckets[similarity].append(word)
+        else:
+            buckets[similarity] = [word]
+    if compare_string in buckets.get(compared, ()):
+        buckets[compared].remove(compare_string)
+        if not buckets[compared]:
+            del buckets[compared]
+    return buckets
+
+
+class PackedWords:
+    """PackedWords - different words packed once, compared with SWAR."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Pack different words, words that do not pack are kept as they are.
+
+        :param words: words, repeats kept once
+        """
+        self._packed: List[Tuple[str, int]] = []
+        self._other: List[str] = []  # compared letter by letter
+        for word in dict.fromkeys(words):
+            packed: Optional[int] = pack(word)
+            if packed is None:
+                self._other.append(word)
+            else:
+                self._packed.append((word, packed))
+
+    def __len__(self) -> int:
+        """
+        Words packed or kept.
+
+        :return: number of words
+        """
+        return len(self._packed) + len(self._other)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Words, packed ones first.
+
+        :return: iterator of words
+        """
+        yield from (word for word, _ in self._packed)
+        yield from self._other
+
+    def similarity_sort(self, compare_string: str) -> Dict[int, List[str]]:
+        """
+        Separate words by positional likeness to compare_string.
+
+        Same buckets as _word_tools.similarity_sort in positional mode.
+        :param compare_string: string to compare against
+        :return: dictionary with likeness as keys, compare_string left out
+        """
+        buckets: Dict[int, List[str]] = {}
+        target: Optional[int] = pack(compare_string)
+        size: int = len(compare_string)
+        checked: Iterable[str] = self._other if target is not None else self
+        if target is not None:
+            top: int = top_bits(size)
+            # mismatched lanes -> words, at most 2 ** size patterns to count
+            patterns: Dict[int, List[str]] = {}
+            for word, packed in self._packed:
+                diff: int = packed ^ target
+                missed: int = ((diff & _LOW) + _LOW | diff) & top
+                if missed in patterns:
+                    patterns[missed].append(word)
+                else:
+                    patterns[missed] = [word]
+            if compare_string in patterns.get(0, ()):
+                patterns[0].remove(compare_string)
+            for missed, words in patterns.items():
+                if words:
+                    similarity: int = size - _popcount(missed)
+                    buckets.setdefault(similarity, []).extend(words)
+        for word in checked:
+            if word != compare_string:
+                similarity = sum(map(eq, word, compare_string))
+                buckets.setdefault(similarity, []).append(word)
+        return buckets
+
+
+# Private
+def _matched_lanes(ordered: List[str], compared: str, stride: int) -> Optional[int]:
+    """
+    Mark the lanes of joined words matching compared, see bucket_similarity.
+
+    :param ordered: words of one length
+    :param compared: compare_string cut to the word length
+    :param stride: bytes a word, letters and a space
+    :return: 1 in the low bit of each matching lane, None when not ASCII
+    """
+    joined: bytes = (" ".join(ordered) + " ").encode()
+    below: bytes = compared.ljust(stride).encode() * len(ordered)
+    size: int = stride * len(ordered)
+    if len(joined) != size or len(below) != size:  # a letter took more bytes
+        return None
+    diff: int = int.from_bytes(joined, "little") ^ int.from_bytes(below, "little")
+    low: int = int.from_bytes(b"\x7f" * size, "little")
+    top: int = int.from_bytes(b"\x80" * size, "little")
+    return ((((diff & low) + low | diff) & top) ^ top) >> 7
+
+
+def _lane_counts(matched: int, stride: int, compared: int, count: int) -> bytes:
+    """
+    Add the matches of each word's first lanes, a byte a word.
+
+    :param matched: matching lanes, see _matched_lanes
+    :param stride: bytes a word, letters and a space
+    :param compared: lanes counted a word
+    :param count: words
+    :return: likeness of each word
+    """
+    counts: int = 0
+    for lane in range(compared):
+        counts += matched >> (8 * lane)
+    return counts.to_bytes(stride * count, "little")[::stride]
@@ -0,0 +1,144 @@
+"""
+Profile grid phases with cProfile.
+
+Each phase gets its own profile and pstats file so slow keypresses can be
+traced to board generation, rendering or input handling.
+"""
+
+import os
+from contextlib import contextmanager, suppress
+from functools import wraps
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+from typing import Tuple, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import cProfile
+
+# Black styling Preferred
+# pylint: disable=c0330, W0603
+
+# Phases
+IMPORT: str = "import"
+COMPONENTS: str = "components"
+POPULATE: str = "interactive_cols"
+RENDER: str = "render"
+INPUT: str = "input"
+
+FuncT = TypeVar("FuncT", bound=Callable[..., Any])
+
+
+class Profiler:
+    """Profiler - cProfile per phase, only the innermost phase is recorded."""
+
+    def __init__(self) -> None:
+        """Initialize with no phases recorded."""
+        self._profiles: Dict[str, "cProfile.Profile"] = {}
+        self._stack: List["cProfile.Profile"] = []
+
+    @property
+    def phases(self) -> Tuple[str, ...]:
+        """
+        Phases recorded so far.
+
+        :return: phase names in order first seen
+        """
+        return tuple(self._profiles)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Record block under phase, re-entering a phase adds to it.
+
+        :param name: phase name
+        """
+        if name not in self._profiles:
+            import cProfile  # pylint: disable=C0415,W0621  # only when profiling
+
+            self._profiles[name] = cProfile.Profile()
+        phase_profile: "cProfile.Profile" = self._profiles[name]
+        if self._stack:  # Outer phase paused, nested time counts once
+            self._stack[-1].disable()
+        self._stack.append(phase_profile)
+        phase_profile.enable()
+        try:
+            yield
+        finally:
+            phase_profile.disable()
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1].enable()
+
+    def dump(self, out_dir: str) -> List[str]:
+        """
+        Write a pstats file per phase.
+
+        :param out_dir: directory to write <phase>.pstats into
+        :return: paths written
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        paths: List[str] = []
+        for name, phase_profile in self._profiles.items():
+            path: str = os.path.join(out_dir, f"{name}.pstats")
+            phase_profile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+_ACTIVE: Optional[Profiler] = None
+# Suppresses nothing, a reusable context doing nothing (nullcontext is 3.7+)
+_INACTIVE: ContextManager[None] = suppress()
+
+
+@contextmanager
+def profile(out_dir: str) -> Iterator[Profiler]:
+    """
+    Profile grid phases while in context.
+
+    pstats files are written to out_dir on exit, one per phase.
+    View with 'python -m pstats <file>' or snakeviz.
+    :param out_dir: directory to write pstats files into
+    :return: active profiler
+    """
+    global _ACTIVE
+    if _ACTIVE is not None:
+        raise RuntimeError("Profiling is already active")
+    _ACTIVE = Profiler()
+    try:
+        yield _ACTIVE
+    finally:
+        profiler: Profiler = _ACTIVE
+        _ACTIVE = None
+        profiler.dump(out_dir)
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    Record block under phase when profiling is active.
+
+    :param name: phase name
+    :return: context manager (does nothing when profiling is inactive)
+    """
+    if _ACTIVE is None:
+        return _INACTIVE
+    return _ACTIVE.phase(name)
+
+
+def profiled(name: str) -> Callable[[FuncT], FuncT]:
+    """
+    Record every call of decorated function under phase.
+
+    :param name: phase name
+    :return: decorator
+    """
+
+    def decorator(func: FuncT) -> FuncT:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _ACTIVE is None:
+                return func(*args, **kwargs)
+            with _ACTIVE.phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
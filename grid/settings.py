@@ -1,658 +1,32 @@
-"""Settings for the grind settings."""
-from typing import List, NamedTuple
+"""
+Settings for the grind settings.
+
+Settings live in data files ('settings.toml' and one '.pool' file per
+difficulty), get_setting reads a difficulty once and caches it.
+"""
+import os
+import sys
 from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
-# ---Settings Start ---
-# Difficulty
-EASY_MIN: int = 3
-EASY_MAX: int = 5
-ADVANCE_MIN: int = 6
-ADVANCE_MAX: int = 8
-EXPERT_MIN: int = 9
-EXPERT_MAX: int = 10
-MASTER_MIN: int = 11
-MASTER_MAX: int = 12
-# Grid Dimensions
-NUM_OF_ROWS: int = 16  # in grid
-FEEDBACK_LINE_SIZE: int = 14
-ACTIVE_LINE_SIZE: int = 12
-HEX_LINE_SIZE: int = 6  # column line size
-# Hex Range
-HEX_COL_MIN: int = 4096
-HEX_COL_MAX: int = 61430
-# Filler
-FILLER_SYMBOLS: List[str] = [
-    "!",
-    "@",
-    "#",
-    "$",
-    "%",
-    "^",
-    "&",
-    "*",
-    "+",
-    "=",
-    "-",
-    "|",
-    ":",
-    ";",
-    ",",
-    ".",
-    "?",
-    "~",
-    "`",
-]
-# Password Pools
-PASS_POOL_SIZE = 150
-easy_pass_pool: List[str] = [
-    "pre",
-    "lope",
-    "runny",
-    "hooch",
-    "mop",
-    "loire",
-    "fur",
-    "not",
-    "glass",
-    "mere",
-    "dog",
-    "sunk",
-    "carla",
-    "wheat",
-    "titus",
-    "god",
-    "tater",
-    "trim",
-    "joy",
-    "waive",
-    "bream",
-    "owe",
-    "death",
-    "byron",
-    "grill",
-    "boon",
-    "bey",
-    "wage",
-    "you",
-    "daley",
-    "lsi",
-    "deneb",
-    "spent",
-    "white",
-    "slice",
-    "card",
-    "yon",
-    "lars",
-    "aiken",
-    "bryan",
-    "privy",
-    "bossy",
-    "where",
-    "reedy",
-    "tim",
-    "pablo",
-    "eat",
-    "creed",
-    "clasp",
-    "junco",
-    "rage",
-    "moldy",
-    "ample",
-    "prof",
-    "fend",
-    "funky",
-    "zen",
-    "hausa",
-    "race",
-    "cheat",
-    "trw",
-    "tag",
-    "dully",
-    "flood",
-    "quick",
-    "bade",
-    "rest",
-    "rape",
-    "plume",
-    "congo",
-    "chive",
-    "wave",
-    "hymen",
-    "moser",
-    "potts",
-    "sorry",
-    "berea",
-    "patio",
-    "mint",
-    "slope",
-    "seamy",
-    "hedge",
-    "gould",
-    "seven",
-    "karol",
-    "clod",
-    "stood",
-    "saxon",
-    "bleak",
-    "bizet",
-    "peste",
-    "pasha",
-    "rally",
-    "beige",
-    "foist",
-    "blunt",
-    "shad",
-    "brush",
-    "moran",
-    "trump",
-    "twa",
-    "ala",
-    "junta",
-    "winch",
-    "crepe",
-    "storm",
-    "bassi",
-    "poole",
-    "hill",
-    "count",
-    "howdy",
-    "rear",
-    "pump",
-    "bay",
-    "hines",
-    "lent",
-    "smelt",
-    "hilly",
-    "biota",
-    "cal",
-    "hole",
-    "drown",
-    "sky",
-    "dante",
-    "jowly",
-    "cream",
-    "rilly",
-    "foggy",
-    "rabid",
-    "rosen",
-    "crime",
-    "plato",
-    "frick",
-    "anise",
-    "ising",
-    "sick",
-    "anton",
-    "store",
-    "tooth",
-    "chill",
-    "rusty",
-    "dew",
-    "ere",
-    "sniff",
-    "meant",
-    "strip",
-    "mace",
-    "inc",
-    "frock",
-    "polio",
-]
-advanced_pass_pool: List[str] = [
-    "laterite",
-    "fleming",
-    "walkway",
-    "wrangle",
-    "shriek",
-    "default",
-    "commune",
-    "trellis",
-    "handset",
-    "vampire",
-    "ellison",
-    "horology",
-    "coffman",
-    "manuel",
-    "bolivar",
-    "melanie",
-    "wherein",
-    "cartel",
-    "derange",
-    "convene",
-    "tonnage",
-    "vincent",
-    "castle",
-    "interim",
-    "seaside",
-    "marcia",
-    "forest",
-    "sprite",
-    "drumlin",
-    "antonio",
-    "vanilla",
-    "denver",
-    "brazier",
-    "shorten",
-    "comrade",
-    "piggish",
-    "durance",
-    "latter",
-    "during",
-    "irritate",
-    "batwing",
-    "saddle",
-    "swarthy",
-    "panther",
-    "despoil",
-    "nickel",
-    "perilla",
-    "crimson",
-    "galilee",
-    "snagging",
-    "stepson",
-    "legging",
-    "chariot",
-    "society",
-    "bonnie",
-    "biotite",
-    "decile",
-    "culvert",
-    "wayside",
-    "chaplin",
-    "barnard",
-    "conant",
-    "currant",
-    "manioc",
-    "ballot",
-    "matilda",
-    "dominate",
-    "airfare",
-    "barton",
-    "beguile",
-    "defeat",
-    "guanine",
-    "forbade",
-    "torpor",
-    "intimal",
-    "contour",
-    "carlin",
-    "calvert",
-    "browne",
-    "nestle",
-    "squint",
-    "humble",
-    "miranda",
-    "moliere",
-    "shearer",
-    "patriot",
-    "ginseng",
-    "angeline",
-    "theses",
-    "perish",
-    "sideline",
-    "baneful",
-    "stereo",
-    "watson",
-    "roughen",
-    "explode",
-    "pastor",
-    "append",
-    "delete",
-    "crispin",
-    "stannic",
-    "fragile",
-    "perfidy",
-    "balance",
-    "formic",
-    "simper",
-    "detonate",
-    "emirate",
-    "maurice",
-    "watkins",
-    "sidecar",
-    "pastry",
-    "chorale",
-    "wrench",
-    "roberto",
-    "silent",
-    "thoreau",
-    "therapy",
-    "accost",
-    "incant",
-    "therell",
-    "cushing",
-    "valuate",
-    "alumina",
-    "sumeria",
-    "concise",
-    "hurtle",
-    "surtout",
-    "decimal",
-    "wattle",
-    "blemish",
-    "gunfire",
-    "jarvin",
-    "distant",
-    "hustle",
-    "morsel",
-    "secant",
-    "consign",
-    "blanch",
-    "bulbous",
-    "migrant",
-    "geneva",
-    "narrow",
-    "pension",
-    "bowline",
-    "moderate",
-    "pentane",
-    "chagrin",
-    "fenton",
-    "nullify",
-]
-expert_pass_pool: List[str] = [
-    "osteology",
-    "merriment",
-    "cardboard",
-    "attendant",
-    "transport",
-    "constrict",
-    "stalemate",
-    "alternate",
-    "admiration",
-    "officiate",
-    "resumption",
-    "regression",
-    "rabbinate",
-    "ironstone",
-    "nameplate",
-    "secession",
-    "competent",
-    "propitious",
-    "collusion",
-    "historian",
-    "zoroaster",
-    "siliceous",
-    "germinate",
-    "oscillate",
-    "turnstone",
-    "expressive",
-    "cooperate",
-    "integrate",
-    "agreeable",
-    "lousewort",
-    "intensify",
-    "detention",
-    "accession",
-    "placeable",
-    "transform",
-    "obtrusive",
-    "exculpate",
-    "intervene",
-    "histology",
-    "secretive",
-    "transcend",
-    "denotation",
-    "determine",
-    "headboard",
-    "reserpine",
-    "longitude",
-    "definition",
-    "statesman",
-    "inducible",
-    "anthology",
-    "depressive",
-    "contagion",
-    "revulsion",
-    "greenland",
-    "acceptant",
-    "dashboard",
-    "resistant",
-    "altercate",
-    "buckboard",
-    "deceptive",
-    "ineffable",
-    "chipboard",
-    "sublimate",
-    "atrocious",
-    "doctorate",
-    "invisible",
-    "moldboard",
-    "inevitable",
-    "vaccinate",
-    "contention",
-    "pervasive",
-    "dandelion",
-    "invective",
-    "disparate",
-    "catatonia",
-    "pathology",
-    "fibration",
-    "navigable",
-    "quadratic",
-    "intestine",
-    "dispersion",
-    "oppressor",
-    "vindicate",
-    "revelation",
-    "parkinson",
-    "transpose",
-    "restraint",
-    "melodious",
-    "veritable",
-    "seclusion",
-    "colloidal",
-    "cattleman",
-    "promenade",
-    "seduction",
-    "communion",
-    "peregrine",
-    "denigrate",
-    "commingle",
-    "habituate",
-    "corrosive",
-    "infuriate",
-    "incurring",
-    "incapable",
-    "incentive",
-    "regressive",
-    "bedspring",
-    "imperfect",
-    "instigate",
-    "corrosion",
-    "advertise",
-    "lithology",
-    "watertown",
-    "cormorant",
-    "abstinent",
-    "corruption",
-    "facetious",
-    "excelsior",
-    "ineducable",
-    "pragmatic",
-    "incessant",
-    "waterhole",
-    "speculate",
-    "corrector",
-    "tribulate",
-    "combinate",
-    "intensive",
-    "inclusion",
-    "conclusion",
-    "sentiment",
-    "deterrent",
-    "coalition",
-    "traceable",
-    "nefarious",
-    "commodity",
-    "extrusion",
-    "expurgate",
-    "repudiate",
-    "telemeter",
-    "ponderous",
-    "catalytic",
-    "injustice",
-    "divination",
-    "deflector",
-    "ferocious",
-    "confluent",
-    "deputation",
-    "oblivious",
-    "patristic",
-    "insurgent",
-    "millstone",
-]
-master_pass_pool: List[str] = [
-    "conservatory",
-    "importation",
-    "machination",
-    "exterminate",
-    "retardation",
-    "consultation",
-    "institution",
-    "conservation",
-    "inadvisable",
-    "conferrable",
-    "convertible",
-    "indefinable",
-    "workstation",
-    "explanation",
-    "restoration",
-    "impermeable",
-    "reservation",
-    "ineluctable",
-    "presumption",
-    "commiserate",
-    "lamentation",
-    "depredation",
-    "recriminate",
-    "comparative",
-    "contraption",
-    "considerate",
-    "inalienable",
-    "reclamation",
-    "intercalate",
-    "declarative",
-    "exclamation",
-    "approbation",
-    "provocation",
-    "exploration",
-    "committable",
-    "exhortation",
-    "restitution",
-    "resignation",
-    "acclamation",
-    "indentation",
-    "deprivation",
-    "expectation",
-    "affirmation",
-    "presentation",
-    "declaratory",
-    "attestation",
-    "inescapable",
-    "inseparable",
-    "compunction",
-    "constructor",
-    "infestation",
-    "contaminate",
-    "coeducation",
-    "inclination",
-    "interrogate",
-    "determinate",
-    "retribution",
-    "consolidate",
-    "declamation",
-    "preservation",
-    "constantine",
-    "inquisition",
-    "inscription",
-    "condensible",
-    "increasable",
-    "requisition",
-    "indigestion",
-    "contemplate",
-    "insuperable",
-    "inscrutable",
-    "contributor",
-    "collectible",
-    "micrography",
-    "conversation",
-    "decorticate",
-    "inferential",
-    "incomparable",
-    "intolerable",
-    "information",
-    "consumptive",
-    "consternate",
-    "degradation",
-    "inflammable",
-    "illimitable",
-    "indubitable",
-    "impartation",
-    "conflagrate",
-    "computation",
-    "interpolate",
-    "prohibition",
-    "examination",
-    "indignation",
-    "expressible",
-    "permutation",
-    "commentator",
-    "conservator",
-    "irreparable",
-    "connotation",
-    "concentrate",
-    "consolation",
-    "trepidation",
-    "countenance",
-    "conspirator",
-    "innumerable",
-    "intractable",
-    "depressible",
-    "declination",
-    "restorative",
-    "inalterable",
-    "declamatory",
-    "confederate",
-    "inexcusable",
-    "inequitable",
-    "inessential",
-    "respiration",
-    "compilation",
-    "inestimable",
-    "depreciable",
-    "compensable",
-    "deteriorate",
-    "detestation",
-    "preparation",
-    "constrictor",
-    "informative",
-    "proposition",
-    "competition",
-    "convolution",
-    "declaration",
-    "inattention",
-    "indomitable",
-    "constellate",
-    "inspiration",
-    "assignation",
-    "incantation",
-    "incorporate",
-    "ostentation",
-    "deformation",
-    "composition",
-    "deportation",
-    "publication",
-    "mensuration",
-    "transfusion",
-    "description",
-    "regrettable",
-    "observation",
-    "consumption",
-    "irrefutable",
-    "transferred",
-    "confirmation",
-    "exportation",
-]
-# ---Settings End ---
+# Directory with settings.toml and password pools
+DATA_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+# Environment variable to use a different data directory
+DATA_DIR_ENV: str = "PREWAR_LOGIN_DATA"
+# Characters that start and end secrets, cannot be filler
+SECRET_BRACKETS: str = "()[]{}<>"
+# How likeness of a dud to the password is counted
+LIKENESS_MODES: Tuple[str, ...] = (
+    "positional",  # same letter in same place (original game)
+    "overlap",  # letters in common, in any place
+    "edit",  # longest word length less edit (Levenshtein) distance
+)
 
 
 class DifficultyType(Enum):
@@ -678,60 +52,316 @@ class SettingGrid(NamedTuple):
     PASS_POOL_SIZE: int
     FILLER_SYMBOLS: List[str]
     pass_pool: List[str]
+    SCREENS: int = 1  # boards of NUM_OF_ROWS // SCREENS rows stacked (marathon)
+    COLUMNS: int = 2  # hex and active column pairs side by side
+    FILLER_SECRETS: bool = False  # secrets are bracket pairs in filler
+    LIKENESS: str = "positional"  # one of LIKENESS_MODES
+    TARGET_GUESSES: float = 0.0  # expected guesses of adaptive boards, 0 is off
 
 
-DEFAULT_EASY = SettingGrid(
-    EASY_MIN,
-    EASY_MAX,
-    NUM_OF_ROWS,
-    FEEDBACK_LINE_SIZE,
-    ACTIVE_LINE_SIZE,
-    HEX_LINE_SIZE,
-    HEX_COL_MIN,
-    HEX_COL_MAX,
-    PASS_POOL_SIZE,
-    FILLER_SYMBOLS,
-    easy_pass_pool,
-)
+def get_setting(
+    difficulty: DifficultyType, data_dir: Optional[str] = None
+) -> SettingGrid:
+    """
+    Grid settings for a selected difficulty.
 
-DEFAULT_ADVANCED = SettingGrid(
-    ADVANCE_MIN,
-    ADVANCE_MAX,
-    NUM_OF_ROWS,
-    FEEDBACK_LINE_SIZE,
-    ACTIVE_LINE_SIZE,
-    HEX_LINE_SIZE,
-    HEX_COL_MIN,
-    HEX_COL_MAX,
-    PASS_POOL_SIZE,
-    FILLER_SYMBOLS,
-    advanced_pass_pool,
-)
+    Only the selected difficulty is read, it is validated once and cached.
+    :param difficulty: difficulty to get settings for
+    :param data_dir: settings directory (default $PREWAR_LOGIN_DATA or DATA_DIR)
+    :return: settings of difficulty
+    """
+    if data_dir is None:
+        data_dir = os.environ.get(DATA_DIR_ENV, DATA_DIR)
+    return _load_setting(difficulty, data_dir)
 
-DEFAULT_EXPERT = SettingGrid(
-    EXPERT_MIN,
-    EXPERT_MAX,
-    NUM_OF_ROWS,
-    FEEDBACK_LINE_SIZE,
-    ACTIVE_LINE_SIZE,
-    HEX_LINE_SIZE,
-    HEX_COL_MIN,
-    HEX_COL_MAX,
-    PASS_POOL_SIZE,
-    FILLER_SYMBOLS,
-    expert_pass_pool,
-)
 
-DEFAULT_MASTER = SettingGrid(
-    MASTER_MIN,
-    MASTER_MAX,
-    NUM_OF_ROWS,
-    FEEDBACK_LINE_SIZE,
-    ACTIVE_LINE_SIZE,
-    HEX_LINE_SIZE,
-    HEX_COL_MIN,
-    HEX_COL_MAX,
-    PASS_POOL_SIZE,
-    FILLER_SYMBOLS,
-    master_pass_pool,
-)
+def marathon(setting: SettingGrid, screens: int) -> SettingGrid:
+    """
+    Build settings of a marathon grid, screens boards stacked into one grid.
+
+    Duds and secrets scale with screens, HEX_COL_MAX is lowered so every
+    address still fits HEX_LINE_SIZE.
+    :param setting: settings of a single screen
+    :param screens: number of screens in grid
+    :return: settings of marathon grid
+    """
+    if setting.SCREENS != 1:
+        raise ValueError("setting is already a marathon setting")
+    if screens < 1:
+        raise ValueError(f"Screens ({screens}) must be 1 or more")
+    return _fit_hex(
+        setting._replace(NUM_OF_ROWS=setting.NUM_OF_ROWS * screens, SCREENS=screens)
+    )
+
+
+def wide(setting: SettingGrid, columns: int) -> SettingGrid:
+    """
+    Build settings of a grid with columns hex and active column pairs.
+
+    HEX_COL_MAX is lowered so every address still fits HEX_LINE_SIZE.
+    :param setting: settings to widen
+    :param columns: hex and active column pairs
+    :return: settings of wide grid
+    """
+    if columns < 1:
+        raise ValueError(f"Columns ({columns}) must be 1 or more")
+    return _fit_hex(setting._replace(COLUMNS=columns))
+
+
+def validate_setting(setting: SettingGrid) -> None:
+    """
+    Ensure setting values work together.
+
+    Raise ValueError on the first issue found.
+    :param setting: settings to validate
+    """
+    _validate_grid(setting)
+    _validate_modes(setting)
+    _validate_pool(setting)
+
+
+def filler_secrets(setting: SettingGrid) -> SettingGrid:
+    """
+    Build settings where secrets are bracket pairs in filler, like the original game.
+
+    Filler gets SECRET_BRACKETS and any matched pair on a row with no
+    letters between is a secret, instead of standalone secrets.
+    :param setting: settings to change
+    :return: settings with filler secrets
+    """
+    return setting._replace(FILLER_SECRETS=True)
+
+
+def likeness(setting: SettingGrid, mode: str) -> SettingGrid:
+    """
+    Build settings where dud likeness is counted by mode.
+
+    Password pools work for every mode, overlap and edit likeness are never
+    lower than positional likeness.
+    :param setting: settings to change
+    :param mode: one of LIKENESS_MODES
+    :return: settings with likeness mode
+    """
+    changed: SettingGrid = setting._replace(LIKENESS=mode)
+    validate_setting(changed)
+    return changed
+
+
+def target_guesses(setting: SettingGrid, target: float) -> SettingGrid:
+    """
+    Build settings of adaptive boards, picked so solving takes about target guesses.
+
+    See grid.adaptive, only single screen boards can be adaptive.
+    :param setting: settings to change
+    :param target: expected guesses to find the password
+    :return: settings with target guesses
+    """
+    changed: SettingGrid = setting._replace(TARGET_GUESSES=target)
+    validate_setting(changed)
+    return changed
+
+
+# Private
+def _validate_grid(setting: SettingGrid) -> None:
+    """
+    Ensure word sizes, rows, columns, addresses and filler fit the grid.
+
+    :param setting: settings to validate
+    """
+    if not 0 < setting.MIN < setting.MAX:
+        raise ValueError(f"MIN ({setting.MIN}) and MAX ({setting.MAX}) out of order")
+    if setting.MAX > setting.ACTIVE_LINE_SIZE:
+        raise ValueError("MAX word size is larger then ACTIVE_LINE_SIZE")
+    if setting.SCREENS < 1 or setting.NUM_OF_ROWS % setting.SCREENS:
+        raise ValueError(f"NUM_OF_ROWS not a multiple of SCREENS ({setting.SCREENS})")
+    if setting.COLUMNS < 1:
+        raise ValueError(f"COLUMNS ({setting.COLUMNS}) must be 1 or more")
+    lines: int = setting.COLUMNS * setting.NUM_OF_ROWS
+    last_hex: int = setting.HEX_COL_MAX + 2 * lines - 1
+    for hex_value in (setting.HEX_COL_MIN, setting.HEX_COL_MAX, last_hex):
+        if len(hex(hex_value)) != setting.HEX_LINE_SIZE:
+            raise ValueError(f"Hex ({hex_value}) does not fit HEX_LINE_SIZE")
+    for symbol in setting.FILLER_SYMBOLS:
+        if len(symbol) != 1 or symbol in SECRET_BRACKETS or symbol.isalpha():
+            raise ValueError(f"Invalid filler symbol ({symbol})")
+
+
+def _validate_modes(setting: SettingGrid) -> None:
+    """
+    Ensure likeness mode and target guesses are known and fit the grid.
+
+    :param setting: settings to validate
+    """
+    if setting.LIKENESS not in LIKENESS_MODES:
+        raise ValueError(f"Unknown LIKENESS ({setting.LIKENESS})")
+    if setting.TARGET_GUESSES and setting.TARGET_GUESSES < 1:
+        raise ValueError(f"TARGET_GUESSES ({setting.TARGET_GUESSES}) must be 1 or more")
+    if setting.TARGET_GUESSES and setting.SCREENS != 1:
+        raise ValueError("TARGET_GUESSES needs a single screen (no marathon)")
+
+
+def _validate_pool(setting: SettingGrid) -> None:
+    """
+    Ensure the password pool has PASS_POOL_SIZE lowercase words in range.
+
+    :param setting: settings to validate
+    """
+    if len(setting.pass_pool) != setting.PASS_POOL_SIZE:
+        raise ValueError(
+            f"Password pool size ({len(setting.pass_pool)}) "
+            f"is not PASS_POOL_SIZE ({setting.PASS_POOL_SIZE})"
+        )
+    for password in setting.pass_pool:
+        if not (password.isalpha() and password.islower()):
+            raise ValueError(f"Password ({password}) is not lowercase letters")
+        if not setting.MIN <= len(password) <= setting.MAX:
+            raise ValueError(f"Password ({password}) not in MIN/MAX range")
+
+
+def _fit_hex(setting: SettingGrid) -> SettingGrid:
+    """
+    Lower HEX_COL_MAX so every address fits HEX_LINE_SIZE, then validate.
+
+    :param setting: settings to fit
+    :return: fitted settings
+    """
+    # addresses go up by 2 per line over every column
+    lines: int = setting.COLUMNS * setting.NUM_OF_ROWS
+    hex_max: int = min(
+        setting.HEX_COL_MAX, 16 ** (setting.HEX_LINE_SIZE - 2) - 2 * lines
+    )
+    if hex_max < setting.HEX_COL_MIN:
+        raise ValueError(f"Grid of {lines} lines does not fit HEX_LINE_SIZE")
+    fitted: SettingGrid = setting._replace(HEX_COL_MAX=hex_max)
+    validate_setting(fitted)
+    return fitted
+
+
+@lru_cache(maxsize=None)
+def _load_setting(difficulty: DifficultyType, data_dir: str) -> SettingGrid:
+    """
+    Read, validate and build settings of a difficulty.
+
+    :param difficulty: difficulty to read
+    :param data_dir: directory with settings.toml and password pools
+    :return: settings of difficulty
+    """
+    config: Dict[str, Any] = _read_config(data_dir)
+    try:
+        grid: Dict[str, Any] = config["grid"]
+        level: Dict[str, Any] = config["difficulty"][difficulty.name]
+        pool_file: str = level["pass_pool"]
+    except KeyError as error:
+        raise ValueError(f"settings.toml is missing {error}") from error
+    with open(os.path.join(data_dir, pool_file), encoding="utf-8") as pool:
+        pass_pool: List[str] = [word.strip() for word in pool if word.strip()]
+    try:
+        setting = SettingGrid(
+            level["MIN"],
+            level["MAX"],
+            grid["NUM_OF_ROWS"],
+            grid["FEEDBACK_LINE_SIZE"],
+            grid["ACTIVE_LINE_SIZE"],
+            grid["HEX_LINE_SIZE"],
+            grid["HEX_COL_MIN"],
+            grid["HEX_COL_MAX"],
+            grid["PASS_POOL_SIZE"],
+            list(grid["FILLER_SYMBOLS"]),
+            pass_pool,
+        )
+    except KeyError as error:
+        raise ValueError(f"settings.toml is missing {error}") from error
+    validate_setting(setting)
+    return setting
+
+
+@lru_cache(maxsize=None)
+def _read_config(data_dir: str) -> Dict[str, Any]:
+    """
+    Read settings.toml.
+
+    :param data_dir: directory with settings.toml
+    :return: parsed settings
+    """
+    with open(os.path.join(data_dir, "settings.toml"), "rb") as config:
+        return tomllib.load(config)
+
+
+# Constants of earlier releases, read from the data directory when first used
+DEFAULT_EASY: SettingGrid
+DEFAULT_ADVANCED: SettingGrid
+DEFAULT_EXPERT: SettingGrid
+DEFAULT_MASTER: SettingGrid
+EASY_MIN: int
+EASY_MAX: int
+ADVANCE_MIN: int
+ADVANCE_MAX: int
+EXPERT_MIN: int
+EXPERT_MAX: int
+MASTER_MIN: int
+MASTER_MAX: int
+NUM_OF_ROWS: int
+FEEDBACK_LINE_SIZE: int
+ACTIVE_LINE_SIZE: int
+HEX_LINE_SIZE: int
+HEX_COL_MIN: int
+HEX_COL_MAX: int
+PASS_POOL_SIZE: int
+FILLER_SYMBOLS: List[str]
+easy_pass_pool: List[str]
+advanced_pass_pool: List[str]
+expert_pass_pool: List[str]
+master_pass_pool: List[str]
+# Constant -> difficulty and field it is read from, "" for the whole setting
+_CONSTANTS: Dict[str, Tuple[DifficultyType, str]] = {
+    "DEFAULT_EASY": (DifficultyType.EASY, ""),
+    "DEFAULT_ADVANCED": (DifficultyType.ADVANCE, ""),
+    "DEFAULT_EXPERT": (DifficultyType.EXPERT, ""),
+    "DEFAULT_MASTER": (DifficultyType.MASTER, ""),
+    "EASY_MIN": (DifficultyType.EASY, "MIN"),
+    "EASY_MAX": (DifficultyType.EASY, "MAX"),
+    "ADVANCE_MIN": (DifficultyType.ADVANCE, "MIN"),
+    "ADVANCE_MAX": (DifficultyType.ADVANCE, "MAX"),
+    "EXPERT_MIN": (DifficultyType.EXPERT, "MIN"),
+    "EXPERT_MAX": (DifficultyType.EXPERT, "MAX"),
+    "MASTER_MIN": (DifficultyType.MASTER, "MIN"),
+    "MASTER_MAX": (DifficultyType.MASTER, "MAX"),
+    "NUM_OF_ROWS": (DifficultyType.EASY, "NUM_OF_ROWS"),
+    "FEEDBACK_LINE_SIZE": (DifficultyType.EASY, "FEEDBACK_LINE_SIZE"),
+    "ACTIVE_LINE_SIZE": (DifficultyType.EASY, "ACTIVE_LINE_SIZE"),
+    "HEX_LINE_SIZE": (DifficultyType.EASY, "HEX_LINE_SIZE"),
+    "HEX_COL_MIN": (DifficultyType.EASY, "HEX_COL_MIN"),
+    "HEX_COL_MAX": (DifficultyType.EASY, "HEX_COL_MAX"),
+    "PASS_POOL_SIZE": (DifficultyType.EASY, "PASS_POOL_SIZE"),
+    "FILLER_SYMBOLS": (DifficultyType.EASY, "FILLER_SYMBOLS"),
+    "easy_pass_pool": (DifficultyType.EASY, "pass_pool"),
+    "advanced_pass_pool": (DifficultyType.ADVANCE, "pass_pool"),
+    "expert_pass_pool": (DifficultyType.EXPERT, "pass_pool"),
+    "master_pass_pool": (DifficultyType.MASTER, "pass_pool"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Read a constant of earlier releases when first used (module __getattr__).
+
+    Reading them on import would read every difficulty, see get_setting.
+    :param name: constant name
+    :return: constant, lists are copies (changing them leaves the cached
+    settings alone)
+    """
+    if name not in _CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    difficulty, field = _CONSTANTS[name]
+    value: Any = get_setting(difficulty)
+    if field:
+        value = getattr(value, field)
+    if isinstance(value, list):
+        value = list(value)
+    globals()[name] = value
+    return value
+
+
+if sys.version_info < (3, 7):  # no module __getattr__ (PEP 562), read on import
+    for _name in _CONSTANTS:
+        __getattr__(_name)
@@ -0,0 +1,289 @@
+"""
+Word list stored as a DAWG (a trie with equal suffixes shared).
+
+Nodes and edges live in flat arrays, a fraction of the memory of a set of
+str. Pattern and positional likeness queries walk the graph and skip
+every branch that cannot match, instead of scanning every word.
+"""
+from array import array
+from sys import getsizeof
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+# Longest word stored, suffix lengths are kept as 64 bit masks
+MAX_LENGTH: int = 63
+# Any letter in a pattern
+WILDCARD: str = "."
+
+
+class WordTrie:
+    """WordTrie - minimal acyclic word graph with pruned queries."""
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        Build graph of different words.
+
+        Words are added in sorted order and equal suffixes merged as soon
+        as a branch is finished (Daciuk incremental construction).
+        :param words: words, at most MAX_LENGTH letters (empty words skipped)
+        """
+        children: List[Dict[str, int]] = [{}]
+        final: List[bool] = [False]
+        register: Dict[Tuple[bool, Tuple[Tuple[str, int], ...]], int] = {}
+        unchecked: List[Tuple[int, str, int]] = []  # (parent, letter, child)
+        previous: str = ""
+        count: int = 0
+
+        def minimize(down_to: int) -> None:
+            while len(unchecked) > down_to:
+                parent, letter, child = unchecked.pop()
+                key = final[child], tuple(sorted(children[child].items()))
+                if key in register:
+                    children[parent][letter] = register[key]
+                else:
+                    register[key] = child
+
+        for word in sorted(set(words)):
+            if not word:
+                continue
+            if len(word) > MAX_LENGTH:
+                raise ValueError(f"Word ({word[:10]}...) over {MAX_LENGTH} letters")
+            common: int = 0
+            for mine, theirs in zip(word, previous):
+                if mine != theirs:
+                    break
+                common += 1
+            minimize(common)
+            node: int = unchecked[-1][2] if unchecked else 0
+            for letter in word[common:]:
+                children.append({})
+                final.append(False)
+                children[node][letter] = len(children) - 1
+                unchecked.append((node, letter, len(children) - 1))
+                node = len(children) - 1
+            final[node] = True
+            previous = word
+            count += 1
+        minimize(0)
+        self._count: int = count
+        self._freeze(children, final)
+
+    def __len__(self) -> int:
+        """
+        Words in graph.
+
+        :return: number of words
+        """
+        return self._count
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Word in graph.
+
+        :param word: word
+        :return: T/F
+        """
+        if not isinstance(word, str):
+            return False
+        node: int = 0
+        for letter in word:
+            edge: int = self._labels.find(
+                letter, self._first[node], self._first[node + 1]
+            )
+            if edge < 0:
+                return False
+            node = self._targets[edge]
+        return bool(self._final[node])
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Words in sorted order.
+
+        :return: iterator of words
+        """
+        return self.pattern_range(1, MAX_LENGTH)
+
+    @property
+    def nodes(self) -> int:
+        """
+        Nodes after suffixes are merged.
+
+        :return: number of nodes
+        """
+        return len(self._final)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes of the node and edge arrays.
+
+        :return: bytes
+        """
+        parts = self._labels, self._first, self._targets, self._final, self._lengths
+        return sum(map(getsizeof, parts))
+
+    def pattern(self, pattern: str) -> Iterator[str]:
+        """
+        Words of the pattern length with its letters in place.
+
+        e.g. '..a..e.' is 7 letters, 'a' third and 'e' sixth.
+        :param pattern: letters and WILDCARD for any letter
+        :return: iterator of words, sorted
+        """
+        return self._walk(pattern, len(pattern), len(pattern))
+
+    def pattern_range(self, minimum: int, maximum: int) -> Iterator[str]:
+        """
+        Words between minimum and maximum letters.
+
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        :return: iterator of words, sorted
+        """
+        return self._walk("", minimum, maximum)
+
+    def similar(
+        self,
+        word: str,
+        low: int,
+        high: Optional[int] = None,
+        minimum: int = 1,
+        maximum: int = MAX_LENGTH,
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Words with between low and high letters in the same place as word.
+
+        Positional likeness (see _word_tools.likeness), a branch is left
+        once it has too many matches or too few letters left to reach low.
+        :param word: word to compare against
+        :param low: fewest matching letters
+        :param high: most matching letters (default len(word))
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        :return: iterator of (word, likeness), sorted
+        """
+        if high is None:
+            high = len(word)
+        wanted: int = self._wanted(minimum, maximum)
+        # (node, prefix, matches)
+        stack: List[Tuple[int, str, int]] = [(0, "", 0)]
+        while stack:
+            node, prefix, matches = stack.pop()
+            depth: int = len(prefix)
+            if not self._lengths[node] & (wanted >> depth):
+                continue
+            if matches + max(len(word) - depth, 0) < low:  # cannot reach low
+                continue
+            if self._final[node] and (wanted >> depth) & 1 and matches >= low:
+                yield prefix, matches
+            target: str = word[depth] if depth < len(word) else ""
+            stack.extend(
+                (child, prefix + letter, matches + (letter == target))
+                for child, letter in self._edges(node)
+                if matches + (letter == target) <= high
+            )
+
+    # Private
+    def _freeze(self, children: List[Dict[str, int]], final: List[bool]) -> None:
+        """
+        Store reachable nodes in flat arrays, root first.
+
+        Edges of node n are labels[first[n]:first[n + 1]], sorted, each
+        going to targets. lengths[n] has bit k set when a word ends k
+        letters below n.
+        :param children: letter -> child of every built node
+        :param final: node ends a word, of every built node
+        """
+        order: List[int] = []  # post order, children before parents
+        seen: Dict[int, int] = {}
+        stack: List[Tuple[int, bool]] = [(0, False)]
+        while stack:
+            node, done = stack.pop()
+            if done:
+                seen[node] = len(order)
+                order.append(node)
+            elif node not in seen:
+                seen[node] = -1
+                stack.append((node, True))
+                stack.extend(
+                    (child, False)
+                    for child in children[node].values()
+                    if child not in seen
+                )
+        number: Dict[int, int] = {node: len(order) - 1 - seen[node] for node in order}
+        lengths: Dict[int, int] = {}
+        for node in order:
+            mask: int = int(final[node])
+            for child in children[node].values():
+                mask |= lengths[child] << 1
+            lengths[node] = mask
+        labels: List[str] = []
+        self._first: "array[int]" = array("I")
+        self._targets: "array[int]" = array("I")
+        self._final: bytearray = bytearray()
+        self._lengths: "array[int]" = array("Q")
+        for node in reversed(order):  # root is node 0
+            self._first.append(len(labels))
+            self._final.append(final[node])
+            self._lengths.append(lengths[node] & ((1 << 64) - 1))
+            for letter, child in sorted(children[node].items()):
+                labels.append(letter)
+                self._targets.append(number[child])
+        self._first.append(len(labels))
+        self._labels: str = "".join(labels)
+
+    @staticmethod
+    def _wanted(minimum: int, maximum: int) -> int:
+        """
+        Length mask of minimum to maximum letters.
+
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        :return: bit k set for every allowed length k
+        """
+        maximum = min(maximum, MAX_LENGTH)
+        if maximum < minimum:
+            return 0
+        return ((1 << (maximum + 1)) - 1) ^ ((1 << minimum) - 1)
+
+    def _edges(self, node: int) -> Iterator[Tuple[int, str]]:
+        """
+        Children of a node, last letter first so a stack pops them sorted.
+
+        :param node: node number
+        :return: iterator of (child, letter)
+        """
+        for edge in range(self._first[node + 1] - 1, self._first[node] - 1, -1):
+            yield self._targets[edge], self._labels[edge]
+
+    def _walk(self, pattern: str, minimum: int, maximum: int) -> Iterator[str]:
+        """
+        Words between minimum and maximum letters starting like pattern.
+
+        :param pattern: letters and WILDCARD, words shorter than pattern
+        never match it
+        :param minimum: minimum letters allowed in a word.
+        :param maximum: maximum letters allowed in a word.
+        :return: iterator of words, sorted
+        """
+        wanted: int = self._wanted(max(minimum, len(pattern)), maximum)
+        stack: List[Tuple[int, str]] = [(0, "")]
+        while stack:
+            node, prefix = stack.pop()
+            depth: int = len(prefix)
+            if not self._lengths[node] & (wanted >> depth):
+                continue
+            if self._final[node] and (wanted >> depth) & 1:
+                yield prefix
+            start, end = self._first[node], self._first[node + 1]
+            fixed: str = pattern[depth] if depth < len(pattern) else WILDCARD
+            if fixed != WILDCARD:
+                edge: int = self._labels.find(fixed, start, end)
+                if edge >= 0:
+                    stack.append((self._targets[edge], prefix + fixed))
+                continue
+            stack.extend(
+                (child, prefix + letter) for child, letter in self._edges(node)
+            )
@@ -0,0 +1,232 @@
+"""
+Word lists streamed from files into a Dictionary.
+
+Plain, gzip, bzip2, xz and zstd files are told apart by their first bytes
+and read a line at a time, words are bucketed as they arrive. Index files
+(see write_index) hold words already bucketed by length, only the lengths
+asked for are read.
+"""
+import io
+import os
+from typing import IO, Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
+from grid.dictionary import Dictionary
+
+# Black styling Preferred
+# pylint: disable=c0330
+
+Opener = Callable[[str], IO[bytes]]  # path -> decompressed binary stream
+
+# First line of index files
+INDEX_HEADER: bytes = b"#prewar-login-index 1\n"
+# Index of the built in word list, write_index of english_words_lower_alpha_set
+BUILT_IN: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "data", "words.index"
+)
+ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+
+
+def _open_gzip(path: str) -> IO[bytes]:
+    """
+    Open a gzip file, gzip is imported on first use (keeps startup cheap).
+
+    :param path: file
+    :return: decompressed binary stream
+    """
+    import gzip  # pylint: disable=C0415
+
+    return cast(IO[bytes], gzip.open(path))
+
+
+def _open_bz2(path: str) -> IO[bytes]:
+    """
+    Open a bzip2 file, bz2 is imported on first use.
+
+    :param path: file
+    :return: decompressed binary stream
+    """
+    import bz2  # pylint: disable=C0415
+
+    return cast(IO[bytes], bz2.open(path))
+
+
+def _open_xz(path: str) -> IO[bytes]:
+    """
+    Open an xz file, lzma is imported on first use.
+
+    :param path: file
+    :return: decompressed binary stream
+    """
+    import lzma  # pylint: disable=C0415
+
+    return cast(IO[bytes], lzma.open(path))
+
+
+def _open_zstd(path: str) -> IO[bytes]:
+    """
+    Open a zstd file, with compression.zstd (Python 3.14) or zstandard.
+
+    :param path: file
+    :return: decompressed binary stream
+    """
+    try:
+        from compression import zstd  # type: ignore # pylint: disable=C0415
+
+        return zstd.open(path)  # type: ignore
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore # pylint: disable=C0415
+    except ImportError as error:
+        raise ValueError(
+            f"{path} is zstd compressed, install zstandard to read it"
+        ) from error
+    return zstandard.open(path, "rb")  # type: ignore
+
+
+# First bytes -> opener, see register
+OPENERS: Dict[bytes, Opener] = {
+    b"\x1f\x8b": _open_gzip,
+    b"BZh": _open_bz2,
+    b"\xfd7zXZ\x00": _open_xz,
+    ZSTD_MAGIC: _open_zstd,
+}
+
+
+def register(magic: bytes, opener: Opener) -> None:
+    """
+    Read files starting with magic through opener.
+
+    :param magic: first bytes of the format
+    :param opener: path -> decompressed binary stream
+    """
+    if not magic:
+        raise ValueError("magic must not be empty")
+    OPENERS[magic] = opener
+
+
+def read_words(path: str) -> Iterator[str]:
+    """
+    Words of a word list file, streamed.
+
+    Whitespace separated words, lines starting with '#' are skipped.
+    :param path: plain or compressed (see OPENERS) UTF-8 word list
+    :return: iterator of words as written
+    """
+    with _open(path) as binary, io.TextIOWrapper(binary, encoding="utf-8") as text:
+        for line in text:
+            if not line.startswith("#"):
+                yield from line.split()
+
+
+def load(path: str, minimum: int = 1, maximum: Optional[int] = None) -> Dictionary:
+    """
+    Load a dictionary from a word list or index file.
+
+    Only words of minimum to maximum letters a to z are kept (see
+    Dictionary).
+    :param path: word list (see read_words) or index (see write_index)
+    :param minimum: shortest word kept
+    :param maximum: longest word kept (default every length)
+    :return: dictionary
+    """
+    with open(path, "rb") as raw:
+        is_index: bool = raw.read(len(INDEX_HEADER)) == INDEX_HEADER
+    if is_index:
+        return read_index(path, minimum, maximum)
+    return Dictionary(read_words(path), minimum, maximum)
+
+
+def read_frequencies(path: str) -> Dict[str, float]:
+    """
+    Read a word frequency table, streamed like read_words.
+
+    One 'word count' pair per line, lines starting with '#' are skipped,
+    a word listed twice keeps its highest count.
+    :param path: plain or compressed (see OPENERS) UTF-8 frequency table
+    :return: lowercase word -> count
+    """
+    counts: Dict[str, float] = {}
+    with _open(path) as binary, io.TextIOWrapper(binary, encoding="utf-8") as text:
+        for number, line in enumerate(text, 1):
+            fields: List[str] = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            try:
+                word, count = fields[0].lower(), float(fields[1])
+            except (IndexError, ValueError) as error:
+                raise ValueError(f"{path}:{number} is not 'word count'") from error
+            counts[word] = max(count, counts.get(word, count))
+    return counts
+
+
+def write_index(dictionary: Dictionary, path: str) -> None:
+    """
+    Save dictionary as an index file.
+
+    Header line, one 'length count offset size' line per length, a blank
+    line, then the sorted words of each length, one per line.
+    :param dictionary: dictionary to save
+    :param path: index file
+    """
+    sections: List[bytes] = []
+    table: List[str] = []
+    offset: int = 0
+    for length in dictionary.lengths:
+        words: List[str] = sorted(dictionary.bucket(length))
+        section: bytes = "\n".join(words).encode()
+        table.append(f"{length} {len(words)} {offset} {len(section)}\n")
+        sections.append(section)
+        offset += len(section)
+    with open(path, "wb") as index:
+        index.write(INDEX_HEADER + "".join(table).encode() + b"\n")
+        for section in sections:
+            index.write(section)
+
+
+def read_index(
+    path: str, minimum: int = 1, maximum: Optional[int] = None
+) -> Dictionary:
+    """
+    Read a dictionary from an index file, other lengths are never read.
+
+    :param path: index file (see write_index)
+    :param minimum: shortest word kept
+    :param maximum: longest word kept (default every length)
+    :return: dictionary
+    """
+    buckets: Dict[int, Set[str]] = {}
+    with open(path, "rb") as index:
+        if index.readline() != INDEX_HEADER:
+            raise ValueError(f"{path} is not a word list index")
+        table: List[Tuple[int, int, int, int]] = []
+        for line in iter(index.readline, b"\n"):
+            if not line:
+                raise ValueError(f"{path} index table is cut short")
+            length, count, offset, size = map(int, line.split())
+            table.append((length, count, offset, size))
+        start: int = index.tell()
+        for length, count, offset, size in table:
+            if length < minimum or (maximum is not None and length > maximum):
+                continue
+            index.seek(start + offset)
+            words: List[str] = index.read(size).decode().split("\n")
+            if len(words) != count:
+                raise ValueError(f"{path} has {len(words)} words of {length}")
+            buckets[length] = set(words)
+    return Dictionary.from_buckets(buckets)
+
+
+# Private
+def _open(path: str) -> IO[bytes]:
+    """
+    Open a word list, decompressed when its first bytes are in OPENERS.
+
+    :param path: file
+    :return: binary stream
+    """
+    with open(path, "rb") as raw:
+        start: bytes = raw.read(max(map(len, OPENERS), default=0))
+    for magic, opener in OPENERS.items():
+        if start.startswith(magic):
+            return opener(path)
+    return open(path, "rb")
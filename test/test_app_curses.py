@@ -0,0 +1,496 @@
+"""Tests app_curses start up using pytest."""
+
+import compileall
+import fcntl
+import gzip
+import io
+import json
+import os
+import pty
+import re
+import select
+import struct
+import subprocess
+import sys
+import termios
+from pathlib import Path
+from time import perf_counter
+import curses
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import app_curses
+from grid.ansi import AnsiRenderer
+from grid.backend import Backend
+from grid.bucket_cache import CACHE_DIR_ENV, SUFFIX
+from grid.interface import Interface, Mouse
+from grid.latency import FRAME, disable, enable
+from grid.neighbours import NeighbourIndex, write_neighbours
+from grid.settings import DEFAULT_EASY, LIKENESS_MODES, marathon
+from grid._word_tools import trim
+
+# Protected access used to test functions and using fixtures
+# pylint: disable=W0212, W0621
+
+ROOT = Path(__file__).resolve().parent.parent
+# Time allowed from process spawn until the first frame is drawn
+STARTUP_BUDGET = 0.050
+# Over budget runs fail only past STARTUP_MARGIN times it on a fast runner (bare
+# interpreter within FAST_INTERPRETER), others report the time and skip
+STARTUP_MARGIN = 1.5
+FAST_INTERPRETER = 0.010
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep bucket cache of games started by tests out of the home directory."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def run_fresh(code):
+    """Run code in a new interpreter so imports are not cached."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=str(ROOT),
+        stdout=subprocess.PIPE,
+        check=True,
+        universal_newlines=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_arguments():
+    """Ensure arguments parse with defaults."""
+    args = app_curses.arguments(["expert"])
+    assert args.action == "expert"
+    assert args.tries == 4
+    assert args.secret
+    assert not args.startup_profile
+    assert args.profile is None
+    assert args.latency is None
+    assert not args.ansi
+    assert args.marathon is None
+    assert args.columns == 2
+    assert not args.filler_secrets
+    assert args.likeness == "positional"
+    assert not args.hints
+    assert args.target_guesses is None
+    assert not args.cache
+    assert args.wordlist is None
+    assert args.frequencies is None
+    assert args.neighbours is None
+    assert app_curses.LIKENESS == LIKENESS_MODES
+    args = app_curses.arguments(
+        ["easy", "-s", "-t", "3", "--startup-profile", "--profile", "out"]
+        + ["--latency", "out.prom", "--ansi", "--marathon", "20", "--columns", "3"]
+        + ["--filler-secrets", "--likeness", "edit", "--hints"]
+        + ["--target-guesses", "2.5", "--cache"]
+        + ["--wordlist", "words.gz", "--frequencies", "counts.txt"]
+        + ["--neighbours", "easy.neighbours"]
+    )
+    assert args.tries == 3
+    assert not args.secret
+    assert args.startup_profile
+    assert args.profile == "out"
+    assert args.latency == "out.prom"
+    assert args.ansi
+    assert args.marathon == 20
+    assert args.columns == 3
+    assert args.filler_secrets
+    assert args.likeness == "edit"
+    assert args.hints
+    assert args.target_guesses == 2.5
+    assert args.cache
+    assert args.wordlist == "words.gz"
+    assert args.frequencies == "counts.txt"
+    assert args.neighbours == "easy.neighbours"
+    with pytest.raises(SystemExit):
+        app_curses.arguments(["impossible"])
+    with pytest.raises(SystemExit):
+        app_curses.arguments(["easy", "--marathon", "0"])
+    with pytest.raises(SystemExit):
+        app_curses.arguments(["easy", "--columns", "0"])
+
+
+def test_startup_profile():
+    """Ensure phases are recorded and reported."""
+    profile = app_curses.StartupProfile()
+    profile.mark("one")
+    profile.mark("two")
+    assert [phase for phase, _ in profile.phases] == ["one", "two"]
+    assert profile.total == pytest.approx(sum(sec for _, sec in profile.phases))
+    report = profile.report()
+    assert "one" in report
+    assert "total" in report
+
+
+class FakeScreen:
+    """Curses screen with queued keys."""
+
+    def __init__(self, keys):
+        """Queue keys."""
+        self.keys = list(keys)
+        self.delay = True
+
+    def getkey(self):
+        """Pop next key, raise when none are left in no delay mode."""
+        if not self.keys:
+            raise curses.error("no input")
+        return self.keys.pop(0)
+
+    def nodelay(self, flag):
+        """Record no delay mode."""
+        self.delay = not flag
+
+
+def calls(monkeypatch, grid):
+    """Record hover and select calls made on grid."""
+    made = []
+    for name in ("hover", "select"):
+        method = getattr(grid, name)
+
+        def record(*location, _name=name, _method=method):
+            made.append((_name, location))
+            return _method(*location)
+
+        monkeypatch.setattr(grid, name, record)
+    return made
+
+
+def test_pending_keys():
+    """Ensure every queued key is drained and delay mode is restored."""
+    screen = FakeScreen(["KEY_UP", "KEY_UP", "\n"])
+    assert app_curses.pending_keys(screen) == ["KEY_UP", "KEY_UP", "\n"]
+    assert screen.delay
+    assert app_curses.pending_keys(screen) == []  # timed out
+
+
+def test_pending_keys_mouse(monkeypatch):
+    """Ensure KEY_MOUSE is replaced by its mouse event."""
+    events = [(0, 30, 6, 0, curses.BUTTON1_PRESSED), (0, 8, 5, 0, 0)]
+
+    def getmouse():
+        if not events:
+            raise curses.error("no mouse event")
+        return events.pop(0)
+
+    monkeypatch.setattr(curses, "getmouse", getmouse)
+    screen = FakeScreen(["KEY_MOUSE", "d", "KEY_MOUSE", "KEY_MOUSE"])
+    assert app_curses.pending_keys(screen) == [
+        Mouse(6, 30, True),
+        "d",
+        Mouse(5, 8, False),
+        "KEY_MOUSE",  # event could not be read
+    ]
+
+
+def test_handle_keys_mouse(monkeypatch):
+    """Ensure mouse moves hover once and clicks select where clicked."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    player = Interface(4, grid.settings)
+    made = calls(monkeypatch, grid)
+    moves = [Mouse(5, place, False) for place in range(8, 12)]
+    assert app_curses.handle_keys(moves + [Mouse(0, 0, False)], grid, player) is None
+    assert made == [("hover", (0, 1, 4))]
+    made.clear()
+    app_curses.handle_keys([Mouse(6, 30, True), Mouse(6, 30, False)], grid, player)
+    assert made == [("select", (1, 2, 3))]
+
+
+def test_handle_keys_jump(monkeypatch):
+    """Ensure jumps move to the entry and hover it once."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    player = Interface(4, grid.settings)
+    made = calls(monkeypatch, grid)
+    second = grid.next_entry(0, 0, 0, 2)
+    app_curses.handle_keys(["\t", "\t"], grid, player)
+    assert player.exact_grid_location() == grid.next_entry(0, 0, 0, 2) == second
+    assert made == [("hover", second)]
+    made.clear()
+    app_curses.handle_keys(["2", "KEY_BTAB"], grid, player)
+    assert made == [("hover", grid.next_entry(*second, -2))]
+
+
+def test_handle_keys_coalesce(monkeypatch):
+    """Ensure moves in a batch hover only the final position."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    player = Interface(4, grid.settings)
+    made = calls(monkeypatch, grid)
+    assert app_curses.handle_keys(["d"] * 5 + ["s", "x"], grid, player) is None
+    assert made == [("hover", (0, 1, 5))]
+
+
+def test_handle_keys_select_order(monkeypatch):
+    """Ensure selects run in order at their own position."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    player = Interface(4, grid.settings)
+    made = calls(monkeypatch, grid)
+    app_curses.handle_keys(["s", "\n", "s", "\n"], grid, player)
+    assert made == [("select", (0, 1, 0)), ("select", (0, 2, 0))]
+    made.clear()
+    app_curses.handle_keys(["\n", "d"], grid, player)
+    assert made == [("select", (0, 2, 0)), ("hover", (0, 2, 1))]
+    assert app_curses.handle_keys(["d", "q", "d"], grid, player) == ("Game Quit", 0)
+
+
+def test_commands_cache(cache_dir):
+    """Ensure buckets are only cached on disk when asked for."""
+    app_curses.commands(app_curses.arguments(["easy"]), app_curses.StartupProfile())
+    assert not cache_dir.exists()
+    args = app_curses.arguments(["easy", "--cache"])
+    assert app_curses.commands(args, app_curses.StartupProfile()).cache is not None
+    assert [path.suffix for path in cache_dir.iterdir()] == [SUFFIX]
+
+
+def test_commands_wordlist(tmp_path):
+    """Ensure board words come from the word list file."""
+    path = tmp_path / "words.gz"
+    words = sorted(word for word in ewlaps if 3 <= len(word) <= 5)
+    path.write_bytes(gzip.compress("\n".join(words).encode()))
+    args = app_curses.arguments(["easy", "--wordlist", str(path)])
+    grid = app_curses.commands(args, app_curses.StartupProfile())
+    assert set(grid.entry_words()) - set(DEFAULT_EASY.pass_pool) <= set(words)
+    path.write_bytes(gzip.compress(b"cat dog"))  # too few duds
+    with pytest.raises(SystemExit):
+        app_curses.commands(args, app_curses.StartupProfile())
+    args = app_curses.arguments(["easy", "--wordlist", str(tmp_path / "missing")])
+    with pytest.raises(SystemExit):
+        app_curses.commands(args, app_curses.StartupProfile())
+
+
+def test_commands_frequencies(tmp_path):
+    """Ensure counts files are read and broken ones stop the game."""
+    path = tmp_path / "counts.txt"
+    path.write_text("# counts\nthe 900\ncat 12\n")
+    args = app_curses.arguments(["easy", "--frequencies", str(path)])
+    assert app_curses.commands(args, app_curses.StartupProfile()).entry_words()
+    path.write_text("dog many\n")
+    with pytest.raises(SystemExit):
+        app_curses.commands(args, app_curses.StartupProfile())
+
+
+def test_commands_neighbours(tmp_path):
+    """Ensure boards and hints use the neighbour file."""
+    path = tmp_path / "easy.neighbours"
+    words = trim(DEFAULT_EASY.MIN, DEFAULT_EASY.MAX, ewlaps)
+    write_neighbours(words, str(path), DEFAULT_EASY.pass_pool[:3])
+    args = app_curses.arguments(["easy", "--neighbours", str(path), "--hints"])
+    grid = app_curses.commands(args, app_curses.StartupProfile())
+    assert isinstance(grid.cache, NeighbourIndex)
+    hints = app_curses.start_hints(grid)
+    assert hints._neighbours is grid.cache
+    hints.close()
+    path.write_bytes(b"cat\n")
+    with pytest.raises(SystemExit):
+        app_curses.commands(args, app_curses.StartupProfile())
+
+
+def test_hints():
+    """Ensure hint key toggles the hint line, fed by grid events."""
+    args = app_curses.arguments(["easy", "--hints"])
+    grid = app_curses.commands(args, app_curses.StartupProfile())
+    player = Interface(4, grid.settings)
+    hints = app_curses.start_hints(grid)
+    assert app_curses.hint_text(None) == app_curses.hint_text(hints) == ""
+    assert app_curses.handle_keys(["h"], grid, player, hints) is None
+    assert hints.shown
+    hints.flush()
+    hint = hints.poll()
+    assert app_curses.hint_text(hints) == (
+        f"Hint: {hint.guess} ({hint.candidates} possible)"
+    )
+    app_curses.handle_keys(["h"], grid, player)  # no hint service
+    app_curses.handle_keys(["h"], grid, player, hints)
+    assert not hints.shown
+    hints.close()
+    grid.events.close()
+    with pytest.raises(ValueError):
+        app_curses.start_hints(grid)  # already started
+
+
+def test_highlight():
+    """Ensure highlight covers the word under the player or a single char."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    player = Interface(4, grid.settings)
+    column, row, start = grid.next_entry(0, 0, 0)
+    while grid._interactive._active_col[column][row].similarity == "s":
+        column, row, start = grid.next_entry(column, row, start)
+    player.move_to(column, row, start + 1)
+    line = grid._interactive._active_col[column][row]
+    screen_start = player.start[1 + column] + line.start
+    assert app_curses.highlight(grid, player) == (
+        player.line,
+        screen_start,
+        player.start[1 + column] + line.end + 1,
+    )
+    player.move_to(column, row, 0 if line.start else line.end + 1)
+    assert app_curses.highlight(grid, player) == (
+        player.line,
+        player.place,
+        player.place + 1,
+    )
+
+
+def test_view_rows():
+    """Ensure marathon grids fit short terminals and others need every row."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    assert app_curses.view_rows(grid, 4, 40) == (16, 21)
+    assert app_curses.view_rows(grid, 4, 21) == (0, 21)
+    grid = Backend(marathon(DEFAULT_EASY, 10), ewlaps, 4, True)
+    assert app_curses.view_rows(grid, 4, 40) == (35, 8)
+    assert app_curses.view_rows(grid, 4, 9) == (4, 8)
+    assert app_curses.view_rows(grid, 4, 8) == (0, 8)
+
+
+def test_fit_view():
+    """Ensure the view fits the terminal or says why it cannot."""
+    grid = Backend(marathon(DEFAULT_EASY, 10), ewlaps, 4, True)
+    player = Interface(app_curses.LINE_START, grid.settings)
+    assert app_curses.fit_view(grid, player, 9, 80) == ""
+    assert player.view_rows == 4
+    assert "short (min 8)" in app_curses.fit_view(grid, player, 8, 80)
+    assert "narrow" in app_curses.fit_view(grid, player, 40, player.width)
+
+
+def test_draw_ansi():
+    """Ensure frames are only rebuilt when the grid or view changed."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    player = Interface(app_curses.LINE_START, grid.settings)
+    out = io.BytesIO()
+    renderer = AnsiRenderer(out)
+    drawn = app_curses.draw_ansi(renderer, grid, player, None, None)
+    assert drawn.lit == app_curses.highlight(grid, player)
+    assert out.getvalue()
+    player.keyboard_input("d")
+    moved = app_curses.draw_ansi(renderer, grid, player, None, drawn)
+    assert moved.view is drawn.view and moved.lit != drawn.lit
+    grid.hover(*player.exact_grid_location())
+    assert (
+        app_curses.draw_ansi(renderer, grid, player, None, moved).view is not drawn.view
+    )
+
+
+def test_read_keys():
+    """Ensure queued input is read at once and end of input is reported."""
+    read_fd, write_fd = os.pipe()
+    try:
+        os.write(write_fd, b"dd\x1b[A")
+        assert app_curses.read_keys(read_fd, False) == ["d", "d", "KEY_UP"]
+        assert app_curses.read_keys(read_fd, True) == []  # hint poll timed out
+        os.close(write_fd)
+        assert app_curses.read_keys(read_fd, False) is None
+    finally:
+        os.close(read_fd)
+
+
+def test_frame_timer():
+    """Ensure the first frame is marked once and key presses are timed."""
+    profile = app_curses.StartupProfile()
+    timer = app_curses.FrameTimer(profile)
+    timer.drawn()
+    timer.drawn()
+    assert [phase for phase, _ in profile.phases] == ["first frame"]
+    disable()
+    recorder = enable()
+    try:
+        timer = app_curses.FrameTimer()
+        timer.pressed(True)
+        timer.drawn()
+        timer.pressed(False)
+        timer.drawn()
+        assert recorder.histograms[FRAME].count == 1
+    finally:
+        disable()
+
+
+def test_help_skips_heavy_imports():
+    """Ensure help exits before the grid and word list are imported."""
+    loaded = run_fresh(
+        "import sys, json, app_curses\n"
+        "try:\n"
+        "    app_curses.arguments(['-h'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(json.dumps([m for m in ('grid', 'english_words') if m in sys.modules]))"
+    )
+    assert loaded == []
+
+
+def startup_report(argv):
+    """
+    Play on a pseudo terminal, quit at once and read the startup profile.
+
+    Returns seconds from spawn until the header of the first frame is read
+    and the startup profile phases.
+    """
+    terminal, game_side = pty.openpty()
+    fcntl.ioctl(game_side, termios.TIOCSWINSZ, struct.pack("HHHH", 40, 120, 0, 0))
+    start = perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "app_curses.py", "--startup-profile"] + argv,
+        cwd=str(ROOT),
+        stdin=game_side,
+        stdout=game_side,
+        stderr=subprocess.PIPE,
+        env=dict(os.environ, TERM="xterm-256color"),
+    ) as game:
+        os.close(game_side)
+        shown = b""
+        elapsed = 0.0
+        try:
+            while b"ROBCO" not in shown and select.select([terminal], [], [], 10)[0]:
+                shown += os.read(terminal, 65536)
+            elapsed = perf_counter() - start
+            os.write(terminal, b"q")
+            while select.select([terminal], [], [], 10)[0] and os.read(terminal, 65536):
+                pass
+        except OSError:  # game closed the terminal
+            pass
+        finally:
+            os.close(terminal)
+        report = game.communicate(timeout=10)[1].decode()
+    assert game.returncode == 0 and b"ROBCO" in shown, report
+    return elapsed, {
+        phase: float(ms) / 1000
+        for phase, ms in re.findall(r"^  (\S.*?) +([\d.]+)$", report, re.MULTILINE)
+    }
+
+
+def interpreter_startup():
+    """Fewest seconds of 3 to spawn and exit a bare interpreter."""
+    times = []
+    for _ in range(3):
+        start = perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+@pytest.fixture(scope="module")
+def bytecode():
+    """Write bytecode of the game first, as an installed game has it."""
+    assert compileall.compile_file(str(ROOT / "app_curses.py"), quiet=1)
+    assert compileall.compile_dir(str(ROOT / "grid"), quiet=1)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [["easy"], ["advanced"], ["expert"], ["master"], ["advanced", "--marathon", "960"]],
+)
+@pytest.mark.usefixtures("bytecode")
+def test_startup_budget(argv):
+    """Ensure the first frame is drawn within startup budget of the spawn."""
+    elapsed, phases = startup_report(argv)
+    assert "first frame" in phases
+    assert phases["total"] == pytest.approx(
+        sum(sec for phase, sec in phases.items() if phase != "total"), abs=1e-4
+    )
+    assert phases["total"] < elapsed
+    if elapsed >= STARTUP_BUDGET:
+        interpreter = interpreter_startup()
+        if elapsed < STARTUP_BUDGET * STARTUP_MARGIN or interpreter > FAST_INTERPRETER:
+            pytest.skip(
+                f"over budget: first frame {elapsed * 1000:.1f} ms after spawn, "
+                f"bare interpreter {interpreter * 1000:.1f} ms"
+            )
+    assert elapsed < STARTUP_BUDGET, phases
@@ -3,8 +3,14 @@ from test.common import LIST_EXAMPLE, LIST_EXAMPLE_EASY
 import pytest  # type: ignore
 from english_words import english_words_lower_alpha_set as ewlaps
 import grid._components as gi_components
+from grid.draws import Draws
+from grid.frequency import Frequencies
+from grid.letter_counts import LetterCounts
+from grid._word_tools import likeness as likeness_function, trim
 from grid.settings import (
     DEFAULT_EASY,
+    DEFAULT_MASTER,
+    likeness,
     SettingGrid,
     easy_pass_pool,
     advanced_pass_pool,
@@ -40,9 +46,9 @@ def test_init():
     assert "a" not in tester._words_trimmed
     assert "Supercalifragilisticexpialidocious" not in tester._words_trimmed
     # Password in own function
-    assert tester._zero_duds == []
-    assert tester._low_similar_duds == []
-    assert tester._high_similar_duds == []
+    assert tester._duds.zero == []
+    assert tester._duds.low == []
+    assert tester._duds.high == []
     assert tester._secrets_list == []
 
 
@@ -63,6 +69,19 @@ def test_password():
     assert tester.password[0] in DEFAULT_EASY.pass_pool
     assert isinstance(tester.password, tuple)
     assert tester.password[1] == "p"
+    password = DEFAULT_EASY.pass_pool[0]
+    tester = gi_components.Components(ewlaps, DEFAULT_EASY, password)
+    assert tester.password == (password, "p")
+
+
+def test_dud_mix():
+    """Test dud_mix."""
+    tester = gi_components.Components(ewlaps, DEFAULT_EASY)
+    duds = tester.dud_mix(7)
+    assert len(duds) == 10  # 3 zero, 3 low and 4 high
+    assert duds[:3] == tester.zero_duds[:3]
+    assert duds[3:6] == tester.low_similar_duds[:3]
+    assert duds[6:] == tester.high_similar_duds[:4]
 
 
 def test_zero_duds():
@@ -99,6 +118,54 @@ def test_similar_duds():
     assert tester.low_similar_duds[6][1] < tester.high_similar_duds[4][1]
 
 
+@pytest.mark.parametrize("mode", ["overlap", "edit"])
+def test_likeness_modes(mode):
+    """Ensure dud similarity is counted in the likeness mode of settings."""
+    tester = gi_components.Components(ewlaps, likeness(DEFAULT_MASTER, mode))
+    likeness_of = likeness_function(tester.password[0], mode)
+    duds = tester.zero_duds + tester.low_similar_duds + tester.high_similar_duds
+    assert len(duds) >= 25
+    for word, similarity in duds:
+        assert similarity == likeness_of(word)
+
+
+def test_frequencies():
+    """Ensure weighted duds keep their similarity and favour common words."""
+    common = sorted(word for word in ewlaps if 3 <= len(word) <= 5)[::7]
+    frequencies = Frequencies({"zzz": 1, **{word: 1e8 for word in common}})
+    tester = gi_components.Components(
+        ewlaps, DEFAULT_EASY, None, Draws(frequencies=frequencies)
+    )
+    assert tester.password[0] in common
+    likeness_of = likeness_function(tester.password[0])
+    duds = tester.zero_duds + tester.low_similar_duds + tester.high_similar_duds
+    assert len(tester.zero_duds) == 25 and len(set(duds)) == len(duds)
+    for word, similarity in duds:
+        assert similarity == likeness_of(word)
+    assert sum(word in common for word, _ in duds) > len(duds) // 2
+
+
+def test_letter_counts(monkeypatch):
+    """Ensure hopeless passwords are rejected, or drawn again, before a scan."""
+    words = trim(3, 5, ewlaps)
+    counts = LetterCounts(["cat", "dog", "horse"])
+    monkeypatch.setattr(gi_components, "similarity_sort", None)  # no scan
+    with pytest.raises(RuntimeError):
+        gi_components.Components(words, DEFAULT_EASY, "stone", Draws(counts=counts))
+    draws = []
+    monkeypatch.setattr(
+        gi_components.Components,
+        "_draw_password",
+        lambda self: draws.append(1) or "stone",
+    )
+    with pytest.raises(RuntimeError):
+        gi_components.Components(words, DEFAULT_EASY, draws=Draws(counts=counts))
+    assert len(draws) == gi_components.PASSWORD_DRAWS + 1
+    full = LetterCounts(words)
+    tester = gi_components.Components(words, DEFAULT_EASY, "stone", Draws(counts=full))
+    assert tester.password == ("stone", "p")
+
+
 def test_secrets_list():
     """Test secrets_list."""
     tester = gi_components.Components(ewlaps, DEFAULT_EASY)
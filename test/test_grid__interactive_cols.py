@@ -1,8 +1,12 @@
 """Interactive grid column testing with pytest."""
+
+import math
+import random
 import pytest  # type: ignore
 from english_words import english_words_lower_alpha_set as ewlaps
 import grid.settings as gi_setting
 from grid._components import Components
+from grid.draws import Draws
 import grid._interactive_cols as gi_ic
 
 # Protected access used to test functions
@@ -50,6 +54,24 @@ def test__init__(comp_easy, comp_advance, comp_expert, comp_master):
         assert not tester._active_col_set
 
 
+def test__init__no_zero_duds():
+    """Ensure low duds stand in when likeness mode leaves no zero duds."""
+    master = gi_setting.likeness(gi_setting.DEFAULT_MASTER, "overlap")
+    components = Components(ewlaps, master)
+    components._words_trimmed.clear()  # duds already set
+    components._duds = components._duds._replace(
+        zero=[],
+        low=[(f"low{index}", 1) for index in range(10)],
+        high=[(f"high{index}", 9) for index in range(10)],
+    )
+    tester = gi_ic.InteractiveCols(components, 4, False)
+    similarities = [similarity for _, similarity in tester._dud_pool]
+    low, high = similarities.count(1), similarities.count(9)
+    dud_range = low // 2 + high
+    assert 5 <= dud_range <= 8
+    assert low == 2 * math.ceil(dud_range / 3)  # zero and low share
+
+
 def test_active_col(comp_easy):
     """Test right/left_active_col."""
     tester = gi_ic.InteractiveCols(comp_easy, 4)
@@ -78,7 +100,10 @@ def test_remove_random_dud(comp_advance):
     left = tester.left_active_col
     right = tester.right_active_col
     assert tester._found_duds != []
+    words = tester.entry_words()
     assert tester.remove_random_dud()  # Action taken
+    assert tester.removed[0] in words
+    assert tester.entry_words() == [word for word in words if word != tester.removed[0]]
     tester._found_duds = []
     assert not tester.remove_random_dud()  # Action not taken
     new_left = tester.left_active_col
@@ -93,6 +118,20 @@ def test_select_exception(comp_expert):
     tester = gi_ic.InteractiveCols(comp_expert, 4)
     with pytest.raises(ValueError):
         tester.select_char("Invalid", 0, 0)
+    for column in (-1, 2, 1.0, None):
+        with pytest.raises(ValueError):
+            tester.select_char(column, 0, 0)
+        with pytest.raises(ValueError):
+            tester.active_line(column, 0)
+
+
+def test_select_bool_column():
+    """Ensure right (T) and left (F) are the outer columns of wide grids."""
+    wide = gi_setting.wide(gi_setting.DEFAULT_EASY, 4)
+    tester = gi_ic.InteractiveCols(Components(ewlaps, wide), 4)
+    for row in range(wide.NUM_OF_ROWS):
+        assert tester.select_char(True, row, 0) == tester.select_char(3, row, 0)
+        assert tester.select_char(False, row, 0) == tester.select_char(0, row, 0)
 
 
 def test_select_error(comp_expert):
@@ -269,8 +308,9 @@ def test_inactivate_secret(comp_expert):
     assert tester._active_col[secret_local[0]][secret_local[1]].similarity == "s"
     old_line = tester._active_col[secret_local[0]][secret_local[1]].line
     # REMOVAL
-    with pytest.raises(ValueError):
-        assert tester.inactivate_secret(secret_local[0], secret_local[1])
+    for column in ("Invalid", -1, 2):
+        with pytest.raises(ValueError):
+            tester.inactivate_secret(column, secret_local[1])
     assert tester.inactivate_secret(bool(secret_local[0]), secret_local[1])
     # Post REMOVAL
     new_line = tester._active_col[secret_local[0]][secret_local[1]].line
@@ -281,6 +321,125 @@ def test_inactivate_secret(comp_expert):
 
 
 # Private Method
+def test_entry_span(comp_easy):
+    """Test entry_span covers words, secret starts and single chars."""
+    tester = gi_ic.InteractiveCols(comp_easy, 4)
+    _ = tester.left_active_col  # initialize
+    line = gi_ic.InteractiveCols.Line
+    tester._active_col[0][0] = line("..word......", "word", 2, 5, 3)
+    tester._active_col[0][1] = line(".(..).......", "(..)", 1, 4, "s")
+    tester._active_col[1][2] = line("............", "", -1, -1, "e")
+    assert [tester.entry_span(0, 0, place) for place in (1, 2, 5, 6)] == [
+        (1, 1),
+        (2, 5),
+        (2, 5),
+        (6, 6),
+    ]
+    assert tester.entry_span(0, 1, 1) == (1, 4)
+    assert tester.entry_span(0, 1, 2) == (2, 2)  # secret only from its start
+    assert tester.entry_span(1, 2, 0) == (0, 0)
+    tester._found_duds = []
+    assert tester.entry_span(0, 1, 1) == (1, 1)  # secrets off without duds
+    with pytest.raises(ValueError):
+        tester.entry_span(2, 0, 0)
+
+
+def test_next_entry(comp_easy):
+    """Test next_entry walks entries in address order and follows removals."""
+    tester = gi_ic.InteractiveCols(comp_easy, 4)
+    _ = tester.left_active_col  # initialize
+    rows = comp_easy.setting.NUM_OF_ROWS
+
+    def board(similarity=None):
+        return [
+            (column, row, line.start)
+            for column, lines in enumerate(tester._active_col)
+            for row, line in enumerate(lines)
+            if line.similarity != "e" and similarity in (None, line.similarity)
+        ]
+
+    entries = board()
+    secrets = board("s")
+    for before, after in zip(entries, entries[1:]):
+        assert tester.next_entry(*before) == after
+        assert tester.next_entry(*after, -1) == before
+    assert tester.next_entry(*entries[0], 2) == entries[2]
+    assert tester.next_entry(*entries[0], 1000) == entries[-1]  # stops on last
+    assert tester.next_entry(*entries[-1]) is None
+    assert tester.next_entry(*entries[0], -1) is None
+    # inside a word previous is the word start
+    inside = entries[0][0], entries[0][1], entries[0][2] + 1
+    assert tester.next_entry(*inside, -1) == entries[0]
+    assert tester.next_entry(1, rows - 1, 11, -1, True) == secrets[-1]
+    # removed entries are skipped
+    column, row, _ = secrets[0]
+    tester.inactivate_secret(column, row)
+    assert tester.next_entry(0, 0, 0, 1, True) == secrets[1]
+    while tester.remove_random_dud():
+        pass
+    remaining = board()
+    assert tester._board.entries == [
+        column * rows + row for column, row, _ in remaining
+    ]
+    assert tester.next_entry(*remaining[0]) == remaining[1]
+    with pytest.raises(ValueError):
+        tester.next_entry(0, 0, 0, 0)
+
+
+def test_bracket_pairs():
+    """Test bracket pairs match the original game rules."""
+    assert list(gi_ic.bracket_pairs("..(..)..<.>.")) == [(2, 5), (8, 10)]
+    assert list(gi_ic.bracket_pairs("((.)")) == [(0, 3), (1, 3)]  # shared close
+    assert list(gi_ic.bracket_pairs("(<[)>]")) == [(0, 3), (1, 4), (2, 5)]
+    assert list(gi_ic.bracket_pairs("(.a.)..[..]")) == [(7, 10)]  # letters split
+    assert not list(gi_ic.bracket_pairs(")..(..{."))
+
+
+def test_filler_secrets():
+    """Test secrets in filler are indexed, selected and used up."""
+    comp = Components(ewlaps, gi_setting.filler_secrets(gi_setting.DEFAULT_EASY))
+    tester = gi_ic.InteractiveCols(comp, 4)
+    _ = tester.left_active_col  # initialize
+    rows = comp.setting.NUM_OF_ROWS
+    scanned = {}
+    for index in range(rows * 2):
+        line = tester._active_col[index // rows][index % rows]
+        assert line.similarity != "s"  # no standalone secrets
+        pairs = dict(gi_ic.bracket_pairs(line.line))
+        if pairs:
+            scanned[index] = pairs
+    assert tester._filler.brackets == scanned
+    assert tester._board.secrets == sorted(scanned)
+
+    # two secrets on a line next to a word
+    line = gi_ic.InteractiveCols.Line("(.)word..[.]", "word", 3, 6, 2)
+    tester._active_col[0][1] = line
+    tester._filler.brackets[1] = {0: 2, 9: 11}
+    tester._reindex(0, 1)
+    assert tester.select_char(0, 1, 0) == ("(.)", "s")
+    assert tester.entry_span(0, 1, 9) == (9, 11)
+    assert tester.next_entry(0, 1, 0) == (0, 1, 3)
+    assert tester.next_entry(0, 1, 0, 2) == (0, 1, 9)
+    assert tester.next_entry(0, 1, 11, -3) == (0, 1, 0)
+    assert tester.next_entry(0, 1, 0, 1, True) == (0, 1, 9)
+    assert tester.inactivate_secret(0, 1, 0)
+    assert not tester.inactivate_secret(0, 1, 0)  # used
+    assert tester.select_char(0, 1, 0) == ("(", "e")
+    assert tester.inactivate_secret(0, 1, 9)
+    assert 1 not in tester._board.secrets
+    assert 1 in tester._board.entries  # word is left
+
+    # removing a dud frees brackets the word split
+    tester._active_col[1][2] = gi_ic.InteractiveCols.Line(
+        "(.word.)....", "word", 2, 5, 1
+    )
+    tester._found_duds = [(1, 2)]
+    assert tester.remove_random_dud()
+    assert tester._filler.brackets[rows + 2] == {0: 7}
+    assert rows + 2 in tester._board.secrets
+    assert tester.select_char(1, 2, 0) == ("(", "e")  # no duds left for secrets
+
+
 def test__populate_active_col(comp_master):
     """Test  _populate_active_col method."""
     tester = gi_ic.InteractiveCols(comp_master, 4, True)
@@ -309,17 +468,89 @@ def test__populate_active_col(comp_master):
     assert not tester._populate_active_col()  # return False, Indicate no work done
 
 
-def test__filler_lines(comp_easy):
-    """Test _filler_lines method."""
+def test__build_line(comp_easy):
+    """Test _build_line method."""
     tester = gi_ic.InteractiveCols(comp_easy, 4, True)
-    fill_lines = tester._filler_lines(5)
-    assert len(fill_lines) == 5
-    for line in fill_lines:
+    tester._populate_active_col()
+    rows = comp_easy.setting.NUM_OF_ROWS
+    filler = [index for index in range(rows * 2) if index not in tester._board.placed]
+    for index in filler[:5]:
+        line = tester._build_line(index)
         assert isinstance(line, tester.Line)
         assert line.similarity == "e"
         assert len(line.line) == comp_easy.setting.ACTIVE_LINE_SIZE
-    with pytest.raises(ValueError):
-        tester._filler_lines(-1)
+        assert line == tester._build_line(index)  # rebuilt the same
+    for index, (word, similarity) in tester._board.placed.items():
+        line = tester._build_line(index)
+        assert line.line[line.start : line.end + 1] == word
+        assert line.similarity == similarity
+        assert line == tester._active_col[index // rows][index % rows]
+
+
+@pytest.mark.parametrize("filler", [False, True])
+def test_marathon_screens(filler):
+    """Test screens are placed when reached, the same in any order."""
+    settings = gi_setting.marathon(gi_setting.DEFAULT_EASY, 20)
+    if filler:
+        settings = gi_setting.filler_secrets(settings)
+    rows = settings.NUM_OF_ROWS
+
+    def board():
+        components = Components(ewlaps, settings, draws=Draws(rng=random.Random(3)))
+        return gi_ic.InteractiveCols(components, 4)
+
+    walked, read = board(), board()
+    assert walked.duds_left
+    assert set(walked._board.waiting) == set(range(1, 20))  # top screen only
+    walk = [(0, 0, 0)]
+    while walk[-1] is not None:
+        walk.append(walked.next_entry(*walk[-1]))
+    lines = [column * rows + row for column, row, _ in walk[1:-1]]
+    assert lines == sorted(lines) and len(set(lines)) > 20 * 5
+    for row in reversed(range(rows)):  # bottom screen first
+        read.active_line(0, row)
+    assert not walked._board.waiting and not read._board.waiting
+    assert walked._board.placed == read._board.placed
+    assert all(word for word, _ in read._board.placed.values())  # secrets made
+    assert walked._board.entries == read._board.entries
+    assert walked._board.secrets == read._board.secrets
+    assert lines[-1] == read._board.entries[-1]
+
+    removing = board()
+    duds = [
+        word for word, similarity in removing._dud_pool if isinstance(similarity, int)
+    ]
+    while removing.remove_random_dud():
+        pass
+    assert sorted(removing.removed) == sorted(duds)
+    assert not removing.duds_left and not removing._board.waiting
+
+
+def test_column_cache():
+    """Test lines are built on first view and only a few are kept."""
+    built = []
+
+    def build(row):
+        built.append(row)
+        return gi_ic.InteractiveCols.Line(str(row), "", -1, -1, "e")
+
+    column = gi_ic._Column(build, 100, 2)
+    assert len(column) == 100
+    assert not built
+    assert column[5].line == "5"
+    assert column[5].line == "5"
+    assert column[-1].line == "99"
+    assert built == [5, 99]
+    assert column[6].line == "6"
+    assert column[5].line == "5"  # dropped and rebuilt
+    assert built == [5, 99, 6, 5]
+    column[7] = column[7]._replace(line="changed")
+    for row in range(8, 20):
+        _ = column[row]
+    assert column[7].line == "changed"  # changed lines are never dropped
+    with pytest.raises(IndexError):
+        _ = column[100]
+    assert len(list(column)) == 100
 
 
 def test_line_named_tuple():
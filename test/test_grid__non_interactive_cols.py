@@ -1,6 +1,7 @@
 """Non-interactive grid column testing with pytest."""
+
 import pytest  # type: ignore
-from grid.settings import DEFAULT_EASY
+from grid.settings import DEFAULT_EASY, marathon, wide
 import grid._non_interactive_cols as gi_nic
 
 # Protected access used to test functions
@@ -47,6 +48,27 @@ def test_right_hex():
         assert int(tester.right_hex[index], base=16) % 2 == 0  # is even
 
 
+def test_hex_line():
+    """Test hex lines match hex columns and fit a marathon grid."""
+    tester = gi_nic.NonInteractiveCols(DEFAULT_EASY)
+    for row in range(DEFAULT_EASY.NUM_OF_ROWS):
+        assert tester.hex_line(0, row) == tester.left_hex[row]
+        assert tester.hex_line(1, row) == tester.right_hex[row]
+    tester = gi_nic.NonInteractiveCols(wide(DEFAULT_EASY, 3))
+    addresses = [
+        int(tester.hex_line(column, row), 16)
+        for column in range(3)
+        for row in range(DEFAULT_EASY.NUM_OF_ROWS)
+    ]
+    assert addresses == list(range(addresses[0], addresses[-1] + 1, 2))
+    assert tester.right_hex[0] == tester.hex_line(2, 0)
+    tester = gi_nic.NonInteractiveCols(marathon(DEFAULT_EASY, 900))
+    assert len(tester.feedback_col) == DEFAULT_EASY.NUM_OF_ROWS
+    last = tester.hex_line(0, 900 * DEFAULT_EASY.NUM_OF_ROWS - 1)
+    assert len(last) == DEFAULT_EASY.HEX_LINE_SIZE
+    assert tester._left_hex == ("Pre", "Fill")  # columns not built
+
+
 def test_add_feedback_and_feedback_col_exception():
     """Test add_feeback raises exception when expected."""
     tester = gi_nic.NonInteractiveCols(DEFAULT_EASY)
@@ -82,3 +104,15 @@ def test_add_feedback_and_feedback_col_hover():
     assert tester.feedback_col[-1] == ">             "
     assert tester.feedback_col[-2] == ">Regular      "
     assert ">HoverFeedback" not in tester.feedback_col
+
+
+def test_revision():
+    """Ensure revision counts feedback changes only."""
+    tester = gi_nic.NonInteractiveCols(DEFAULT_EASY)
+    assert tester.revision == 0 and tester.settings is DEFAULT_EASY
+    tester.add_feedback("HoverFeedback", True)
+    tester.add_feedback("Regular", False)
+    assert tester.revision == 2
+    with pytest.raises(ValueError):
+        tester.add_feedback("I AM WAYYYYYYYYYY TO LONG", False)
+    assert tester.revision == 2
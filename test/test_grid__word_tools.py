@@ -27,6 +27,15 @@ def test_set_passwords():
     assert results[1]  # good similarity
 
 
+def test_set_passwords_counts():
+    """Check passwords settled by letter counts alone are viable."""
+    words = [f"c{letter}t" for letter in "abcdefghijklmnopqrstuvwxyz"] + ["dog"]
+    password = gi_wst.set_passwords(words, 20)
+    assert "dog" not in password
+    for word in password:
+        assert gi_wst.similarity_sort(words, word)[1]
+
+
 # Static Methods
 def test_trim_words():
     """Test if _trim() produces correct list."""
@@ -51,3 +60,67 @@ def test_similarity_separate(comp_str_thres):  # ( word, threshold, word_list)
         count += len(duds[key])
     assert count == len(reduced_list)  # No words lost
     assert threshold == comp_str_thres[1]
+
+
+@pytest.mark.parametrize(
+    "word, other, expected",
+    [
+        ("tones", "stone", (0, 5, 3)),
+        ("skill", "kills", (1, 5, 3)),
+        ("apple", "paper", (1, 4, 1)),  # repeated letters count once per match
+        ("fun", "function", (3, 3, 3)),
+        ("cat", "dog", (0, 0, 0)),
+    ],
+)
+def test_likeness(word, other, expected):
+    """Ensure each likeness mode counts as documented."""
+    for mode, likeness in zip(("positional", "overlap", "edit"), expected):
+        assert gi_wst.likeness(word, mode)(other) == likeness
+        assert gi_wst.likeness(other, mode)(word) == likeness
+    with pytest.raises(ValueError):
+        gi_wst.likeness(word, "unknown")
+
+
+def test_letter_mask():
+    """Ensure letter masks layer repeated letters and skip other chars."""
+    assert gi_wst.letter_mask("") == 0
+    assert gi_wst.letter_mask("ab") == 0b11
+    assert gi_wst.letter_mask("aa") == 1 | 1 << 26
+    assert gi_wst.letter_mask("a-a'") == gi_wst.letter_mask("aa")
+
+
+def test_edit_distance():
+    """Ensure bit-parallel edit distance matches the distance table."""
+
+    def table(first, second):
+        row = list(range(len(second) + 1))
+        for index, char in enumerate(first, 1):
+            previous, row[0] = row[:], index
+            for place, other in enumerate(second, 1):
+                row[place] = min(
+                    previous[place] + 1,
+                    row[place - 1] + 1,
+                    previous[place - 1] + (char != other),
+                )
+        return row[-1]
+
+    words = ["", "a", "kitten", "sitting", "flaw", "lawn", "abcabcabc", "cba"]
+    for word in words:
+        distance = gi_wst.edit_distance(word)
+        for other in words:
+            assert distance(other) == table(word, other)
+    assert gi_wst.edit_distance("x" * 100)("y" * 100) == 100  # past 64 bits
+
+
+@pytest.mark.parametrize("mode", ["overlap", "edit"])
+def test_similarity_sort_modes(mode):
+    """Ensure other modes never count lower than positional likeness."""
+    reduced_list = gi_wst.trim(3, 5, ewlaps)
+    positional, _ = gi_wst.similarity_sort(reduced_list, "fun")
+    duds, threshold = gi_wst.similarity_sort(reduced_list, "fun", mode)
+    assert threshold
+    lowest = {word: sim for sim, words in positional.items() for word in words}
+    for sim, words in duds.items():
+        for word in words:
+            assert sim >= lowest[word]
+    assert len(gi_wst.set_passwords(list(reduced_list), 2, mode)) == 2
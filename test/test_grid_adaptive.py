@@ -0,0 +1,97 @@
+"""Tests grid adaptive using pytest."""
+import random
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.adaptive as gi_adaptive
+from grid.backend import Backend
+from grid.draws import Draws
+from grid.settings import DEFAULT_EASY, DEFAULT_MASTER, target_guesses
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+
+def test_board_score():
+    """Ensure expected guesses follow the minimax solver."""
+    assert gi_adaptive.BoardScore(["cat"]).score == 1
+    assert gi_adaptive.BoardScore(["cat", "dog"]).score == 1.5
+    # cat answers 0, 1 and 2 for dog, cot and car: each found by the second guess
+    tester = gi_adaptive.BoardScore(["cat", "dog", "cot", "car"])
+    assert tester.score == (1 + 2 + 2 + 2) / 4
+    # nothing tells the rest apart, one more guess per word
+    assert gi_adaptive.BoardScore(["aaa", "bbb", "ccc"]).score == 2
+    with pytest.raises(ValueError):
+        gi_adaptive.BoardScore([])
+
+
+def test_board_score_swap():
+    """Ensure swaps rescore like a new board and undo restores the table."""
+    tester = gi_adaptive.BoardScore(["cat", "dog", "cot", "car"])
+    rows = [list(row) for row in tester._rows]
+    assert tester.swap(1, "bbb") == gi_adaptive.BoardScore(tester.words).score
+    assert tester._rows == gi_adaptive.BoardScore(tester.words)._rows
+    tester.undo()
+    assert tester.words == ("cat", "dog", "cot", "car")
+    assert tester._rows == rows
+    assert tester.score == 1.75
+    tester.undo()  # nothing to undo
+    assert tester.swap(1, "fog") == 1.75  # answers like dog, not solved again
+
+
+@pytest.mark.parametrize("target", [2.0, 2.5, 3.0])
+def test_pick_board(target):
+    """Ensure board is picked within budget and scored honestly."""
+    settings = target_guesses(DEFAULT_MASTER, target)
+    components, duds, score = gi_adaptive.pick_board(
+        ewlaps, settings, 4, draws=Draws(rng=random.Random(target))
+    )
+    words = [components.password[0]] + [word for word, _ in duds]
+    assert len(set(words)) == len(words)
+    assert 7 <= len(duds) <= 11
+    assert score == gi_adaptive.BoardScore(words, settings.LIKENESS).score
+    assert abs(score - target) < 1
+    for word, similarity in duds:
+        assert similarity == sum(map(str.__eq__, word, components.password[0]))
+
+
+def test_pick_board_closest():
+    """Ensure search gets closer than a random board."""
+    settings = target_guesses(DEFAULT_EASY, 3.0)
+    results = [
+        abs(
+            gi_adaptive.pick_board(
+                ewlaps, settings, 4, budget=0.2, draws=Draws(rng=random.Random(seed))
+            )[2]
+            - 3
+        )
+        for seed in range(3)
+    ]
+    assert min(results) <= gi_adaptive.TOLERANCE
+
+
+def test_pick_board_budget(monkeypatch):
+    """Ensure the budget starts on entry, a spent one still scores one board."""
+    built, original = [], gi_adaptive.Components
+
+    def components(*args):
+        built.append(args[2])
+        return original(*args)
+
+    monkeypatch.setattr(gi_adaptive, "Components", components)
+    settings = target_guesses(DEFAULT_EASY, 3.0)
+    assert gi_adaptive.pick_board(ewlaps, settings, 4, budget=0.0)[0].password
+    assert len(built) == 1
+
+
+def test_pick_board_exception():
+    """Ensure a word list without duds for any password raises."""
+    with pytest.raises(RuntimeError):
+        gi_adaptive.pick_board(["cat", "dog"], target_guesses(DEFAULT_EASY, 2), 4)
+
+
+def test_backend_adaptive():
+    """Ensure backend places the adaptive board."""
+    tester = Backend(target_guesses(DEFAULT_EASY, 2.5), ewlaps, 4, True)
+    words = tester.entry_words()
+    assert 8 <= len(words) <= 12
+    assert tester._interactive._settings.TARGET_GUESSES == 2.5
@@ -0,0 +1,138 @@
+"""Tests grid ansi using pytest."""
+import io
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.ansi as gi_ansi
+from grid.ansi import AnsiRenderer, ScreenLine
+from grid.backend import Backend
+from grid.interface import Mouse
+from grid.settings import DEFAULT_EASY, marathon
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+GREEN_LINE = ScreenLine("0xf964 ..abc..", gi_ansi.GREEN)
+
+
+def test_first_frame():
+    """Ensure first frame clears screen and draws every line."""
+    out = io.BytesIO()
+    tester = AnsiRenderer(out)
+    written = tester.render([GREEN_LINE, GREEN_LINE], (0, 0))
+    assert out.getvalue() == (
+        b"\x1b[0m\x1b[2J\x1b[1;1H\x1b[32m0xf964 ..abc.."
+        + b"\x1b[2;1H0xf964 ..abc..\x1b[1;1H"
+    )
+    assert written == len(out.getvalue()) == tester.bytes_written
+
+
+def test_single_change():
+    """Ensure only the changed character and a short move are written."""
+    tester = AnsiRenderer(io.BytesIO())
+    tester.render([GREEN_LINE, GREEN_LINE], (1, 9))
+    changed = ScreenLine("0xf964 ..aXc..", gi_ansi.GREEN)
+    assert tester.diff([GREEN_LINE, changed], (1, 9)) == "\x1b[1CX\x1b[2D"
+    assert tester.diff([GREEN_LINE, changed], (1, 9)) == ""  # no change
+
+
+def test_shorter_and_removed_lines():
+    """Ensure left over text is erased."""
+    tester = AnsiRenderer(io.BytesIO())
+    tester.render([GREEN_LINE, GREEN_LINE], (0, 0))
+    shorter = ScreenLine("0xf964", gi_ansi.GREEN)
+    assert tester.diff([shorter], (0, 0)) == "\x1b[6C\x1b[K\x1b[2;1H\x1b[K\x1b[1;1H"
+
+
+def test_style_change():
+    """Ensure a style change rewrites the line in the new style."""
+    tester = AnsiRenderer(io.BytesIO())
+    tester.render([GREEN_LINE], (0, 0))
+    red = ScreenLine(GREEN_LINE.text, gi_ansi.RED)
+    assert tester.diff([red], (0, 0)) == "\x1b[31m0xf964 ..abc..\x1b[14D"
+    assert tester.diff([red, red], (0, 0)) == "\x1b[2;1H0xf964 ..abc..\x1b[1;1H"
+
+
+def test_highlight():
+    """Ensure only the old and new highlight spans are written."""
+    tester = AnsiRenderer(io.BytesIO())
+    tester.render([GREEN_LINE, GREEN_LINE], (0, 0))
+    lit = GREEN_LINE._replace(highlight=(9, 12))
+    assert tester.diff([lit, GREEN_LINE], (0, 9)) == ("\x1b[9C\x1b[32;7mabc\x1b[3D")
+    moved = GREEN_LINE._replace(highlight=(7, 8))
+    assert tester.diff([GREEN_LINE, moved], (1, 7)) == (
+        "\x1b[27;32mabc\x1b[2;8H\x1b[32;7m.\x1b[1D"
+    )
+    assert tester.diff([GREEN_LINE, moved], (1, 7)) == ""
+    # text and highlight change together
+    changed = ScreenLine("0xf964 ..aXc..", gi_ansi.GREEN, (7, 8))
+    assert tester.diff([GREEN_LINE, changed], (1, 7)) == "\x1b[3C\x1b[27;32mX\x1b[4D"
+
+
+def test_cursor_only():
+    """Ensure moving the cursor without changes writes only the move."""
+    tester = AnsiRenderer(io.BytesIO())
+    tester.render([GREEN_LINE], (0, 0))
+    assert tester.diff([GREEN_LINE], (0, 5)) == "\x1b[5C"
+    assert tester.diff([GREEN_LINE], (0, 4)) == "\x1b[1D"
+    assert tester.diff([GREEN_LINE], (3, 4)) == "\x1b[4;5H"
+
+
+def test_reset():
+    """Ensure reset redraws the full screen."""
+    tester = AnsiRenderer(io.BytesIO())
+    tester.render([GREEN_LINE], (0, 0))
+    tester.reset()
+    assert tester.diff([GREEN_LINE], (0, 0)).startswith("\x1b[0m\x1b[2J")
+
+
+def test_decode_keys():
+    """Ensure escape sequences are decoded to key names."""
+    assert gi_ansi.decode_keys(b"w\x1b[A\x1bOD\rq") == [
+        "w",
+        "KEY_UP",
+        "KEY_LEFT",
+        "\n",
+        "q",
+    ]
+    assert gi_ansi.decode_keys(b"\x1b[5~\x1b[6~") == ["KEY_PPAGE", "KEY_NPAGE"]
+    assert gi_ansi.decode_keys(b"\t\x1b[Z\x1b[1~\x1b[H") == [
+        "\t",
+        "KEY_BTAB",
+        "KEY_HOME",
+        "KEY_HOME",
+    ]
+    assert not gi_ansi.decode_keys(b"")
+
+
+def test_decode_keys_mouse():
+    """Ensure SGR mouse reports are decoded and wheel events dropped."""
+    assert gi_ansi.decode_keys(
+        b"\x1b[<0;10;5Mw\x1b[<35;11;6M\x1b[<0;10;5m\x1b[<64;1;1M\x1b[<0;x;1Mq"
+    ) == [
+        Mouse(4, 9, True),
+        "w",
+        Mouse(5, 10, False),  # motion
+        Mouse(4, 9, False),  # release
+        "q",
+    ]
+
+
+def test_screen_lines():
+    """Ensure screen lines match grid rows below the header."""
+    grid = Backend(DEFAULT_EASY, ewlaps, 3, True)
+    assert gi_ansi.screen_lines(grid, 5)[2].style == gi_ansi.GREEN
+    grid._tries = 1
+    lines = gi_ansi.screen_lines(grid, 5)
+    assert len(lines) == 5 + grid.settings.NUM_OF_ROWS
+    assert lines[2].style == gi_ansi.RED  # last try
+    assert lines[5].text == grid.full_row_str(0)
+    assert lines[-1].text == grid.full_row_str(grid.settings.NUM_OF_ROWS - 1)
+
+
+def test_screen_lines_view():
+    """Ensure only rows in view are drawn with feedback at the bottom."""
+    grid = Backend(marathon(DEFAULT_EASY, 10), ewlaps, 3, True)
+    lines = gi_ansi.screen_lines(grid, 4, 100, 6)
+    assert len(lines) == 4 + 6
+    assert lines[4].text == grid.full_row_str(100, -6)
+    assert lines[-1].text == grid.full_row_str(105, -1)
+    assert lines[-1].text.endswith(grid._non_interactive.feedback_col[-1])
@@ -1,10 +1,11 @@
 """Tests word_mastermind/backend.py using pytest."""
+
 import pytest
 from english_words import english_words_lower_alpha_set as ewlaps
 from grid.settings import DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_EXPERT, DEFAULT_MASTER
+from grid.settings import filler_secrets, marathon, wide
 from grid.backend import Backend
 
-
 # Protected access used to test functions
 # Used by fixtures functions
 # pylint: disable=W0212, W0621, R0801
@@ -16,7 +17,7 @@ def test__init__():
         tester = Backend(setting, ewlaps, 4, True)
         assert tester.tries == tester._tries
         assert tester.tries == 4
-        assert tester._tries_original == 4
+        assert tester._started == (4, True)
         assert tester.game_state == 0
         assert tester.settings == setting
 
@@ -35,12 +36,44 @@ def test_full_row_str():
     assert len(tester.full_row_str(15)) == line_length
     assert tester.full_row_str(0)[:6] == tester._non_interactive.left_hex[0]
     assert tester.full_row_str(5)[-14:] == tester._non_interactive.feedback_col[5]
+    assert tester.full_row_str(5, -1)[-14:] == tester._non_interactive.feedback_col[-1]
+    assert tester.full_row_str(5, -20)[-14:] == " " * 14  # above feedback column
     with pytest.raises(IndexError):
         tester.full_row_str(99)
     with pytest.raises(IndexError):
         tester.full_row_str(-1)
 
 
+def test_full_row_str_wide():
+    """Ensure every column pair is printed in order."""
+    settings = wide(DEFAULT_EASY, 3)
+    tester = Backend(settings, ewlaps, 4, False)
+    row = tester.full_row_str(2)
+    parts = row.split(" ", 6)  # feedback may hold spaces
+    for column in range(3):
+        assert parts[column * 2] == tester._non_interactive.hex_line(column, 2)
+        assert parts[column * 2 + 1] == tester._interactive.active_col(column)[2]
+    assert parts[-1] == tester._non_interactive.feedback_col[2]
+    assert len(row) == 3 * (6 + 12) + 14 + 6
+    tester = Backend(wide(DEFAULT_EASY, 1), ewlaps, 4, False)
+    assert len(tester.full_row_str(0)) == 6 + 12 + 14 + 2
+
+
+def test_marathon():
+    """Ensure marathon grids scale duds and place and build rows on first view."""
+    settings = marathon(DEFAULT_EASY, 200)
+    tester = Backend(settings, ewlaps, 4, True)
+    assert len(tester._non_interactive.feedback_col) == DEFAULT_EASY.NUM_OF_ROWS
+    row = tester.full_row_str(settings.NUM_OF_ROWS - 1, -1)
+    assert row[:6] == tester._non_interactive.left_hex[-1]
+    interactive = tester._interactive
+    assert len(interactive._dud_pool) > 500  # one screen has at most 8
+    assert len(interactive._board.waiting) == 198  # only top and bottom placed
+    columns = interactive._active_col
+    assert len(columns[0]._cache) == len(columns[1]._cache) == 1
+    assert len(tester.entry_words()) > 500
+
+
 def test_hover():
     """Ensure hover is working only printing to feedback, hover line."""
     tester = Backend(DEFAULT_ADVANCED, ewlaps, 4, True)
@@ -48,7 +81,7 @@ def test_hover():
     # password
     location = find_entry("p", tester)
     line = tester._interactive._active_col[location[0]][location[1]]
-    tester.hover(bool(location[0]), location[1], line.start)
+    tester.hover(location[0], location[1], line.start)
     assert tester._non_interactive.feedback_col[-1].strip() == ">" + line.word
     assert tester.game_state == 0
 
@@ -56,15 +89,30 @@ def test_hover():
     location = find_entry("s", tester)
     line = tester._interactive._active_col[location[0]][location[1]]
     if line.start == 0:
-        tester.hover(bool(location[0]), location[1], line.end + 1)
+        tester.hover(location[0], location[1], line.end + 1)
         char = line.line[line.end + 1]
     else:
-        tester.hover(bool(location[0]), location[1], line.start - 1)
+        tester.hover(location[0], location[1], line.start - 1)
         char = line.line[line.start - 1]
     assert tester._non_interactive.feedback_col[-1] == ">" + char + "            "
     assert tester.game_state == 0
 
 
+def test_hover_same_entry():
+    """Ensure hovering the same entry again changes nothing."""
+    tester = Backend(DEFAULT_ADVANCED, ewlaps, 4, True)
+    location = find_entry("p", tester)
+    line = tester._interactive._active_col[location[0]][location[1]]
+    revision = tester.revision
+    assert tester.hover(location[0], location[1], line.start)
+    assert tester.revision == revision + 1
+    assert tester.span(location[0], location[1], line.end) == (line.start, line.end)
+    assert not tester.hover(location[0], location[1], line.end)
+    assert tester.revision == revision + 1
+    tester.select(location[0], location[1], line.start)
+    assert tester.revision > revision + 1
+
+
 def test_select_exception():
     """Ensure select throws exception when intended."""
     tester = Backend(DEFAULT_EXPERT, ewlaps, 4, True)
@@ -84,7 +132,7 @@ def test_select_error_entry():
     post_select_grid = []
     for index in range(DEFAULT_ADVANCED.NUM_OF_ROWS):
         pre_select_grid.append(tester.full_row_str(index)[:40])
-    action = tester.select(bool(location[0]), location[1], 0)
+    action = tester.select(location[0], location[1], 0)
     assert action == "e"
 
     # Assert feedback
@@ -108,7 +156,7 @@ def test_select_password_entry():
     post_select_grid = []
     for index in range(DEFAULT_ADVANCED.NUM_OF_ROWS):
         pre_select_grid.append(tester.full_row_str(index)[:40])
-    action = tester.select(bool(location[0]), location[1], line.start)
+    action = tester.select(location[0], location[1], line.start)
     assert action == "p"
 
     # Assert feedback
@@ -132,7 +180,7 @@ def test_select_dud_entry_not_lost():
     post_select_grid = []
     for index in range(DEFAULT_ADVANCED.NUM_OF_ROWS):
         pre_select_grid.append(tester.full_row_str(index)[:40])
-    action = tester.select(bool(location[0]), location[1], line.start)
+    action = tester.select(location[0], location[1], line.start)
     assert action == "d"
 
     # Assert feedback
@@ -157,10 +205,10 @@ def test_select_dud_entry_game_over():
     location = find_entry(0, tester)
     for count in range(1, 5):
         if count != 4:
-            assert tester.select(bool(location[0]), location[1], line.start) == "d"
+            assert tester.select(location[0], location[1], line.start) == "d"
             assert tester.game_state == 0
         else:
-            assert tester.select(bool(location[0]), location[1], line.end) == "l"
+            assert tester.select(location[0], location[1], line.end) == "l"
             assert tester.game_state == -1
         assert tester.tries == 4 - count
 
@@ -176,7 +224,7 @@ def test_select_secret_entry_secret(_):
     post_select_grid = []
     for index in range(DEFAULT_ADVANCED.NUM_OF_ROWS):
         pre_select_grid.append(tester.full_row_str(index)[:40])
-    action = tester.select(bool(location[0]), location[1], line.start)
+    action = tester.select(location[0], location[1], line.start)
     assert action == "s"
     assert tester._interactive._active_col[location[0]][location[1]].similarity == "e"
 
@@ -201,6 +249,24 @@ def test_select_secret_entry_secret(_):
     assert tester.tries == 4  # Tries does not change on error.
 
 
+def test_select_filler_secret():
+    """Ensure bracket pair secret in filler is used once."""
+    tester = Backend(filler_secrets(DEFAULT_ADVANCED), ewlaps, 4, True)
+    tester.full_row_str(0)
+    while not tester._interactive._filler.brackets:  # rare board without pairs
+        tester = Backend(filler_secrets(DEFAULT_ADVANCED), ewlaps, 4, True)
+        tester.full_row_str(0)
+    index, pairs = next(iter(tester._interactive._filler.brackets.items()))
+    column, row = divmod(index, DEFAULT_ADVANCED.NUM_OF_ROWS)
+    opening, closing = next(iter(pairs.items()))
+    assert tester.hover(column, row, opening)
+    assert tester.span(column, row, opening) == (opening, closing)
+    assert tester.select(column, row, opening) == "s"
+    assert tester.tries == 4
+    assert opening not in tester._interactive._filler.brackets.get(index, {})
+    assert tester.select(column, row, opening) == "e"  # used
+
+
 # Support
 def find_entry(similarity, backend):
     """Find similarity in backend and return location."""
@@ -0,0 +1,88 @@
+"""Tests grid board_stream using pytest."""
+import random
+import threading
+from itertools import islice
+from test.common import LIST_EXAMPLE
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid
+from grid.backend import Backend
+from grid.board_stream import boards, prefetch
+from grid.dictionary import Dictionary
+from grid.draws import Draws
+from grid.settings import DEFAULT_EASY
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+
+def workers():
+    """Board workers still running."""
+    return [thread for thread in threading.enumerate() if thread.name == "grid-boards"]
+
+
+def test_boards():
+    """Ensure new ready boards share one word list and cache."""
+    stream = boards(DEFAULT_EASY, ewlaps, 4, True)
+    first, second = next(stream), next(stream)
+    assert isinstance(first, Backend) and first is not second
+    assert first.cache is second.cache
+    assert first._interactive._active_col_set  # entries already placed
+    assert first.tries == 4 and first.game_state == 0 and first.events is None
+    assert isinstance(next(grid.boards(DEFAULT_EASY, ewlaps, 4, True)), Backend)
+
+
+def seen(board):
+    """Words and first row (addresses too) of a board."""
+    return board.entry_words(), board.full_row_str(0)
+
+
+def test_seed():
+    """Ensure a seed repeats boards and leaves the random module alone."""
+    state = random.getstate()
+    stream = boards(DEFAULT_EASY, ewlaps, 4, False, Draws(rng=random.Random(7)))
+    shown = [seen(board) for board in islice(stream, 5)]
+    assert random.getstate() == state
+    again = prefetch(
+        boards(DEFAULT_EASY, Dictionary(ewlaps), 4, False, Draws(random.Random(7))), 2
+    )
+    assert [seen(board) for board in islice(again, 5)] == shown
+    again.close()
+    other = boards(DEFAULT_EASY, ewlaps, 4, False, Draws(rng=random.Random(8)))
+    assert seen(next(other)) != shown[0]
+
+
+def test_prefetch():
+    """Ensure boards are built ahead and the worker stops with the stream."""
+    stream = prefetch(boards(DEFAULT_EASY, ewlaps, 4, True), 3)
+    assert all(isinstance(next(stream), Backend) for _ in range(5))
+    stream.close()
+    for worker in workers():
+        worker.join(1)
+    assert not workers()
+    prefetch(boards(DEFAULT_EASY, ewlaps, 4, True), 1)  # dropped unused
+    for worker in workers():
+        worker.join(1)
+    assert not workers()
+    unbuilt = boards(DEFAULT_EASY, ewlaps, 4, True)
+    assert prefetch(unbuilt, 0) is unbuilt
+    with pytest.raises(ValueError):
+        prefetch(unbuilt, -1)
+    assert not list(prefetch(iter([]), 1))  # stream ran out
+
+
+def test_word_file(tmp_path):
+    """Ensure word list files are loaded once."""
+    path = tmp_path / "words"
+    path.write_text("\n".join(sorted(ewlaps)))
+    board = next(boards(DEFAULT_EASY, str(path), 4, True))
+    assert set(board.entry_words()) <= ewlaps
+
+
+def test_failed_boards():
+    """Ensure a word list without boards raises, prefetched or not."""
+    with pytest.raises(RuntimeError):
+        next(boards(DEFAULT_EASY, LIST_EXAMPLE, 4, True))
+    stream = prefetch(boards(DEFAULT_EASY, LIST_EXAMPLE, 4, True), 2)
+    with pytest.raises(RuntimeError):
+        next(stream)
@@ -0,0 +1,125 @@
+"""Tests grid bucket_cache using pytest."""
+import os
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.bucket_cache as gi_cache
+from grid._components import Components
+from grid.draws import Draws
+from grid._word_tools import similarity_sort, trim
+from grid.settings import DEFAULT_EASY, likeness
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+WORDS = sorted(trim(DEFAULT_EASY.MIN, DEFAULT_EASY.MAX, ewlaps))
+PASSWORD = DEFAULT_EASY.pass_pool[0]
+
+
+def files(directory):
+    """Bucket files in directory."""
+    return sorted(name for name in os.listdir(directory) if name.endswith(".buckets"))
+
+
+def test_cache_dir(monkeypatch, tmp_path):
+    """Ensure cache directory follows environment."""
+    monkeypatch.setenv(gi_cache.CACHE_DIR_ENV, str(tmp_path))
+    assert gi_cache.cache_dir() == str(tmp_path)
+    monkeypatch.delenv(gi_cache.CACHE_DIR_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert gi_cache.cache_dir() == str(tmp_path / "prewar_login_game")
+
+
+def test_fingerprint():
+    """Ensure fingerprint ignores order and sees every word."""
+    assert gi_cache.fingerprint(WORDS) == gi_cache.fingerprint(WORDS[::-1])
+    assert gi_cache.fingerprint(WORDS) == gi_cache.fingerprint(set(WORDS))
+    assert gi_cache.fingerprint(WORDS) != gi_cache.fingerprint(WORDS[1:])
+    assert gi_cache.fingerprint(["ab", "cd"]) != gi_cache.fingerprint(["ad", "cb"])
+    key = gi_cache.BucketCache.key(gi_cache.fingerprint(WORDS), PASSWORD, "edit")
+    assert key != gi_cache.BucketCache.key(gi_cache.fingerprint(WORDS), PASSWORD, "")
+
+
+@pytest.mark.parametrize("mode", ["positional", "edit"])
+def test_buckets(tmp_path, mode):
+    """Ensure cached buckets match sorting, from memory and from disk."""
+    expected, threshold = similarity_sort(WORDS, PASSWORD, mode)
+    expected = {sim: sorted(words) for sim, words in expected.items()}
+    tester = gi_cache.BucketCache(str(tmp_path))
+    for found in (
+        tester.buckets(WORDS, PASSWORD, mode),  # sorted
+        tester.buckets(WORDS[::-1], PASSWORD, mode),  # memory
+        gi_cache.BucketCache(str(tmp_path)).buckets(WORDS, PASSWORD, mode),  # disk
+    ):
+        assert {sim: sorted(words) for sim, words in found[0].items()} == expected
+        assert found[1] == threshold
+    assert (tester.hits, tester.misses) == (1, 1)
+    assert len(files(tmp_path)) == 1
+    tester.clear()
+    assert not files(tmp_path) and not tester._recent
+
+
+def test_buckets_not_shared(tmp_path):
+    """Ensure popping a bucket leaves the cached buckets alone."""
+    tester = gi_cache.BucketCache(str(tmp_path))
+    tester.buckets(WORDS, PASSWORD, "positional")[0].pop(0)
+    assert 0 in tester.buckets(WORDS, PASSWORD, "positional")[0]
+
+
+def test_memory_only(tmp_path):
+    """Ensure empty directory keeps buckets in memory only, least recent out."""
+    tester = gi_cache.BucketCache("", memory=2)
+    for password in DEFAULT_EASY.pass_pool[:3]:
+        tester.buckets(WORDS, password, "positional")
+    assert len(tester._recent) == 2
+    tester.buckets(WORDS, DEFAULT_EASY.pass_pool[0], "positional")
+    assert tester.misses == 4
+    with pytest.raises(ValueError):
+        gi_cache.BucketCache(str(tmp_path), max_bytes=-1)
+
+
+def test_evict(tmp_path):
+    """Ensure least recently used files are removed past max_bytes."""
+    tester = gi_cache.BucketCache(str(tmp_path), memory=0)
+    passwords = DEFAULT_EASY.pass_pool[:3]
+    keys = []
+    for when, password in enumerate(passwords):
+        tester.buckets(WORDS, password, "positional")
+        keys.append(tester.key(gi_cache.fingerprint(WORDS), password, "positional"))
+        os.utime(tester._path(keys[-1]), (when, when))
+    assert tester.get(keys[0]) is not None  # now most recently used
+    size = max(os.path.getsize(tester._path(key)) for key in keys)
+    tester._max_bytes = 2 * size
+    tester._evict()
+    assert files(tmp_path) == sorted(f"{key}.buckets" for key in (keys[0], keys[2]))
+
+
+def test_corrupt_file(tmp_path):
+    """Ensure unreadable files are a miss and removed."""
+    tester = gi_cache.BucketCache(str(tmp_path), memory=0)
+    key = tester.key(gi_cache.fingerprint(WORDS), PASSWORD, "positional")
+    with open(tester._path(key), "wb") as corrupt:
+        corrupt.write(b"not zlib")
+    assert tester.get(key) is None
+    assert not files(tmp_path)
+
+
+def test_unwritable_directory(tmp_path):
+    """Ensure disk errors only lose the disk tier."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    tester = gi_cache.BucketCache(str(blocker / "cache"))
+    assert tester.buckets(WORDS, PASSWORD, "positional")[1]
+    tester.buckets(WORDS, PASSWORD, "positional")
+    assert tester.hits == 1
+
+
+def test_components_cache(tmp_path):
+    """Ensure components use cached buckets."""
+    cache = gi_cache.BucketCache(str(tmp_path))
+    settings = likeness(DEFAULT_EASY, "overlap")
+    for _ in range(2):
+        tester = Components(ewlaps, settings, PASSWORD, Draws(cache=cache))
+        assert len(tester.high_similar_duds) >= 15
+    assert (cache.hits, cache.misses) == (1, 1)
+    uncached = Components(ewlaps, settings, PASSWORD)
+    assert sorted(tester.high_similar_duds) == sorted(uncached.high_similar_duds)
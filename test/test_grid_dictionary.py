@@ -0,0 +1,106 @@
+"""Tests grid dictionary using pytest."""
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.dictionary as gi_dictionary
+from grid._components import Components
+from grid._word_tools import trim
+from grid.adaptive import pick_board
+from grid.bucket_cache import fingerprint
+from grid.settings import (
+    DEFAULT_EASY,
+    DEFAULT_ADVANCED,
+    DEFAULT_EXPERT,
+    DEFAULT_MASTER,
+    target_guesses,
+)
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+WORDS = ["Cat", "cat", "dog", "", "Horse", "bird", "mouse", "ox", "DOG"]
+
+
+def test_dictionary():
+    """Ensure words are lowercased, deduplicated and bucketed by length."""
+    tester = gi_dictionary.Dictionary(WORDS)
+    assert tester.lengths == (2, 3, 4, 5)
+    assert tester.bucket(3) == {"cat", "dog"}
+    assert tester.bucket(5) == {"horse", "mouse"}
+    assert tester.bucket(9) == frozenset()
+    assert len(tester) == 6
+    assert sorted(tester) == ["bird", "cat", "dog", "horse", "mouse", "ox"]
+    assert "cat" in tester and "Cat" not in tester and 3 not in tester
+
+
+def test_dictionary_letters():
+    """Ensure only words of letters a to z are kept."""
+    tester = gi_dictionary.Dictionary(["(x)", "d3f", "c-a-t", "Café", "<>", "", "Ox"])
+    assert list(tester) == ["ox"]
+
+
+def test_dictionary_lengths():
+    """Ensure only lengths between minimum and maximum are kept."""
+    tester = gi_dictionary.Dictionary(iter(WORDS), 3, 4)
+    assert tester.lengths == (3, 4)
+    assert sorted(tester) == ["bird", "cat", "dog"]
+    tester = gi_dictionary.Dictionary.from_buckets({3: {"cat"}, 4: set()})
+    assert tester.lengths == (3,)
+    assert "cat" in tester
+
+
+def test_range():
+    """Ensure ranges are cached views of the length buckets."""
+    tester = gi_dictionary.Dictionary(WORDS)
+    view = tester.range(3, 4)
+    assert view is tester.range(3, 4)
+    assert sorted(view) == ["bird", "cat", "dog"]
+    assert len(view) == 3
+    assert "bird" in view and "ox" not in view and "horse" not in view
+    assert not tester.range(6, 9)
+    assert gi_dictionary.trimmed(3, 4, tester) is view
+    assert gi_dictionary.trimmed(3, 4, WORDS) == {"bird", "cat", "dog"}
+
+
+def test_range_matches_trim():
+    """Ensure every difficulty range holds the same words as trim."""
+    tester = gi_dictionary.Dictionary(ewlaps)
+    for setting in (DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_EXPERT, DEFAULT_MASTER):
+        view = tester.range(setting.MIN, setting.MAX)
+        assert set(view) == trim(setting.MIN, setting.MAX, ewlaps)
+        assert len(view) == len(set(view))
+
+
+def test_digest():
+    """Ensure range digest combines bucket digests like a full scan."""
+    tester = gi_dictionary.Dictionary(ewlaps)
+    view = tester.range(DEFAULT_EASY.MIN, DEFAULT_EASY.MAX)
+    assert view.digest() == gi_dictionary.digest(list(view)[::-1])
+    assert fingerprint(view) == fingerprint(set(view))
+    assert tester.range(1, 0).digest() == gi_dictionary.digest([])
+    assert tester.digest(3) == gi_dictionary.bucket_digest(sorted(tester.bucket(3)))
+
+
+def test_letter_counts():
+    """Ensure letter counts are built once per range."""
+    tester = gi_dictionary.Dictionary(WORDS)
+    counts = tester.letter_counts(3, 4)
+    assert counts is tester.letter_counts(3, 4)
+    assert counts.lengths == (3, 4) and counts.count(3, 0, "c") == 1
+
+
+def test_components_dictionary():
+    """Ensure components build every difficulty from one dictionary."""
+    tester = gi_dictionary.Dictionary(ewlaps)
+    for setting in (DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_EXPERT, DEFAULT_MASTER):
+        components = Components(tester, setting)
+        assert components._words_trimmed is tester.range(setting.MIN, setting.MAX)
+        for word, _ in components.high_similar_duds + components.zero_duds:
+            assert setting.MIN <= len(word) <= setting.MAX
+        assert components._words_trimmed == ()
+
+
+def test_pick_board_dictionary():
+    """Ensure adaptive boards can be picked from a dictionary."""
+    tester = gi_dictionary.Dictionary(ewlaps)
+    components, duds, _ = pick_board(tester, target_guesses(DEFAULT_MASTER, 2.5), 4)
+    assert components.password[0] in DEFAULT_MASTER.pass_pool
+    assert all(word in tester for word, _ in duds)
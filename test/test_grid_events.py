@@ -0,0 +1,117 @@
+"""Tests grid events using pytest."""
+import threading
+from test.test_grid_backend import find_entry
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.events as gi_events
+from grid.backend import Backend
+from grid.settings import DEFAULT_ADVANCED
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+
+def test_event_bus_dispatch():
+    """Ensure events reach every subscriber in order off the caller thread."""
+    bus = gi_events.EventBus()
+    first, second, threads = [], [], set()
+    assert not bus.publish(gi_events.TriesReset(4))  # no subscribers
+    bus.subscribe(first.append)
+    bus.subscribe(second.append)
+    bus.subscribe(lambda _: threads.add(threading.get_ident()))
+    events = [gi_events.TriesReset(count) for count in range(10)]
+    for event in events:
+        assert bus.publish(event)
+    bus.close()
+    assert first == events
+    assert second == events
+    assert threading.get_ident() not in threads
+
+
+def test_event_bus_full():
+    """Ensure publish drops events instead of blocking when queue is full."""
+    bus = gi_events.EventBus(maxsize=2)
+    release = threading.Event()
+    bus.subscribe(lambda _: release.wait())
+    results = [bus.publish(gi_events.TriesReset(count)) for count in range(6)]
+    assert not all(results)
+    assert bus.dropped == results.count(False)
+    release.set()
+    bus.flush()
+    bus.close()
+
+
+def test_event_bus_subscriber_error():
+    """Ensure a failing subscriber does not stop dispatch."""
+    bus = gi_events.EventBus()
+    received = []
+
+    def broken(_):
+        raise KeyError("broken")
+
+    bus.subscribe(broken)
+    bus.subscribe(received.append)
+    bus.publish(gi_events.TriesReset(1))
+    bus.publish(gi_events.TriesReset(2))
+    bus.flush()
+    assert len(received) == 2
+    assert bus.errors == 2
+    assert isinstance(bus.last_error, KeyError)
+    bus.close()
+    bus.close()  # already closed
+
+
+def test_event_bus_exception():
+    """Ensure maxsize is validated."""
+    with pytest.raises(ValueError):
+        gi_events.EventBus(0)
+
+
+def test_backend_events():
+    """Ensure backend publishes game events."""
+    bus = gi_events.EventBus()
+    received = []
+    tester = Backend(DEFAULT_ADVANCED, ewlaps, 4, True)
+    assert tester.events is None
+    bus.subscribe(received.append)
+    tester.start(bus)  # subscribers attached after the board is built
+    assert tester.events is bus
+
+    location = find_entry("e", tester)
+    tester.hover(location[0], location[1], 0)
+    tester.select(location[0], location[1], 0)
+    location = find_entry("s", tester)
+    line = tester._interactive._active_col[location[0]][location[1]]
+    tester.select(location[0], location[1], line.start)
+    location = find_entry("p", tester)
+    line = tester._interactive._active_col[location[0]][location[1]]
+    tester.select(location[0], location[1], line.start)
+    bus.close()
+
+    assert received[0] == gi_events.GameStarted(4, True)
+    assert isinstance(received[1], gi_events.Hovered)
+    assert isinstance(received[2], gi_events.Selected)
+    assert received[2].result == "e"
+    assert received[3].result == "s"
+    assert isinstance(received[4], gi_events.SecretUsed)
+    assert isinstance(received[5], (gi_events.DudRemoved, gi_events.TriesReset))
+    if isinstance(received[5], gi_events.DudRemoved):
+        assert received[5].word == tester._interactive.removed[-1]
+    assert received[6].result == "p"
+    assert received[7] == gi_events.GameWon(line.word, 4)
+
+
+def test_backend_events_lost():
+    """Ensure backend publishes game lost."""
+    bus = gi_events.EventBus()
+    received = []
+    bus.subscribe(received.append)
+    tester = Backend(DEFAULT_ADVANCED, ewlaps, 3, False)
+    tester.start(bus)
+    location = find_entry(0, tester)
+    line = tester._interactive._active_col[location[0]][location[1]]
+    for _ in range(3):
+        tester.select(location[0], location[1], line.start)
+    bus.close()
+    assert [event.result for event in received[1:-1]] == ["d", "d", "l"]
+    assert received[-1] == gi_events.GameLost(line.word)
@@ -0,0 +1,58 @@
+"""Tests grid frequency using pytest."""
+import random
+from collections import Counter
+import pytest  # type: ignore
+import grid.frequency as gi_frequency
+
+COUNTS = {"cat": 900, "dog": 100, "ox": 0, "Bird": 400}
+
+
+def test_alias_table():
+    """Ensure draws follow the weights."""
+    weights = [5.0, 1.0, 0.0, 2.0, 2.0]
+    tester = gi_frequency.AliasTable(weights)
+    assert len(tester) == 5 and tester.total == 10
+    rng = random.Random(1)
+    drawn = Counter(tester.sample(rng) for _ in range(20000))
+    assert drawn[2] == 0
+    for index, weight in enumerate(weights):
+        assert abs(drawn[index] / 20000 - weight / 10) < 0.02
+    assert gi_frequency.AliasTable([3.0]).sample() == 0
+    for bad in ([], [0.0, 0.0], [1.0, -1.0]):
+        with pytest.raises(ValueError):
+            gi_frequency.AliasTable(bad)
+
+
+def test_frequencies():
+    """Ensure weights, missing words and cached tables."""
+    tester = gi_frequency.Frequencies(COUNTS)
+    assert tester.weight("cat") == 30 and tester.weight("bird") == 20
+    assert tester.weight("ox") == tester.weight("zebra") == tester.missing == 10
+    assert gi_frequency.Frequencies({}).missing == 1
+    words = ["cat", "dog", "zebra"]
+    assert tester.table(words) is tester.table(words)
+    assert tester.table(words) is not tester.table(list(words))
+    rng = random.Random(2)
+    drawn = Counter(tester.choice(words, rng) for _ in range(5000))
+    assert drawn["cat"] > drawn["dog"] > 0 and drawn["zebra"] > 0
+
+
+@pytest.mark.parametrize("count", [1, 3, 6, 9])
+def test_sample(count):
+    """Ensure different words, with their bucket, few or most wanted."""
+    tester = gi_frequency.Frequencies(COUNTS)
+    buckets = {0: ["cat", "dog", "ox"], 1: ["bird", "emu"], 2: [], 3: ["eel"]}
+    drawn = tester.sample(buckets, count, random.Random(count))
+    assert len(drawn) == min(count, 6)
+    assert len({word for word, _ in drawn}) == len(drawn)
+    for word, similarity in drawn:
+        assert word in buckets[similarity]
+    assert not tester.sample({}, 3)
+
+
+def test_sample_heavy():
+    """Ensure draws stop repeating a heavy word and fall back to sorting."""
+    tester = gi_frequency.Frequencies({"a": 1e12, "w0": 1})
+    buckets = {0: ["a"] + [f"w{index}" for index in range(20)]}
+    drawn = tester.sample(buckets, 5, random.Random(3))
+    assert drawn[0] == ("a", 0) and len({word for word, _ in drawn}) == 5
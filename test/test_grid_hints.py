@@ -0,0 +1,151 @@
+"""Tests grid hints using pytest."""
+import threading
+from test.test_grid_backend import find_entry
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.events as gi_events
+import grid.hints as gi_hints
+from grid._word_tools import likeness
+from grid.backend import Backend
+from grid.neighbours import NeighbourIndex, write_neighbours
+from grid.settings import DEFAULT_ADVANCED
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+WORDS = ["cat", "car", "bat", "cot", "dog", "cog"]
+
+
+def answer(word, password, mode="positional"):
+    """Selected event of a dud guess."""
+    similarity = likeness(password, mode)(word)
+    return gi_events.Selected(0, 0, 0, word, "d", similarity)
+
+
+def test_first_hint():
+    """Ensure first hint is worked out on the worker."""
+    tester = gi_hints.HintService(WORDS)
+    tester.flush()
+    assert not tester.busy
+    hint = tester.poll()
+    assert hint.candidates == len(WORDS)
+    assert hint.guess in WORDS
+    tester.close()
+    tester.close()  # already closed
+
+
+def test_answers_narrow_candidates():
+    """Ensure dud answers and removed duds narrow candidates."""
+    tester = gi_hints.HintService(WORDS)
+    tester.update(answer("cog", "cat"))  # likeness 1
+    tester.update(gi_events.DudRemoved(True, "bat"))
+    tester.update(gi_events.DudRemoved(False))  # no word, ignored
+    tester.update(gi_events.Hovered(0, 0, 0, "dog"))  # ignored
+    tester.flush()
+    assert tester._candidates == ["cat", "car"]
+    assert "cog" not in tester._words and "bat" not in tester._words
+    assert tester.poll() == gi_hints.Hint("cat", 2)
+    tester.update(answer("cat", "car"))
+    tester.flush()
+    assert tester.poll() == gi_hints.Hint("car", 1)
+    tester.close()
+    tester.update(answer("car", "cot"))  # closed, ignored
+    assert not tester.busy
+
+
+def test_busy(monkeypatch):
+    """Ensure busy counts answers until their hint is worked out."""
+    tester = gi_hints.HintService(WORDS)
+    tester.flush()
+    release = threading.Event()
+    monkeypatch.setattr(tester, "_apply", lambda _: release.wait())
+    tester.update(answer("cog", "cat"))
+    assert tester.busy
+    release.set()
+    tester.flush()
+    assert not tester.busy
+    tester.close()
+
+
+def test_errors(monkeypatch):
+    """Ensure an answer that raises is reported and the worker keeps going."""
+    tester = gi_hints.HintService(WORDS)
+    apply = tester._apply
+
+    def broken(event):
+        if isinstance(event, gi_events.DudRemoved):
+            raise KeyError("broken")
+        apply(event)
+
+    monkeypatch.setattr(tester, "_apply", broken)
+    tester.update(gi_events.DudRemoved(True, "bat"))
+    tester.flush()
+    tester.update(answer("cog", "cat"))
+    tester.flush()
+    assert tester.errors == 1
+    assert isinstance(tester.last_error, KeyError)
+    assert tester.poll() == gi_hints.Hint("cat", 2)
+    assert not tester.busy
+    tester.close()
+
+
+def test_neighbours(tmp_path):
+    """Ensure stored rows narrow candidates like working out likeness."""
+    path = tmp_path / "words.neighbours"
+    write_neighbours(WORDS + ["cab"], str(path), ["cog"])
+    neighbours = NeighbourIndex(str(path), "")
+    tester = gi_hints.HintService(WORDS, neighbours=neighbours)
+    tester.update(answer("cog", "cat"))  # from the row
+    tester.update(answer("dog", "cat"))  # no row, worked out
+    tester.flush()
+    assert tester._candidates == ["cat", "car"]
+    tester.close()
+    neighbours.close()
+
+
+def test_minimax():
+    """Ensure guess leaving the fewest candidates in the worst case is picked."""
+    tester = gi_hints.HintService(["aaa", "aab", "aba", "baa", "bbb"])
+    tester.update(gi_events.DudRemoved(True, "bbb"))
+    tester.flush()
+    # aaa leaves 3 on likeness 2, the others at most 2
+    assert tester.poll() == gi_hints.Hint("aab", 4)
+    tester.close()
+
+
+def test_hint_modes():
+    """Ensure candidates are narrowed with the likeness mode of the board."""
+    tester = gi_hints.HintService(["stone", "tones", "notes", "plumb"], "overlap")
+    tester.update(answer("plumb", "stone", "overlap"))
+    tester.flush()
+    assert tester.poll().candidates == 3
+    tester.close()
+    with pytest.raises(ValueError):
+        gi_hints.HintService(WORDS, "unknown")
+
+
+def test_backend_hints():
+    """Ensure hints follow backend events and always keep the password."""
+    bus = gi_events.EventBus()
+    tester = Backend(DEFAULT_ADVANCED, ewlaps, 4, True)
+    words = tester.entry_words()
+    hints = gi_hints.HintService(words, tester.settings.LIKENESS)
+    bus.subscribe(hints.update)
+    tester.start(bus)
+    column, row = find_entry("p", tester)
+    password = tester._interactive._active_col[column][row].word
+    assert password in words
+    for similarity in range(len(password)):
+        try:
+            column, row = find_entry(similarity, tester)
+        except RuntimeError:
+            continue
+        line = tester._interactive._active_col[column][row]
+        tester.select(column, row, line.start)
+        break
+    bus.flush()
+    hints.flush()
+    assert password in hints._candidates
+    assert hints.poll().candidates < len(words)
+    hints.close()
+    bus.close()
@@ -1,7 +1,8 @@
 """Interface Test with Pytest."""
+
 import pytest  # type: ignore
-from grid.interface import Interface
-from grid.settings import DEFAULT_EASY
+from grid.interface import Interface, Mouse
+from grid.settings import DEFAULT_EASY, marathon, wide
 
 # Protected access used to test functions
 # Used by fixtures functions
@@ -50,6 +51,7 @@ def test_keyboard_input_non_movement(easy_interface):
     assert tester.keyboard_input("q") == "Q"
     assert tester.keyboard_input("\x1b") == "Q"
     assert tester.keyboard_input("\n") == "S"
+    assert tester.keyboard_input("h") == "H"
     assert tester.keyboard_input("i") == "N"
 
 
@@ -58,11 +60,11 @@ def test_exact_grid_location(easy_interface):
     tester = easy_interface
     assert tester.line == 4
     assert tester.place == 7
-    assert tester.exact_grid_location() == (True, 0, 0)
+    assert tester.exact_grid_location() == (0, 0, 0)
     # Middle Right position
     tester._line = 12
     tester._place = 28
-    assert tester.exact_grid_location() == (False, 8, 1)
+    assert tester.exact_grid_location() == (1, 8, 1)
 
 
 def test_movement_boundaries(easy_interface):
@@ -87,3 +89,155 @@ def test_movement_horizontal_jump(easy_interface):
     # Left Jump
     assert tester._move_left()
     assert tester.place == 18
+
+
+def test_view_scroll():
+    """Test view scrolls when grid is taller than view."""
+    tester = Interface(4, marathon(DEFAULT_EASY, 3), 5)
+    assert tester.view_rows == 5
+    assert tester.end[0] == 8
+    for _ in range(4):
+        tester.keyboard_input("s")
+    assert (tester.line, tester.top) == (8, 0)
+    assert tester.keyboard_input("s") == "M"
+    assert (tester.line, tester.top) == (8, 1)
+    assert tester.exact_grid_location() == (0, 5, 0)
+    for _ in range(5):
+        tester.keyboard_input("w")
+    assert (tester.line, tester.top) == (4, 0)
+    assert tester.keyboard_input("w") == "N"
+
+
+def test_view_page():
+    """Test page keys scroll a full view."""
+    tester = Interface(4, marathon(DEFAULT_EASY, 3), 10)
+    assert tester.keyboard_input("KEY_NPAGE") == "M"
+    assert tester.top == 10
+    for _ in range(4):
+        tester.keyboard_input("KEY_NPAGE")
+    assert tester.top == 48 - 10
+    assert tester.line == tester.end[0]  # moved to last line
+    assert tester.keyboard_input("KEY_NPAGE") == "N"
+    assert tester.exact_grid_location()[1] == 47
+    tester.keyboard_input("KEY_PPAGE")
+    assert tester.top == 28
+
+
+def test_view_page_no_scroll(easy_interface):
+    """Test page keys move to first or last line when grid fits view."""
+    tester = easy_interface
+    assert tester.keyboard_input("KEY_NPAGE") == "M"
+    assert (tester.line, tester.top) == (tester.end[0], 0)
+    assert tester.keyboard_input("KEY_NPAGE") == "N"
+    assert tester.keyboard_input("KEY_PPAGE") == "M"
+    assert tester.line == tester.start[0]
+
+
+def test_view_resize():
+    """Test resize keeps player on the same grid row."""
+    tester = Interface(4, marathon(DEFAULT_EASY, 3), 10)
+    for _ in range(9):
+        tester.keyboard_input("s")
+    tester.resize(4)
+    assert tester.exact_grid_location()[1] == 9
+    assert tester.line == tester.end[0] == 7
+    tester.resize(48)
+    assert (tester.top, tester.line) == (0, 13)
+    for rows in (0, 49):
+        with pytest.raises(ValueError):
+            tester.resize(rows)
+    with pytest.raises(ValueError):
+        Interface(4, DEFAULT_EASY, 17)
+
+
+def test_wide_layout():
+    """Test layout of any number of column pairs."""
+    tester = Interface(4, wide(DEFAULT_EASY, 3))
+    assert tester.start == (4, 7, 27, 47)
+    assert tester.end == (19, 18, 38, 58)
+    assert tester.width == 60 + DEFAULT_EASY.FEEDBACK_LINE_SIZE
+    tester._place = 38
+    assert tester.keyboard_input("d") == "M"
+    assert tester.place == 47  # jumped to third column
+    assert tester.exact_grid_location() == (2, 0, 0)
+    assert tester.keyboard_input("a") == "M"
+    assert tester.exact_grid_location() == (1, 0, 11)
+    tester._place = 58
+    assert tester.keyboard_input("d") == "N"
+    single = Interface(4, wide(DEFAULT_EASY, 1))
+    assert single.start == (4, 7)
+    single._place = 18
+    assert single.keyboard_input("d") == "N"
+
+
+def test_mouse_input(easy_interface):
+    """Test mouse moves player inside active columns only."""
+    tester = easy_interface
+    assert tester.mouse_input(Mouse(6, 30, False)) == "M"
+    assert (tester.line, tester.place) == (6, 30)
+    assert tester.exact_grid_location() == (1, 2, 3)
+    assert tester.mouse_input(Mouse(6, 30, False)) == "N"  # already there
+    assert tester.mouse_input(Mouse(5, 8, True)) == "S"
+    assert (tester.line, tester.place) == (5, 8)
+    for outside in (Mouse(3, 8, True), Mouse(20, 8, True), Mouse(5, 19, False)):
+        assert tester.mouse_input(outside) == "N"
+        assert (tester.line, tester.place) == (5, 8)
+    assert tester.mouse_input(Mouse(5, 500, False)) == "N"
+
+
+def test_keyboard_input_count(easy_interface):
+    """Test count prefix repeats moves and stops at the edge."""
+    tester = easy_interface
+    assert tester.keyboard_input("1") == "N"
+    assert tester.keyboard_input("0") == "N"
+    assert tester.keyboard_input("d") == "M"
+    assert tester.place == 17
+    assert tester.keyboard_input("d") == "M"  # count is used up
+    assert tester.place == 18
+    tester.keyboard_input("9")
+    tester.keyboard_input("9")
+    assert tester.keyboard_input("s") == "M"
+    assert tester.line == 19  # stopped at last row
+    for key in "99999":
+        tester.keyboard_input(key)
+    assert tester._keys.prefix == 9999
+    tester.keyboard_input("q")
+    assert tester._keys.prefix == 0
+
+
+def test_keyboard_input_jump_and_row_start(easy_interface):
+    """Test jump keys record the jump and row start keys move."""
+    tester = easy_interface
+    assert tester.keyboard_input("\t") == "J"
+    assert tester.jump == (1, False)
+    tester.keyboard_input("3")
+    assert tester.keyboard_input("[") == "J"
+    assert tester.jump == (-3, True)
+    assert tester.keyboard_input("KEY_BTAB") == "J"
+    assert tester.jump == (-1, False)
+    tester.move_to(1, 5, 4)
+    assert tester.keyboard_input("KEY_HOME") == "M"
+    assert tester.exact_grid_location() == (1, 5, 0)
+    assert tester.keyboard_input("0") == "N"  # already at row start
+    tester.keyboard_input("2")
+    assert tester.keyboard_input("+") == "M"
+    assert tester.exact_grid_location() == (1, 7, 0)
+    tester.keyboard_input("9")
+    assert tester.keyboard_input("-") == "M"
+    assert tester.exact_grid_location() == (1, 0, 0)
+
+
+def test_move_to():
+    """Test move_to scrolls view just enough."""
+    tester = Interface(4, marathon(DEFAULT_EASY, 10), 5)
+    assert tester.move_to(1, 3, 2)
+    assert (tester.top, tester.line, tester.place) == (0, 7, 29)
+    assert not tester.move_to(1, 3, 2)
+    assert tester.move_to(0, 100, 0)
+    assert (tester.top, tester.line) == (96, 8)
+    assert tester.move_to(0, 90, 0)
+    assert (tester.top, tester.line) == (90, 4)
+    assert tester.exact_grid_location() == (0, 90, 0)
+    for location in ((2, 0, 0), (-1, 0, 0), (0, 160, 0), (0, 0, 12)):
+        with pytest.raises(ValueError):
+            tester.move_to(*location)
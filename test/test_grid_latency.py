@@ -0,0 +1,87 @@
+"""Tests grid latency histograms using pytest."""
+import json
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.latency as gi_latency
+from grid.backend import Backend
+from grid.settings import DEFAULT_EASY
+
+# Used by fixtures functions
+# pylint: disable=W0621
+
+
+@pytest.fixture()
+def recorder():
+    """Enable latency recording for test."""
+    yield gi_latency.enable()
+    gi_latency.disable()
+
+
+def test_buckets_contiguous():
+    """Ensure every value falls in exactly one bucket in order."""
+    previous = 0
+    for value in range(1, 70000):
+        index = gi_latency.bucket_index(value)
+        assert index - previous in (0, 1)
+        assert value < gi_latency.bucket_upper(index)
+        assert value >= gi_latency.bucket_upper(index - 1)
+        previous = index
+    assert gi_latency.bucket_index(-5) == 0
+    assert gi_latency.bucket_index(1 << 60) == gi_latency.BUCKETS - 1
+
+
+@pytest.mark.parametrize("value", [7, 1000, 123456, 98765432])
+def test_bucket_error(value):
+    """Ensure bucket bound is within 12.5% of the value."""
+    upper = gi_latency.bucket_upper(gi_latency.bucket_index(value))
+    assert value < upper <= value * 1.125 + 1
+
+
+def test_percentile():
+    """Ensure percentiles come from the right bucket."""
+    histogram = gi_latency.Histogram()
+    assert histogram.percentile(99) == 0
+    for value in range(1, 101):
+        histogram.record(value * 1000)
+    assert histogram.count == 100
+    assert histogram.total == sum(range(1, 101)) * 1000
+    assert 50000 <= histogram.percentile(50) <= 50000 * 1.125
+    assert 99000 <= histogram.percentile(99) <= 99000 * 1.125
+    assert histogram.percentile(100) >= 100000
+    with pytest.raises(ValueError):
+        histogram.percentile(101)
+
+
+def test_export(tmp_path):
+    """Ensure JSON and Prometheus exports."""
+    latency = gi_latency.Latency()
+    latency.record("op", 1000)
+    latency.record("op", 3000)
+    with latency.timer("block"):
+        pass
+    export = json.loads(latency.to_json())
+    assert export["op"]["count"] == 2
+    assert export["op"]["sum"] == pytest.approx(4e-6)
+    assert export["block"]["count"] == 1
+    prom = latency.to_prometheus()
+    assert "# TYPE prewar_latency_seconds histogram" in prom
+    assert 'prewar_latency_seconds_bucket{op="op",le="+Inf"} 2' in prom
+    assert 'prewar_latency_seconds_count{op="op"} 2' in prom
+    latency.dump(str(tmp_path / "out.prom"))
+    latency.dump(str(tmp_path / "out.json"))
+    assert (tmp_path / "out.prom").read_text() == prom
+    assert json.loads((tmp_path / "out.json").read_text()) == export
+
+
+def test_timed(recorder):
+    """Ensure backend operations are timed when enabled."""
+    tester = Backend(DEFAULT_EASY, ewlaps, 4, True)
+    tester.full_row_str(0)
+    tester.hover(False, 0, 0)
+    tester.select(False, 0, 0)
+    for name in (gi_latency.FULL_ROW_STR, gi_latency.HOVER, gi_latency.SELECT):
+        assert recorder.histograms[name].count == 1
+    assert gi_latency.active() is recorder
+    gi_latency.disable()
+    tester.full_row_str(0)
+    assert recorder.histograms[gi_latency.FULL_ROW_STR].count == 1
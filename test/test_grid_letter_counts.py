@@ -0,0 +1,50 @@
+"""Tests grid letter_counts using pytest."""
+import random
+from string import ascii_lowercase
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.letter_counts as gi_counts
+from grid._word_tools import likeness, trim
+from grid.settings import DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_MASTER
+
+WORDS = ["cat", "car", "bat", "cart", "care", "dog", "cat"]
+# cat, cbt ... czt: 25 words two letters in place with any c?t or ca? word
+CT = [f"c{letter}t" for letter in ascii_lowercase]
+
+
+def test_count():
+    """Ensure letters and pairs are counted by length and place."""
+    tester = gi_counts.LetterCounts(WORDS)
+    assert tester.lengths == (3, 4)
+    assert tester.count(3, 0, "c") == 2 and tester.count(3, 2, "t") == 2
+    assert tester.count(4, 2, "re") == 1 and tester.count(4, 0, "ca") == 2
+    assert tester.count(5, 0, "c") == tester.count(3, 3, "c") == 0
+    with pytest.raises(ValueError):
+        tester.count(4, 1, "ar")
+
+
+@pytest.mark.parametrize("setting", [DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_MASTER])
+@pytest.mark.parametrize("size", [300, 3000])
+def test_bounds(setting, size):
+    """Ensure high similarity words of a scan are within the bounds."""
+    words = sorted(trim(setting.MIN, setting.MAX, ewlaps))
+    words = random.Random(size).sample(words, min(size, len(words)))
+    tester = gi_counts.LetterCounts(words)
+    for password in setting.pass_pool[:40]:
+        likeness_of = likeness(password)
+        high = sum(
+            word != password and likeness_of(word) > len(password) // 2
+            for word in words
+        )
+        lower, upper = tester.bounds(password)
+        assert lower <= high <= upper
+
+
+def test_viable():
+    """Ensure bounds settle some passwords and leave the rest to a scan."""
+    assert gi_counts.LetterCounts(WORDS).viable("cat") is False
+    tester = gi_counts.LetterCounts(CT)
+    assert tester.viable("cot") is True
+    assert tester.viable("cot", wanted=30) is False
+    english = gi_counts.LetterCounts(trim(3, 5, ewlaps))
+    assert english.viable("stone") is None
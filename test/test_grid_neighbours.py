@@ -0,0 +1,92 @@
+"""Tests grid neighbours using pytest."""
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.neighbours as gi_neighbours
+from grid._components import Components
+from grid.draws import Draws
+from grid._word_tools import likeness, similarity_sort, trim
+from grid.settings import DEFAULT_EASY
+
+# Using fixtures
+# pylint: disable=W0621
+
+WORDS = ["cat", "car", "bat", "cot", "dog", "cog"]
+
+
+@pytest.fixture(scope="module")
+def easy():
+    """Easy words and a neighbour file of the first pass_pool rows."""
+    return trim(DEFAULT_EASY.MIN, DEFAULT_EASY.MAX, ewlaps)
+
+
+@pytest.fixture()
+def index(easy, tmp_path):
+    """Neighbour index of easy words, memory only fallback."""
+    path = tmp_path / "easy.neighbours"
+    gi_neighbours.write_neighbours(easy, str(path), DEFAULT_EASY.pass_pool[:5])
+    tester = gi_neighbours.NeighbourIndex(str(path), "")
+    yield tester
+    tester.close()
+
+
+def test_buckets(easy, index):
+    """Ensure rows give the buckets of a scan, without one."""
+    assert index.rows == tuple(DEFAULT_EASY.pass_pool[:5])
+    for password in index.rows:
+        found, threshold = index.buckets(easy, password, "positional")
+        expected = similarity_sort(easy, password)
+        assert threshold == expected[1]
+        assert {sim: sorted(words) for sim, words in found.items()} == {
+            sim: sorted(words) for sim, words in expected[0].items()
+        }
+    assert (index.hits, index.misses) == (5, 0)
+
+
+def test_fallback(easy, index):
+    """Ensure other passwords, word lists and modes are sorted and cached."""
+    index.buckets(easy, DEFAULT_EASY.pass_pool[9], "positional")
+    index.buckets(set(list(easy)[:500]), index.rows[0], "positional")
+    index.buckets(easy, index.rows[0], "overlap")
+    assert (index.hits, index.misses) == (0, 3)
+    index.buckets(easy, index.rows[0], "overlap")
+    assert index.hits == 1
+
+
+def test_components(easy, index):
+    """Ensure components fill duds from a row."""
+    tester = Components(easy, DEFAULT_EASY, index.rows[1], Draws(cache=index))
+    likeness_of = likeness(index.rows[1])
+    for word, similarity in tester.zero_duds + tester.high_similar_duds:
+        assert likeness_of(word) == similarity
+    assert index.hits == 1
+
+
+def test_every_row(tmp_path):
+    """Ensure small lists keep a row per word and answer consistency."""
+    path = tmp_path / "words.neighbours"
+    gi_neighbours.write_neighbours(WORDS, str(path))
+    tester = gi_neighbours.NeighbourIndex(str(path), "")
+    assert set(tester.rows) == set(tester.words) == set(WORDS)
+    assert tester.row("cat")[2].tolist() == [0, 1, 4]  # bat car cot
+    assert tester.matching("cat", 0) == ["dog"]
+    assert tester.row("emu") is None and tester.matching("emu", 1) is None
+    assert tester.consistent("cog", 1, ["cat", "car", "cot", "cog"]) == ["cat", "car"]
+    assert tester.consistent("cog", 1, ["cat", "emu"]) is None
+    assert tester.consistent("emu", 1, ["cat"]) is None
+    tester.close()
+
+
+def test_errors(tmp_path):
+    """Ensure broken files raise."""
+    path = tmp_path / "words.neighbours"
+    gi_neighbours.write_neighbours(WORDS, str(path))
+    data = path.read_bytes()
+    path.write_bytes(data[:-2])
+    with pytest.raises(ValueError):
+        gi_neighbours.NeighbourIndex(str(path), "")
+    path.write_bytes(data[: len(gi_neighbours.HEADER) + 60])
+    with pytest.raises(ValueError):
+        gi_neighbours.NeighbourIndex(str(path), "")
+    path.write_bytes(b"cat\n")
+    with pytest.raises(ValueError):
+        gi_neighbours.NeighbourIndex(str(path), "")
@@ -0,0 +1,132 @@
+"""Tests grid packed using pytest."""
+from time import perf_counter
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.packed as gi_packed
+import grid._word_tools as gi_wst
+from grid.dictionary import Dictionary
+from grid.settings import DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_MASTER
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+WORDS = ["cat", "car", "at&t", "Cat", "supercalifragilistic", "cart", "cat"]
+
+
+def enumerate_sort(word_list, compare_string):
+    """Similarity buckets counted letter by letter (the first version)."""
+    similarity_store = {}
+    for word in frozenset(word_list):
+        if word == compare_string:
+            continue
+        similarity = 0
+        lj_word = word.ljust(len(compare_string))
+        for index, char in enumerate(compare_string):
+            if lj_word[index] == char:
+                similarity += 1
+        similarity_store.setdefault(similarity, []).append(word)
+    return similarity_store
+
+
+def sorted_buckets(buckets):
+    """Buckets with their words sorted."""
+    return {sim: sorted(words) for sim, words in buckets.items()}
+
+
+def test_pack():
+    """Ensure letters take 5 bits each and odd words do not pack."""
+    assert gi_packed.pack("ab") == 1 | 2 << 5
+    assert gi_packed.pack("") == 0
+    assert gi_packed.pack("a" * gi_packed.MAX_LETTERS) is not None
+    for word in ("a" * (gi_packed.MAX_LETTERS + 1), "at&t", "Cat", "café"):
+        assert gi_packed.pack(word) is None
+    assert gi_packed.top_bits(2) == 0b10000 | 0b10000 << 5
+
+
+@pytest.mark.parametrize("compare", ["cat", "cart", "at&t", "Cat", "dog", "c"])
+def test_similarity_sort_odd_words(compare):
+    """Ensure words that do not pack are compared letter by letter."""
+    tester = gi_packed.PackedWords(WORDS)
+    assert len(tester) == 6 and sorted(tester) == sorted(set(WORDS))
+    expected = sorted_buckets(gi_wst.similarity_sort(WORDS, compare)[0])
+    assert sorted_buckets(tester.similarity_sort(compare)) == expected
+
+
+@pytest.mark.parametrize("setting", [DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_MASTER])
+def test_similarity_sort(setting, monkeypatch):
+    """Ensure packed buckets and threshold match letter by letter ones."""
+    words = gi_wst.trim(setting.MIN, setting.MAX, ewlaps)
+    tester = gi_packed.PackedWords(words)
+    for password in setting.pass_pool[:5]:
+        found = gi_wst.similarity_sort(tester, password)
+        expected = gi_wst.similarity_sort(words, password)
+        assert found[1] == expected[1]
+        assert sorted_buckets(found[0]) == sorted_buckets(expected[0])
+    monkeypatch.setattr(gi_packed, "_popcount", lambda x: bin(x).count("1"))
+    password = setting.pass_pool[0]
+    assert sorted_buckets(tester.similarity_sort(password)) == sorted_buckets(
+        enumerate_sort(words, password)
+    )
+    overlap = gi_wst.similarity_sort(tester, password, "overlap")
+    assert overlap == gi_wst.similarity_sort(list(tester), password, "overlap")
+
+
+@pytest.mark.parametrize("setting", [DEFAULT_EASY, DEFAULT_ADVANCED, DEFAULT_MASTER])
+def test_bucket_similarity(setting):
+    """Ensure Dictionary ranges are bucketed like letter by letter."""
+    words = Dictionary(ewlaps).range(setting.MIN, setting.MAX)
+    for password in list(setting.pass_pool[:5]) + ["a", "z" * 14]:
+        found = gi_wst.similarity_sort(words, password)
+        assert found[1] == gi_wst.similarity_sort(list(words), password)[1]
+        assert sorted_buckets(found[0]) == sorted_buckets(
+            enumerate_sort(words, password)
+        )
+    assert not gi_packed.bucket_similarity([], "cat")
+    assert gi_packed.bucket_similarity(["cat", "cot", "dog"], "cat") == {
+        2: ["cot"],
+        0: ["dog"],
+    }
+
+
+@pytest.mark.parametrize("compare", ["cafe", "café", "naïve", "ca"])
+def test_bucket_similarity_not_ascii(compare):
+    """Ensure words or compare strings that are not ASCII are compared by letter."""
+    words = ["café", "cafe", "cave", "naïf", "safe"]
+    assert sorted_buckets(gi_packed.bucket_similarity(words, compare)) == (
+        sorted_buckets(enumerate_sort(words, compare))
+    )
+    ascii_words = ["cafe", "cave", "safe"]
+    assert sorted_buckets(gi_packed.bucket_similarity(ascii_words, compare)) == (
+        sorted_buckets(enumerate_sort(ascii_words, compare))
+    )
+
+
+def test_same_as_loop():
+    """Ensure packed likeness and the letter by letter loop give the same buckets."""
+    words = gi_wst.trim(DEFAULT_ADVANCED.MIN, DEFAULT_ADVANCED.MAX, ewlaps)
+    tester = gi_packed.PackedWords(words)
+    for password in DEFAULT_ADVANCED.pass_pool[:3]:
+        assert sorted_buckets(tester.similarity_sort(password)) == sorted_buckets(
+            enumerate_sort(words, password)
+        )
+
+
+@pytest.mark.benchmark
+def test_faster_than_loop():
+    """Ensure packed likeness beats the letter by letter loop by far."""
+    words = gi_wst.trim(DEFAULT_ADVANCED.MIN, DEFAULT_ADVANCED.MAX, ewlaps)
+    tester = gi_packed.PackedWords(words)
+    passwords = DEFAULT_ADVANCED.pass_pool[:3]
+
+    def best(sort):
+        times = []
+        for _ in range(3):
+            start = perf_counter()
+            for password in passwords:
+                sort(password)
+            times.append(perf_counter() - start)
+        return min(times)
+
+    loop = best(lambda password: enumerate_sort(words, password))
+    packed = best(tester.similarity_sort)
+    assert packed * 2 < loop, (packed, loop)
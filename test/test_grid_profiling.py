@@ -0,0 +1,69 @@
+"""Tests grid profiling using pytest."""
+import pstats
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.profiling as gi_profiling
+from grid.backend import Backend
+from grid.settings import DEFAULT_EASY
+
+# Protected access used to test functions
+# pylint: disable=W0212
+
+
+def busy(count):
+    """Do some work to profile."""
+    return sum(range(count))
+
+
+def test_phase_inactive():
+    """Ensure phase does nothing when profiling is off."""
+    assert gi_profiling._ACTIVE is None
+    with gi_profiling.phase("anything"):
+        busy(10)
+    assert gi_profiling._ACTIVE is None
+
+
+def test_profile(tmp_path):
+    """Ensure a pstats file is written per phase."""
+    with gi_profiling.profile(str(tmp_path)) as profiler:
+        with gi_profiling.phase("outer"):
+            busy(100)
+            with gi_profiling.phase("inner"):
+                busy(100)
+        assert profiler.phases == ("outer", "inner")
+    assert gi_profiling._ACTIVE is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "inner.pstats",
+        "outer.pstats",
+    ]
+    # nested phase is only in inner
+    outer = pstats.Stats(str(tmp_path / "outer.pstats")).stats
+    inner = pstats.Stats(str(tmp_path / "inner.pstats")).stats
+    assert sum(1 for key in outer if key[2] == "busy") == 1
+    assert sum(1 for key in inner if key[2] == "busy") == 1
+    assert outer[[key for key in outer if key[2] == "busy"][0]][0] == 1
+
+
+def test_profile_already_active(tmp_path):
+    """Ensure profiling cannot be started twice."""
+    with gi_profiling.profile(str(tmp_path)):
+        with pytest.raises(RuntimeError):
+            with gi_profiling.profile(str(tmp_path)):
+                pass
+
+
+def test_profiled(tmp_path):
+    """Ensure decorated function is recorded under phase."""
+    decorated = gi_profiling.profiled("decorated")(busy)
+    assert decorated(10) == busy(10)  # inactive
+    with gi_profiling.profile(str(tmp_path)) as profiler:
+        assert decorated(10) == busy(10)
+        assert profiler.phases == ("decorated",)
+
+
+def test_profile_backend(tmp_path):
+    """Ensure board generation phases are recorded."""
+    with gi_profiling.profile(str(tmp_path)) as profiler:
+        Backend(DEFAULT_EASY, ewlaps, 4, True).full_row_str(0)
+        assert gi_profiling.COMPONENTS in profiler.phases
+        assert gi_profiling.POPULATE in profiler.phases
@@ -1,6 +1,23 @@
 """Test grid_internal settings using pytest."""
+
+import os
+import shutil
+import subprocess
+import sys
+import pytest  # type: ignore
 import grid.settings as gi_setting
 
+# Used by fixtures functions
+# pylint: disable=W0621
+
+
+@pytest.fixture()
+def data_dir(tmp_path):
+    """Copy of the settings data directory."""
+    copy = tmp_path / "data"
+    shutil.copytree(gi_setting.DATA_DIR, str(copy))
+    return copy
+
 
 def test_difficulty_const():
     """Assert that Difficulty Const are in range."""
@@ -108,3 +125,174 @@ def test_default_master():
     assert gi_setting.DEFAULT_MASTER.FILLER_SYMBOLS == gi_setting.FILLER_SYMBOLS
 
     assert gi_setting.DEFAULT_MASTER.pass_pool == gi_setting.master_pass_pool
+
+
+def test_get_setting():
+    """Test get_setting returns the defaults for each difficulty."""
+    assert gi_setting.get_setting(gi_setting.DifficultyType.EASY) is (
+        gi_setting.DEFAULT_EASY
+    )
+    assert gi_setting.get_setting(gi_setting.DifficultyType.ADVANCE) is (
+        gi_setting.DEFAULT_ADVANCED
+    )
+    assert gi_setting.get_setting(gi_setting.DifficultyType.EXPERT) is (
+        gi_setting.DEFAULT_EXPERT
+    )
+    assert gi_setting.get_setting(gi_setting.DifficultyType.MASTER) is (
+        gi_setting.DEFAULT_MASTER
+    )
+
+
+def test_constants_are_copies():
+    """Ensure changing module constants leaves the cached settings alone."""
+    easy = gi_setting.get_setting(gi_setting.DifficultyType.EASY)
+    assert gi_setting.FILLER_SYMBOLS is not easy.FILLER_SYMBOLS
+    assert gi_setting.easy_pass_pool is not easy.pass_pool
+    assert gi_setting.master_pass_pool is not gi_setting.DEFAULT_MASTER.pass_pool
+
+
+def test_get_setting_cached(data_dir):
+    """Ensure settings are read once per difficulty."""
+    first = gi_setting.get_setting(gi_setting.DifficultyType.EXPERT, str(data_dir))
+    second = gi_setting.get_setting(gi_setting.DifficultyType.EXPERT, str(data_dir))
+    assert first is second
+    assert first == gi_setting.DEFAULT_EXPERT
+
+
+def test_get_setting_only_reads_difficulty(data_dir):
+    """Ensure only the requested difficulty pool is read."""
+    (data_dir / "master.pool").unlink()
+    easy = gi_setting.get_setting(gi_setting.DifficultyType.EASY, str(data_dir))
+    assert easy.pass_pool == gi_setting.easy_pass_pool
+    with pytest.raises(FileNotFoundError):
+        gi_setting.get_setting(gi_setting.DifficultyType.MASTER, str(data_dir))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ is 3.7+")
+def test_constants_read_when_used(data_dir):
+    """Ensure import reads no difficulty and a constant only its own."""
+    (data_dir / "master.pool").unlink()
+    read = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import grid.settings as settings\n"
+            "print(settings._load_setting.cache_info().currsize)\n"
+            "print(settings.EASY_MAX, settings._load_setting.cache_info().currsize)",
+        ],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env=dict(os.environ, **{gi_setting.DATA_DIR_ENV: str(data_dir)}),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    assert read.stdout.split() == [b"0", str(gi_setting.EASY_MAX).encode(), b"1"]
+
+
+def test_get_setting_environment(data_dir, monkeypatch):
+    """Ensure operators can point to another data directory."""
+    pool = ["cat"] * gi_setting.PASS_POOL_SIZE
+    (data_dir / "easy.pool").write_text("\n".join(pool))
+    monkeypatch.setenv(gi_setting.DATA_DIR_ENV, str(data_dir))
+    assert gi_setting.get_setting(gi_setting.DifficultyType.EASY).pass_pool == pool
+
+
+@pytest.mark.parametrize(
+    "pool_change",
+    [
+        ["pre"],  # pool size
+        ["pre"] * 149 + ["toolong"],  # out of range
+        ["pre"] * 149 + ["Pre"],  # not lowercase
+    ],
+)
+def test_get_setting_invalid_pool(data_dir, pool_change):
+    """Ensure invalid pools are refused."""
+    (data_dir / "easy.pool").write_text("\n".join(pool_change))
+    with pytest.raises(ValueError):
+        gi_setting.get_setting(gi_setting.DifficultyType.EASY, str(data_dir))
+
+
+def test_validate_setting():
+    """Ensure invalid settings raise ValueError."""
+    gi_setting.validate_setting(gi_setting.DEFAULT_EASY)  # Valid
+    bad_settings = [
+        gi_setting.DEFAULT_EASY._replace(MIN=5, MAX=3),
+        gi_setting.DEFAULT_EASY._replace(MIN=0),
+        gi_setting.DEFAULT_MASTER._replace(ACTIVE_LINE_SIZE=10),
+        gi_setting.DEFAULT_EASY._replace(HEX_COL_MAX=0x1000000),
+        gi_setting.DEFAULT_EASY._replace(FILLER_SYMBOLS=["!", "("]),
+    ]
+    for setting in bad_settings:
+        with pytest.raises(ValueError):
+            gi_setting.validate_setting(setting)
+
+
+def test_marathon():
+    """Ensure marathon settings stack screens and keep hex size."""
+    easy = gi_setting.DEFAULT_EASY
+    tester = gi_setting.marathon(easy, 500)
+    assert tester.NUM_OF_ROWS == easy.NUM_OF_ROWS * 500
+    assert tester.SCREENS == 500
+    assert tester.HEX_COL_MAX < easy.HEX_COL_MAX
+    assert len(hex(tester.HEX_COL_MAX + 4 * tester.NUM_OF_ROWS - 1)) == 6
+    assert gi_setting.marathon(easy, 1) == easy
+    for screens in (0, 1000):
+        with pytest.raises(ValueError):
+            gi_setting.marathon(easy, screens)
+    with pytest.raises(ValueError):
+        gi_setting.marathon(tester, 2)  # already marathon
+    with pytest.raises(ValueError):
+        gi_setting.validate_setting(easy._replace(SCREENS=3))
+
+
+def test_wide():
+    """Ensure wide settings add columns and keep hex size."""
+    easy = gi_setting.DEFAULT_EASY
+    tester = gi_setting.wide(easy, 4)
+    assert tester.COLUMNS == 4
+    assert tester.NUM_OF_ROWS == easy.NUM_OF_ROWS
+    assert len(hex(tester.HEX_COL_MAX + 8 * tester.NUM_OF_ROWS - 1)) == 6
+    assert gi_setting.wide(easy, 2) == easy
+    assert gi_setting.marathon(tester, 10).COLUMNS == 4
+    for columns in (0, 3000):
+        with pytest.raises(ValueError):
+            gi_setting.wide(easy, columns)
+    with pytest.raises(ValueError):
+        gi_setting.validate_setting(easy._replace(COLUMNS=0))
+
+
+def test_filler_secrets():
+    """Ensure filler secrets only change FILLER_SECRETS."""
+    easy = gi_setting.DEFAULT_EASY
+    tester = gi_setting.filler_secrets(gi_setting.marathon(easy, 10))
+    assert tester.FILLER_SECRETS
+    assert not easy.FILLER_SECRETS
+    assert tester._replace(FILLER_SECRETS=False) == gi_setting.marathon(easy, 10)
+
+
+def test_likeness():
+    """Ensure likeness mode is validated."""
+    easy = gi_setting.DEFAULT_EASY
+    assert easy.LIKENESS == gi_setting.LIKENESS_MODES[0]
+    for mode in gi_setting.LIKENESS_MODES:
+        assert gi_setting.likeness(easy, mode).LIKENESS == mode
+    with pytest.raises(ValueError):
+        gi_setting.likeness(easy, "unknown")
+
+
+def test_target_guesses():
+    """Ensure target guesses is validated and single screen only."""
+    easy = gi_setting.DEFAULT_EASY
+    assert not easy.TARGET_GUESSES
+    assert gi_setting.target_guesses(easy, 2.5).TARGET_GUESSES == 2.5
+    with pytest.raises(ValueError):
+        gi_setting.target_guesses(easy, 0.5)
+    with pytest.raises(ValueError):
+        gi_setting.target_guesses(gi_setting.marathon(easy, 2), 2.5)
+
+
+def test_legacy_names():
+    """Ensure earlier module constants are still available."""
+    assert gi_setting.NUM_OF_ROWS == gi_setting.DEFAULT_EASY.NUM_OF_ROWS
+    assert gi_setting.MASTER_MAX == gi_setting.DEFAULT_MASTER.MAX
+    with pytest.raises(AttributeError):
+        gi_setting.NOT_A_SETTING  # pylint: disable=W0104
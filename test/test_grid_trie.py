@@ -0,0 +1,79 @@
+"""Tests grid trie using pytest."""
+
+import random
+import re
+import sys
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.trie as gi_trie
+import grid._word_tools as gi_wst
+
+# Using fixtures
+# pylint: disable=W0621
+
+WORDS = ["cat", "cats", "car", "cart", "bat", "bats", "dog", "", "cat"]
+
+
+@pytest.fixture(scope="module")
+def english():
+    """Trie of the english word list."""
+    return gi_trie.WordTrie(ewlaps)
+
+
+def test_trie():
+    """Ensure words are stored once, sorted, with suffixes shared."""
+    tester = gi_trie.WordTrie(WORDS)
+    assert len(tester) == 7
+    assert list(tester) == sorted(set(WORDS) - {""})
+    assert "cart" in tester and "ca" not in tester and "carts" not in tester
+    assert 3 not in tester
+    # c-a-t-s and b-a-t-s share "at", "ats"; car, cart share with cat(s) ends
+    assert tester.nodes < sum(map(len, set(WORDS))) + 1
+    assert gi_trie.WordTrie([]).nodes == 1
+    with pytest.raises(ValueError):
+        gi_trie.WordTrie(["a" * (gi_trie.MAX_LENGTH + 1)])
+
+
+def test_memory(english):
+    """Ensure trie holds every word in far less memory than the set."""
+    assert len(english) == len(ewlaps)
+    as_set = sys.getsizeof(ewlaps) + sum(map(sys.getsizeof, ewlaps))
+    assert english.nbytes * 4 < as_set
+
+
+def test_pattern(english):
+    """Ensure pattern queries match a scan."""
+    for pattern in ("..a..e.", "c.t", "....", "q...z"):
+        expected = sorted(
+            word
+            for word in ewlaps
+            if len(word) == len(pattern) and re.fullmatch(pattern, word)
+        )
+        assert list(english.pattern(pattern)) == expected
+    tester = gi_trie.WordTrie(WORDS)
+    assert list(tester.pattern_range(4, 4)) == ["bats", "cart", "cats"]
+    assert not list(tester.pattern_range(5, 2))
+
+
+@pytest.mark.parametrize("word", ["stone", "cat", "house", "bread"])
+def test_similar(english, word):
+    """Ensure likeness queries match positional likeness of a scan."""
+    likeness_of = gi_wst.likeness(word)
+    words = [other for other in ewlaps if 3 <= len(other) <= 5]  # as in the trie
+    for low, high in ((0, 0), (1, 2), (3, None), (len(word), len(word))):
+        top = len(word) if high is None else high
+        expected = sorted(
+            (other, likeness_of(other))
+            for other in words
+            if low <= likeness_of(other) <= top
+        )
+        assert list(english.similar(word, low, high, 3, 5)) == expected
+
+
+def test_set_passwords_trie():
+    """Ensure a trie finds the same passwords."""
+    words = list(gi_wst.trim(3, 5, ewlaps))
+    random.seed(3)
+    expected = gi_wst.set_passwords(words, 10)
+    random.seed(3)
+    assert gi_wst.set_passwords(words, 10, trie=gi_trie.WordTrie(words)) == expected
@@ -0,0 +1,131 @@
+"""Tests grid word_sources using pytest."""
+import bz2
+import gzip
+import io
+import lzma
+import pytest  # type: ignore
+from english_words import english_words_lower_alpha_set as ewlaps
+import grid.word_sources as gi_sources
+from grid.dictionary import Dictionary
+
+# Using fixtures
+# pylint: disable=W0621
+
+TEXT = "# themed list\nCat dog\n\nHORSE  bird\ncat\nox\n"
+WORDS = ["cat", "dog", "horse", "bird", "cat", "ox"]
+
+
+@pytest.fixture(params=["plain", "gzip", "bzip2", "xz"])
+def word_file(request, tmp_path):
+    """Same word list plain and compressed."""
+    compress = {
+        "plain": lambda data: data,
+        "gzip": gzip.compress,
+        "bzip2": bz2.compress,
+        "xz": lzma.compress,
+    }[request.param]
+    path = tmp_path / "words"
+    path.write_bytes(compress(TEXT.encode()))
+    return str(path)
+
+
+def test_read_words(word_file):
+    """Ensure words stream from plain and compressed files."""
+    words = gi_sources.read_words(word_file)
+    assert next(words) == "Cat"  # lazy, nothing read past the first line
+    assert [word.lower() for word in words] == WORDS[1:]
+
+
+def test_load(word_file):
+    """Ensure only the lengths asked for are kept."""
+    tester = gi_sources.load(word_file, 3, 4)
+    assert tester.lengths == (3, 4)
+    assert sorted(tester) == ["bird", "cat", "dog"]
+    assert sorted(gi_sources.load(word_file)) == sorted(set(WORDS))
+
+
+def test_load_letters(tmp_path):
+    """Ensure words with brackets, digits or hyphens are dropped."""
+    path = tmp_path / "words"
+    path.write_text("(x) d3f c-a-t\nDog\n")
+    assert list(gi_sources.load(str(path)).range(3, 5)) == ["dog"]
+
+
+def test_zstd(tmp_path):
+    """Ensure zstd files need a zstd module."""
+    path = tmp_path / "words.zst"
+    path.write_bytes(gi_sources.ZSTD_MAGIC + b"\x00" * 8)
+    try:
+        import zstandard  # type: ignore # pylint: disable=C0415,W0611
+    except ImportError:
+        with pytest.raises(ValueError):
+            gi_sources.load(str(path))
+    else:
+        pytest.skip("zstandard installed")
+
+
+def test_register(tmp_path, monkeypatch):
+    """Ensure new formats plug in by their first bytes."""
+    monkeypatch.setattr(gi_sources, "OPENERS", dict(gi_sources.OPENERS))
+    path = tmp_path / "words.rev"
+    path.write_bytes(b"REV" + TEXT.encode()[::-1])
+
+    def reverse(name):
+        with open(name, "rb") as data:
+            return io.BytesIO(data.read()[3:][::-1])
+
+    gi_sources.register(b"REV", reverse)
+    assert sorted(gi_sources.load(str(path))) == sorted(set(WORDS))
+    with pytest.raises(ValueError):
+        gi_sources.register(b"", reverse)
+
+
+def test_read_frequencies(tmp_path):
+    """Ensure counts are read lowercase, highest count kept."""
+    path = tmp_path / "counts.gz"
+    path.write_bytes(gzip.compress(b"# corpus\nThe 900\n\ncat 12.5\nthe 3\n"))
+    assert gi_sources.read_frequencies(str(path)) == {"the": 900, "cat": 12.5}
+    path.write_bytes(b"the 900\ncat\n")
+    with pytest.raises(ValueError, match=":2 "):
+        gi_sources.read_frequencies(str(path))
+
+
+def test_index(tmp_path):
+    """Ensure index holds the dictionary and only reads wanted lengths."""
+    dictionary = Dictionary(ewlaps)
+    path = tmp_path / "words.idx"
+    gi_sources.write_index(dictionary, str(path))
+    full = gi_sources.load(str(path))
+    assert full.lengths == dictionary.lengths
+    assert set(full) == set(dictionary)
+    easy = gi_sources.read_index(str(path), 3, 5)
+    assert easy.lengths == (3, 4, 5)
+    assert set(easy.range(3, 5)) == set(dictionary.range(3, 5))
+
+
+def test_built_in(tmp_path):
+    """Ensure the built in index is english_words as installed, not drifted."""
+    tester = gi_sources.load(gi_sources.BUILT_IN)
+    assert set(tester) == set(Dictionary(ewlaps))
+    assert tester.lengths == Dictionary(ewlaps).lengths
+    path = tmp_path / "words.index"
+    gi_sources.write_index(Dictionary(ewlaps), str(path))
+    with open(gi_sources.BUILT_IN, "rb") as built_in:
+        # rebuild with write_index(Dictionary(english_words_lower_alpha_set), BUILT_IN)
+        assert built_in.read() == path.read_bytes()
+
+
+def test_index_errors(tmp_path):
+    """Ensure broken indexes raise."""
+    path = tmp_path / "words.idx"
+    gi_sources.write_index(Dictionary(WORDS), str(path))
+    data = path.read_bytes()
+    path.write_bytes(data.replace(b"3 2 ", b"3 3 "))
+    with pytest.raises(ValueError):
+        gi_sources.read_index(str(path))
+    path.write_bytes(data[: len(gi_sources.INDEX_HEADER) + 4])
+    with pytest.raises(ValueError):
+        gi_sources.read_index(str(path))
+    path.write_bytes(b"cat\n")
+    with pytest.raises(ValueError):
+        gi_sources.read_index(str(path))